@@ -0,0 +1,121 @@
+from collections import defaultdict
+from typing import Dict, Iterable, Optional
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from dedoc.common.exceptions.service_busy_error import ServiceBusyError
+
+
+class AdmissionTicket:
+    """
+    Place of the admitted request in the limits of :class:`AdmissionController`, it should be released when the request (or the job) is finished.
+    """
+    def __init__(self, controller: "AdmissionController", client: str, size: int) -> None:
+        self.controller = controller
+        self.client = client
+        self.size = size
+        self.released = False
+
+    def release(self) -> None:
+        if not self.released:
+            self.released = True
+            self.controller.release(self)
+
+
+class AdmissionController:
+    """
+    Limits of the requests accepted by the API: the number of requests being handled (waiting for a worker or being parsed),
+    their total size in bytes and the number of requests of one client. Zero value of a limit means that it isn't checked.
+
+    The counters are changed only in the event loop of the API, so they don't need locks.
+    """
+    def __init__(self, max_requests: int = 0, max_bytes: int = 0, max_client_requests: int = 0) -> None:
+        self.max_requests = max_requests
+        self.max_bytes = max_bytes
+        self.max_client_requests = max_client_requests
+
+        self.requests = 0
+        self.bytes = 0
+        self.client_requests: Dict[str, int] = defaultdict(int)
+        self.rejected: Dict[str, int] = dict(requests=0, bytes=0, client_requests=0)
+
+    def admit(self, client: str, size: int) -> AdmissionTicket:
+        """
+        Take the place for the request of the client with the body of the given size, ServiceBusyError is raised if some limit is exceeded.
+        """
+        if 0 < self.max_requests <= self.requests:
+            self.__reject("requests", f"Too many requests are being handled ({self.requests}), try again later")
+        # a request bigger than the whole limit is admitted if there are no other requests, otherwise it would never be parsed
+        if 0 < self.max_bytes < self.bytes + size and self.requests > 0:
+            self.__reject("bytes", f"Too many bytes are being handled ({self.bytes}), try again later")
+        if 0 < self.max_client_requests <= self.client_requests[client]:
+            self.__reject("client_requests", f"Too many requests of the client {client} are being handled, try again later")
+
+        self.requests += 1
+        self.bytes += size
+        self.client_requests[client] += 1
+        return AdmissionTicket(controller=self, client=client, size=size)
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        self.requests -= 1
+        self.bytes -= ticket.size
+        self.client_requests[ticket.client] -= 1
+        if self.client_requests[ticket.client] <= 0:
+            del self.client_requests[ticket.client]
+
+    def get_info(self) -> dict:
+        return dict(requests=self.requests, bytes=self.bytes, clients=len(self.client_requests), rejected=dict(self.rejected))
+
+    def __reject(self, reason: str, message: str) -> None:
+        self.rejected[reason] += 1
+        raise ServiceBusyError(message)
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware, which checks the limits of :class:`AdmissionController` before the request body is read,
+    so the rejected uploads aren't saved to disk. The rejected requests get 503 status with the `Retry-After` header.
+
+    The ticket of the admitted request is available as `request.state.admission_ticket`, it's released after the response is sent.
+    An endpoint can take the ticket (and set `request.state.admission_ticket` to None) to release it later, e.g. when the job is finished.
+    """
+    def __init__(self, app: ASGIApp, controller: AdmissionController, paths: Iterable[str], retry_after: int) -> None:
+        self.app = app
+        self.controller = controller
+        self.paths = set(paths)
+        self.retry_after = retry_after
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope["client"][0] if scope.get("client") else ""
+        try:
+            ticket = self.controller.admit(client=client, size=self.__get_content_length(scope))
+        except ServiceBusyError as e:
+            response = get_service_busy_response(e, retry_after=self.retry_after)
+            await response(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+        state["admission_ticket"] = ticket
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if state.get("admission_ticket") is not None:
+                ticket.release()
+
+    def __get_content_length(self, scope: Scope) -> int:
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                return int(value) if value.isdigit() else 0
+        return 0
+
+
+def get_service_busy_response(error: ServiceBusyError, retry_after: Optional[int]) -> JSONResponse:
+    import dedoc.version
+
+    headers = None if retry_after is None else {"Retry-After": str(retry_after)}
+    return JSONResponse(status_code=error.code, content={"message": error.msg, "dedoc_version": dedoc.version.__version__}, headers=headers)
@@ -10,7 +10,7 @@ class QueryParameters:
     document_type: str = Form("", enum=["", "law", "tz", "diploma", "article", "fintoc"], description="Document domain")
     patterns: str = Form("", description='Patterns for default document type (when document_type="")')
     structure_type: str = Form("tree", enum=["linear", "tree"], description="Output structure type")
-    return_format: str = Form("json", enum=["json", "html", "plain_text", "tree", "collapsed_tree", "ujson", "pretty_json"],
+    return_format: str = Form("json", enum=["json", "html", "plain_text", "tree", "collapsed_tree", "ujson", "pretty_json", "ndjson"],
                               description="Response representation, most types (except json) are used for debug purposes only")
 
     # attachments handling
@@ -18,6 +18,8 @@ class QueryParameters:
     need_content_analysis: str = Form("false", enum=["true", "false"], description="Enable parsing contents of the attached files")
     recursion_deep_attachments: str = Form("10", description="Depth on which nested attachments will be parsed if need_content_analysis=true")
     return_base64: str = Form("false", enum=["true", "false"], description="Save attached images to the document metadata in base64 format")
+    return_attachments_refs: str = Form("false", enum=["true", "false"],
+                                        description="Save attached files to the store of the API and return their identifiers instead of base64")
 
     # tables handling
     need_pdf_table_analysis: str = Form("true", enum=["true", "false"], description="Enable table recognition for pdf")
@@ -161,10 +161,14 @@ def json2html(text: str,
         text += "<h3> Attachments: </h3>"
         for attachment_id, attachment in enumerate(attachments):
             attachment_text = json2html(text="", paragraph=attachment.content.structure, tables=attachment.content.tables, attachments=attachment.attachments)
-            attachment_base64 = f'data:{attachment.metadata.file_type};base64,{attachment.metadata.base64}"'
-            attachment_link = f'<a href="{attachment_base64}" download="{attachment.metadata.file_name}">{attachment.metadata.file_name}</a>'
+            attachment_id = getattr(attachment.metadata, "attachment_id", None)
+            if attachment_id is None:
+                attachment_src = f"data:{attachment.metadata.file_type};base64,{attachment.metadata.base64}"
+            else:
+                attachment_src = f"/attachments/{attachment_id}"
+            attachment_link = f'<a href="{attachment_src}" download="{attachment.metadata.file_name}">{attachment.metadata.file_name}</a>'
             is_image = attachment.metadata.file_type in image_mimes
-            attachment_image = f'<img src="{attachment_base64}">' if is_image else ""
+            attachment_image = f'<img src="{attachment_src}">' if is_image else ""
 
             text += f"""<div id="{attachment.metadata.uid}">
                 <h4>attachment {attachment_id} ({attachment_link}):</h4>
@@ -0,0 +1,102 @@
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import time
+
+from dedoc.common.exceptions.attachment_not_found_error import AttachmentNotFoundError
+
+
+class AttachmentStore:
+    """
+    Local content-addressed store of the attached files, which are returned by reference instead of base64 in the API responses.
+
+    The identifier of the attachment is the sha256 hash of its content with the file extension (e.g. `<hash>.png`),
+    so the same file extracted many times is saved only once. The file is saved as `<path>/<first two symbols of hash>/<attachment_id>`.
+    The attachments are removed after `ttl` seconds since their last saving.
+    """
+    # attachment_id is given by the user, so it shouldn't lead outside the store directory
+    attachment_id_regexp = re.compile(r"^[0-9a-f]{64}(\.[0-9A-Za-z]{1,16})?$")
+
+    def __init__(self, path: str, ttl: float) -> None:
+        """
+        :param path: directory for the attachments
+        :param ttl: time (in seconds) of keeping the attachments
+        """
+        self.path = path
+        self.ttl = ttl
+        # the expired attachments are searched at most once per tenth of ttl
+        self.__cleanup_interval = ttl / 10
+        self.__last_cleanup_time = 0.0
+        os.makedirs(self.path, exist_ok=True)
+
+    def put(self, file_path: str) -> str:
+        """
+        Save the file to the store (or prolong the storage time if it's already saved).
+
+        :return: identifier of the attachment
+        """
+        self.__remove_expired_periodically()
+        attachment_id = self.__get_hash(file_path) + os.path.splitext(file_path)[1].lower()
+        if not self.attachment_id_regexp.match(attachment_id):
+            # the extension is too long or has unexpected symbols
+            attachment_id = attachment_id[:64]
+
+        attachment_path = self.__get_attachment_path(attachment_id)
+        try:
+            os.utime(attachment_path)
+            return attachment_id
+        except FileNotFoundError:
+            pass
+
+        os.makedirs(os.path.dirname(attachment_path), exist_ok=True)
+        # several workers can save the same file simultaneously, so the file is copied atomically
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(attachment_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file, open(file_path, "rb") as in_file:
+                shutil.copyfileobj(in_file, tmp_file)
+            os.replace(tmp_path, attachment_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return attachment_id
+
+    def get_path(self, attachment_id: str) -> str:
+        attachment_path = self.__get_attachment_path(attachment_id)
+        if not os.path.isfile(attachment_path) or time.time() - os.path.getmtime(attachment_path) > self.ttl:
+            raise AttachmentNotFoundError(f"Attachment {attachment_id} not found")
+        return attachment_path
+
+    def remove_expired(self) -> None:
+        now = time.time()
+        for directory_name in os.listdir(self.path):
+            directory = os.path.join(self.path, directory_name)
+            if not os.path.isdir(directory):
+                continue
+            for file_name in os.listdir(directory):
+                file_path = os.path.join(directory, file_name)
+                try:
+                    if now - os.path.getmtime(file_path) > self.ttl:
+                        os.remove(file_path)
+                except FileNotFoundError:
+                    continue
+
+    def __remove_expired_periodically(self) -> None:
+        now = time.time()
+        if now - self.__last_cleanup_time > self.__cleanup_interval:
+            self.__last_cleanup_time = now
+            self.remove_expired()
+
+    def __get_attachment_path(self, attachment_id: str) -> str:
+        if not self.attachment_id_regexp.match(attachment_id):
+            raise AttachmentNotFoundError(f"Attachment {attachment_id} not found")
+        return os.path.join(self.path, attachment_id[:2], attachment_id)
+
+    def __get_hash(self, file_path: str) -> str:
+        file_hash = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
@@ -1,22 +1,37 @@
+import asyncio
 import dataclasses
 import importlib
 import json
 import os
+import pickle
+import shutil
 import tempfile
-from typing import Optional
+import time
+from typing import Dict, Iterator, List, Optional, Union
 
+import orjson
+from anyio import get_cancelled_exc_class
 from fastapi import Depends, FastAPI, File, Request, Response, UploadFile
 from fastapi.responses import ORJSONResponse, UJSONResponse
 from fastapi.staticfiles import StaticFiles
-from starlette.responses import FileResponse, HTMLResponse, JSONResponse, PlainTextResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import FileResponse, HTMLResponse, JSONResponse, PlainTextResponse, StreamingResponse
 
 import dedoc.version
+from dedoc.api.admission_control import AdmissionController, AdmissionMiddleware, AdmissionTicket, get_service_busy_response
 from dedoc.api.api_args import QueryParameters
 from dedoc.api.api_utils import json2collapsed_tree, json2html, json2tree, json2txt
+from dedoc.api.attachment_store import AttachmentStore
+from dedoc.api.cancellation import cancel_on_disconnect
+from dedoc.api.job_store import JobStatus, JobStore
+from dedoc.api.ndjson_utils import read_ndjson_chunks
 from dedoc.api.process_handler import ProcessHandler
 from dedoc.api.schema.parsed_document import ParsedDocument
 from dedoc.common.exceptions.dedoc_error import DedocError
+from dedoc.common.exceptions.job_not_found_error import JobNotFoundError
 from dedoc.common.exceptions.missing_file_error import MissingFileError
+from dedoc.common.exceptions.service_busy_error import ServiceBusyError
 from dedoc.config import get_config
 from dedoc.utils.utils import save_upload_file
 
@@ -30,6 +45,15 @@ app = FastAPI()
 app.mount("/web", StaticFiles(directory=config.get("static_path", static_path)), name="web")
 module_api_args = importlib.import_module(config["import_path_init_api_args"])
 process_handler = ProcessHandler(logger=logger)
+job_store = JobStore(path=config["api_jobs_path"], ttl=config["api_jobs_ttl"])
+attachment_store = AttachmentStore(path=config["api_attachments_path"], ttl=config["api_attachments_ttl"])
+running_jobs: Dict[str, asyncio.Task] = {}
+admission_controller = AdmissionController(
+    max_requests=config.get("api_max_queued_requests", 0),
+    max_bytes=config.get("api_max_queued_bytes", 0),
+    max_client_requests=config.get("api_max_client_requests", 0)
+)
+app.add_middleware(AdmissionMiddleware, controller=admission_controller, paths=("/upload", "/upload_batch", "/jobs"), retry_after=config.get("api_retry_after"))
 
 
 @app.get("/")
@@ -47,11 +71,39 @@ def get_static_file(request: Request) -> Response:
     return FileResponse(path)
 
 
+@app.get("/attachments/{attachment_id}")
+def get_attachment(attachment_id: str) -> Response:
+    """
+    Get the attached file saved to the store by the request with return_attachments_refs=true
+    """
+    return FileResponse(attachment_store.get_path(attachment_id))
+
+
 @app.get("/version")
 def get_version() -> Response:
     return PlainTextResponse(dedoc.version.__version__)
 
 
+@app.get("/queue")
+def get_queue_info() -> Response:
+    """
+    Current load of the API: admitted requests (their number, size and number of clients), state of the lanes of workers
+    and the number of rejected requests for every limit.
+    """
+    lanes = {name: dict(workers=len(lane.workers), queue_size=lane.queue_size, rejected=lane.rejected) for name, lane in process_handler.lanes.items()}
+    return JSONResponse(content={**admission_controller.get_info(), "lanes": lanes})
+
+
+@app.get("/metrics")
+async def get_metrics() -> Response:
+    """
+    Metrics of the parsing (durations of the pipeline stages, waiting for workers, pages, bytes, utilization of workers)
+    and of the load of the API in the Prometheus text format.
+    """
+    process_handler.metrics.update_queue_info(lanes=process_handler.lanes, admission_info=admission_controller.get_info())
+    return PlainTextResponse(process_handler.metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 def _get_static_file_path(request: Request) -> str:
     file = request.query_params.get("fname")
     directory_name = request.query_params.get("directory")
@@ -65,14 +117,279 @@ async def upload(request: Request, file: UploadFile = File(...), query_params: Q
     if not file or file.filename == "":
         raise MissingFileError("Error: Missing content in request_post file parameter", version=dedoc.version.__version__)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
+    tmpdir = tempfile.mkdtemp()
+    try:
         file_path = save_upload_file(file, tmpdir)
         document_tree = await process_handler.handle(request=request, parameters=parameters, file_path=file_path, tmpdir=tmpdir)
 
-    if document_tree is None:
+        if document_tree is None:
+            response = JSONResponse(status_code=499, content={})
+        else:
+            logger.info(f"Send result. File {file.filename} with parameters {parameters}")
+            response = _get_document_response(document_tree=document_tree, parameters=parameters)
+    except BaseException:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+        raise
+
+    # the directory is removed after sending the response, because the json and ndjson responses are sent from the files in it
+    response.background = BackgroundTask(shutil.rmtree, tmpdir, ignore_errors=True)
+    return response
+
+
+@app.post("/upload_batch")
+async def upload_batch(request: Request,
+                       files: List[UploadFile] = File(None),
+                       archive: Optional[UploadFile] = File(None),
+                       query_params: QueryParameters = Depends()) -> Response:
+    """
+    Parse many documents in one request: the uploaded files and the members of the uploaded archive (every member is an independent document).
+    All documents are parsed by the pool of workers with the same parameters.
+    The result is the list of json results (or errors) for every document in the order of the uploaded files and the archive members.
+    """
+    parameters = {**dataclasses.asdict(query_params), "return_format": "json"}
+    files = [file for file in files or [] if file.filename]
+    if not files and (archive is None or not archive.filename):
+        raise MissingFileError("Error: Missing content in request_post files and archive parameters", version=dedoc.version.__version__)
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        # every document has its own directory for the attachments
+        file_paths = [save_upload_file(file, _make_batch_item_dir(tmpdir, i)) for i, file in enumerate(files)]
+        if archive is not None and archive.filename:
+            file_paths.extend(await run_in_threadpool(_unpack_batch_archive, archive, tmpdir, len(file_paths)))
+        logger.info(f"Parse batch of {len(file_paths)} files with parameters {parameters}")
+        results = await _parse_batch(request=request, parameters=parameters, file_paths=file_paths)
+    except BaseException:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+        raise
+
+    if results is None:
+        shutil.rmtree(tmpdir, ignore_errors=True)
         return JSONResponse(status_code=499, content={})
+    # the directory is removed after sending the response, because the results serialized by the workers are read from it
+    return StreamingResponse(content=_iter_batch_response(results), media_type="application/json",
+                             background=BackgroundTask(shutil.rmtree, tmpdir, ignore_errors=True))
+
+
+@app.post("/jobs", status_code=202)
+async def submit_job(request: Request, file: UploadFile = File(...), query_params: QueryParameters = Depends()) -> Response:
+    """
+    Create an asynchronous parsing job for the file, the job is handled by the same workers as /upload requests.
+    The job doesn't depend on the client connection: use /jobs/{job_id} for getting its status and /jobs/{job_id}/result for getting the result.
+    """
+    parameters = dataclasses.asdict(query_params)
+    if not file or file.filename == "":
+        raise MissingFileError("Error: Missing content in request_post file parameter", version=dedoc.version.__version__)
+
+    job_info = job_store.create(upload_file=file, parameters=parameters)
+    # the job keeps its place in the admission limits until it's finished
+    admission_ticket = getattr(request.state, "admission_ticket", None)
+    request.state.admission_ticket = None
+    _start_job(job_info["job_id"], admission_ticket=admission_ticket)
+    return JSONResponse(status_code=202, content=_get_job_status(job_info))
+
+
+@app.get("/jobs/{job_id}")
+async def get_job_status(job_id: str) -> Response:
+    return JSONResponse(content=_get_job_status(job_store.get_info(job_id)))
+
+
+@app.get("/jobs/{job_id}/result")
+async def get_job_result(job_id: str) -> Response:
+    """
+    Get the result of the job in the requested return format, 202 status and the job status are returned if the job isn't finished yet.
+    """
+    job_info = job_store.get_info(job_id)
+    if job_info["status"] in JobStatus.unfinished:
+        return JSONResponse(status_code=202, content=_get_job_status(job_info))
 
+    document_tree = process_handler.load_result(job_store.load_result(job_id))
+    return _get_document_response(document_tree=document_tree, parameters=job_info["parameters"])
+
+
+@app.delete("/jobs/{job_id}")
+async def delete_job(job_id: str) -> Response:
+    """
+    Remove the job with its result, the parsing is stopped if the job is running.
+    """
+    job_info = job_store.get_info(job_id)
+    task = running_jobs.pop(job_id, None)
+    if task is not None:
+        task.cancel()
+        # the files of the job are removed after the worker stops parsing
+        await asyncio.gather(task, return_exceptions=True)
+    job_store.delete(job_id)
+    return JSONResponse(content={**_get_job_status(job_info), "deleted": True})
+
+
+@app.on_event("startup")
+async def restart_unfinished_jobs() -> None:
+    """
+    The jobs, which were queued or running during the previous API shutdown, are started again
+    """
+    for job_info in job_store.get_unfinished():
+        logger.info(f"Restart unfinished job {job_info['job_id']}")
+        job_store.update_info(job_info["job_id"], status=JobStatus.queued, started_time=None)
+        _start_job(job_info["job_id"])
+
+
+@app.on_event("startup")
+async def start_jobs_cleanup() -> None:
+    """
+    The finished jobs are removed after `api_jobs_ttl` seconds by the periodic background task
+    """
+    app.state.jobs_cleanup_task = asyncio.create_task(_remove_expired_jobs())
+
+
+async def _remove_expired_jobs() -> None:
+    while True:
+        # the directories of the jobs are scanned in a thread in order not to block the event loop
+        try:
+            await run_in_threadpool(job_store.remove_expired)
+        except OSError as e:
+            logger.warning(f"Can't remove expired jobs: {e}")
+        await asyncio.sleep(job_store.cleanup_interval)
+
+
+def _start_job(job_id: str, admission_ticket: Optional[AdmissionTicket] = None) -> None:
+    task = asyncio.create_task(_run_job(job_id))
+    running_jobs[job_id] = task
+    task.add_done_callback(lambda _: running_jobs.pop(job_id, None))
+    if admission_ticket is not None:
+        task.add_done_callback(lambda _: admission_ticket.release())
+
+
+async def _run_job(job_id: str) -> None:
+    job_info = job_store.get_info(job_id)
+    while True:
+        try:
+            result = await process_handler.get_result(
+                parameters=job_info["parameters"],
+                file_path=job_store.get_file_path(job_id),
+                tmpdir=job_store.get_files_dir(job_id),
+                on_start=lambda: job_store.update_info(job_id, status=JobStatus.running, started_time=time.time())
+            )
+            break
+        except ServiceBusyError:
+            # the queue of workers is full, the job stays queued and tries again later
+            await asyncio.sleep(config.get("api_retry_after") or 1)
+        except DedocError as e:
+            result = pickle.dumps(e.__dict__)
+            break
+
+    try:
+        process_handler.load_result(result)
+        status, error = JobStatus.done, None
+    except DedocError as e:
+        status, error = JobStatus.failed, e.msg_api
+
+    try:
+        job_store.save_result(job_id, result=result, status=status, error=error)
+        logger.info(f"Job {job_id} finished with status {status}")
+    except (JobNotFoundError, FileNotFoundError):
+        logger.warning(f"Job {job_id} was removed before its finish")
+
+
+def _make_batch_item_dir(tmpdir: str, item_number: int) -> str:
+    item_dir = os.path.join(tmpdir, str(item_number))
+    os.makedirs(item_dir)
+    return item_dir
+
+
+def _unpack_batch_archive(archive: UploadFile, tmpdir: str, first_item_number: int) -> List[str]:
+    """
+    Extract the archive members (with the limits of the archive reader) and move every member to its own directory.
+    """
+    from dedoc.readers.archive_reader.archive_reader import ArchiveReader
+    from dedoc.utils.utils import check_filename_length
+
+    archive_dir = os.path.join(tmpdir, "archive")
+    os.makedirs(archive_dir)
+    archive_path = save_upload_file(archive, archive_dir)
+    members = ArchiveReader(config=config).read(archive_path, parameters={"with_attachments": "true", "attachments_dir": archive_dir}).attachments
+
+    file_paths = []
+    for item_number, member in enumerate(members, start=first_item_number):
+        file_name = os.path.basename(member.get_original_filename()) or os.path.basename(member.get_filename_in_path())
+        file_path = os.path.join(_make_batch_item_dir(tmpdir, item_number), check_filename_length(file_name))
+        shutil.move(member.get_filename_in_path(), file_path)
+        file_paths.append(file_path)
+    return file_paths
+
+
+async def _parse_batch(request: Request, parameters: dict, file_paths: List[str]) -> Optional[List[dict]]:
+    """
+    Parse the files by the free workers, None is returned if the client disconnected
+    """
+    if not file_paths:
+        return []
+
+    # the batch doesn't take more places in the queues of workers than the number of workers
+    semaphore = asyncio.Semaphore(len(process_handler.workers))
+
+    async def parse_file(file_path: str) -> bytes:
+        async with semaphore:
+            return await process_handler.get_result(parameters=parameters, file_path=file_path, tmpdir=os.path.dirname(file_path))
+
+    tasks = [asyncio.create_task(parse_file(file_path)) for file_path in file_paths]
+    cancelled = False
+    async with cancel_on_disconnect(request, logger):
+        try:
+            # unlike gather, wait doesn't pass the (repeated) cancellation of the request to the tasks
+            await asyncio.wait(tasks)
+        except get_cancelled_exc_class():
+            cancelled = True
+
+    if cancelled:
+        # every task is cancelled once, so it waits for its worker to stop parsing, the files are removed after that
+        for task in tasks:
+            task.cancel()
+        await asyncio.wait(tasks)
+        return None
+
+    batch_results = []
+    for file_path, task in zip(file_paths, tasks):
+        file_name = os.path.basename(file_path)
+        try:
+            result_path = process_handler.load_result(task.result())
+            batch_results.append(dict(file_name=file_name, status_code=200, result=result_path))
+        except DedocError as e:
+            batch_results.append(dict(file_name=file_name, status_code=e.code, error=e.msg))
+    return batch_results
+
+
+def _iter_batch_response(batch_results: List[dict]) -> Iterator[bytes]:
+    """
+    Compose the json list of the batch results, the json results serialized by the workers are inserted into it as is
+    """
+    yield b"["
+    for i, batch_result in enumerate(batch_results):
+        item = {key: value for key, value in batch_result.items() if key != "result"}
+        # the serialized item without the closing brace, the result is added after its fields
+        yield (b"," if i > 0 else b"") + orjson.dumps(item)[:-1]
+        if "result" in batch_result:
+            with open(batch_result["result"], "rb") as result_file:
+                yield b',"result":' + result_file.read()
+        yield b"}"
+    yield b"]"
+
+
+def _get_job_status(job_info: dict) -> dict:
+    return {key: value for key, value in job_info.items() if key != "parameters"}
+
+
+def _get_document_response(document_tree: Union[ParsedDocument, str], parameters: dict) -> Response:
+    """
+    Get the response in the requested return format, for the json and ndjson formats `document_tree` is the path to the file with the response.
+    """
     return_format = str(parameters.get("return_format", "json")).lower()
+    # the responses of these formats are serialized by the worker and are sent as is
+    if return_format == "ndjson":
+        return StreamingResponse(content=read_ndjson_chunks(document_tree), media_type="application/x-ndjson")
+
+    if isinstance(document_tree, str):
+        return FileResponse(document_tree, media_type="application/json")
+
     if return_format == "html":
         html_content = json2html(
             text="",
@@ -101,7 +418,6 @@ async def upload(request: Request, file: UploadFile = File(...), query_params: Q
     if return_format == "pretty_json":
         return PlainTextResponse(content=json.dumps(document_tree.model_dump(), ensure_ascii=False, indent=2))
 
-    logger.info(f"Send result. File {file.filename} with parameters {parameters}")
     return ORJSONResponse(content=document_tree.model_dump())
 
 
@@ -111,6 +427,10 @@ async def upload_example(request: Request, file_name: str, return_format: Option
     parameters = {} if return_format is None else {"return_format": return_format}
     with tempfile.TemporaryDirectory() as tmpdir:
         document_tree = await process_handler.handle(request=request, parameters=parameters, file_path=file_path, tmpdir=tmpdir)
+        if isinstance(document_tree, str):
+            with open(document_tree, "rb") as result_file:
+                media_type = "application/x-ndjson" if return_format == "ndjson" else "application/json"
+                return Response(content=result_file.read(), media_type=media_type)
 
     if return_format == "html":
         html_page = json2html(
@@ -126,6 +446,9 @@ async def upload_example(request: Request, file_name: str, return_format: Option
 
 @app.exception_handler(DedocError)
 async def exception_handler(request: Request, exc: DedocError) -> Response:
+    if isinstance(exc, ServiceBusyError):
+        return get_service_busy_response(exc, retry_after=config.get("api_retry_after"))
+
     result = {"message": exc.msg}
     if exc.filename:
         result["file_name"] = exc.filename
@@ -0,0 +1,161 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from typing import List, Optional
+
+from fastapi import UploadFile
+
+from dedoc.common.exceptions.job_not_found_error import JobNotFoundError
+from dedoc.utils.utils import save_upload_file
+
+
+class JobStatus:
+    queued = "queued"
+    running = "running"
+    done = "done"
+    failed = "failed"
+
+    unfinished = (queued, running)
+
+
+class JobStore:
+    """
+    Local on-disk store of the asynchronous parsing jobs.
+
+    Every job has its own directory `<path>/<job_id>` with the following content:
+
+        - `job.json` - information about the job (status, file name, parameters, times, error message);
+        - `files` - directory with the uploaded file and the attachments extracted during parsing;
+        - `result.pickle` - pickled result of parsing (the document or the error), it is saved when the job is finished.
+
+    The jobs are removed after `ttl` seconds since their finish by :meth:`remove_expired`, which should be called periodically
+    (every `cleanup_interval` seconds) in the background.
+    """
+
+    def __init__(self, path: str, ttl: float) -> None:
+        """
+        :param path: directory for the jobs
+        :param ttl: time (in seconds) of keeping finished jobs
+        """
+        self.path = path
+        self.ttl = ttl
+        # the expired jobs are searched once per tenth of ttl
+        self.cleanup_interval = ttl / 10
+        self.__lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+
+    def create(self, upload_file: UploadFile, parameters: dict) -> dict:
+        """
+        Save the uploaded file and create a new queued job for it.
+
+        :return: information about the job
+        """
+        job_id = uuid.uuid4().hex
+        files_dir = self.get_files_dir(job_id)
+        os.makedirs(files_dir)
+        file_path = save_upload_file(upload_file, files_dir)
+
+        info = dict(
+            job_id=job_id,
+            status=JobStatus.queued,
+            file_name=os.path.basename(file_path),
+            parameters=parameters,
+            created_time=time.time(),
+            started_time=None,
+            finished_time=None,
+            error=None
+        )
+        self.__write_info(info)
+        return info
+
+    def get_info(self, job_id: str) -> dict:
+        info_path = os.path.join(self.__get_job_dir(job_id), "job.json")
+        try:
+            with open(info_path) as info_file:
+                return json.load(info_file)
+        except FileNotFoundError:
+            raise JobNotFoundError(f"Job {job_id} not found")
+
+    def update_info(self, job_id: str, **fields: Optional[object]) -> dict:
+        with self.__lock:
+            info = self.get_info(job_id)
+            info.update(fields)
+            self.__write_info(info)
+        return info
+
+    def get_files_dir(self, job_id: str) -> str:
+        return os.path.join(self.__get_job_dir(job_id), "files")
+
+    def get_file_path(self, job_id: str) -> str:
+        return os.path.join(self.get_files_dir(job_id), self.get_info(job_id)["file_name"])
+
+    def save_result(self, job_id: str, result: bytes, status: str, error: Optional[str] = None) -> dict:
+        """
+        Save the pickled result of parsing and mark the job as finished with the given status.
+        """
+        result_path = os.path.join(self.__get_job_dir(job_id), "result.pickle")
+        self.__write_atomically(result_path, result)
+        return self.update_info(job_id, status=status, finished_time=time.time(), error=error)
+
+    def load_result(self, job_id: str) -> bytes:
+        result_path = os.path.join(self.__get_job_dir(job_id), "result.pickle")
+        try:
+            with open(result_path, "rb") as result_file:
+                return result_file.read()
+        except FileNotFoundError:
+            raise JobNotFoundError(f"Result of job {job_id} not found")
+
+    def delete(self, job_id: str) -> None:
+        job_dir = self.__get_job_dir(job_id)
+        if not os.path.isdir(job_dir):
+            raise JobNotFoundError(f"Job {job_id} not found")
+        shutil.rmtree(job_dir, ignore_errors=True)
+
+    def get_unfinished(self) -> List[dict]:
+        """
+        Get the jobs that weren't finished (e.g. because of the API restart) in the order of their creation
+        """
+        jobs = []
+        for job_id in os.listdir(self.path):
+            try:
+                info = self.get_info(job_id)
+            except (JobNotFoundError, ValueError):
+                continue
+            if info["status"] in JobStatus.unfinished:
+                jobs.append(info)
+        return sorted(jobs, key=lambda job: job["created_time"])
+
+    def remove_expired(self) -> None:
+        now = time.time()
+        for job_id in os.listdir(self.path):
+            try:
+                info = self.get_info(job_id)
+            except (JobNotFoundError, ValueError):
+                continue
+            if info["finished_time"] is not None and now - info["finished_time"] > self.ttl:
+                shutil.rmtree(self.__get_job_dir(job_id), ignore_errors=True)
+
+    def __get_job_dir(self, job_id: str) -> str:
+        # job_id is given by the user, so it shouldn't lead outside the jobs directory
+        if not job_id.isalnum():
+            raise JobNotFoundError(f"Job {job_id} not found")
+        return os.path.join(self.path, job_id)
+
+    def __write_info(self, info: dict) -> None:
+        info_path = os.path.join(self.__get_job_dir(info["job_id"]), "job.json")
+        self.__write_atomically(info_path, json.dumps(info, ensure_ascii=False).encode("utf-8"))
+
+    def __write_atomically(self, path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -0,0 +1,198 @@
+import bisect
+import math
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from dedoc.api.parsing_worker import ParsingWorker
+from dedoc.api.worker_lane import WorkerLane
+
+# buckets (in seconds) of the durations from milliseconds (small text documents) to minutes (OCR of big scanned documents)
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+
+LabelValues = Tuple[str, ...]
+
+
+class Metric:
+    """
+    Base class of the metrics in the Prometheus text exposition format (https://prometheus.io/docs/instrumenting/exposition_formats/).
+    A metric has a fixed list of label names, and the values are kept for every combination of the label values.
+    """
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError()
+
+    def _get_label_values(self, labels: Dict[str, str]) -> LabelValues:
+        assert set(labels) == set(self.label_names), f"Metric {self.name} has labels {self.label_names}, got {tuple(labels)}"
+        return tuple(str(labels[label_name]) for label_name in self.label_names)
+
+    def _format_sample(self, name: str, label_values: LabelValues, value: float, extra_labels: Optional[Dict[str, str]] = None) -> str:
+        labels = list(zip(self.label_names, label_values)) + list((extra_labels or {}).items())
+        labels_str = ",".join(f'{label_name}="{self.__escape(label_value)}"' for label_name, label_value in labels)
+        labels_str = f"{{{labels_str}}}" if labels_str else ""
+        return f"{name}{labels_str} {self.__format_value(value)}"
+
+    def __escape(self, value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    def __format_value(self, value: float) -> str:
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter(Metric):
+    """
+    Monotonically increasing value, e.g. the number of parsed documents.
+    """
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        super().__init__(name=name, documentation=documentation, label_names=label_names)
+        self.values: Dict[LabelValues, float] = defaultdict(float)
+
+    def inc(self, value: float = 1, **labels: str) -> None:
+        assert value >= 0, "Counter can only be increased"
+        self.values[self._get_label_values(labels)] += value
+
+    def set_total(self, value: float, **labels: str) -> None:
+        """
+        Set the value of the counter, which is counted by another object (e.g. rejected requests of a lane).
+        """
+        self.values[self._get_label_values(labels)] = value
+
+    def _render_samples(self) -> List[str]:
+        return [self._format_sample(self.name, label_values, value) for label_values, value in self.values.items()]
+
+
+class Gauge(Metric):
+    """
+    Value, which can go up and down, e.g. the number of busy workers.
+    """
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> None:
+        super().__init__(name=name, documentation=documentation, label_names=label_names)
+        self.values: Dict[LabelValues, float] = defaultdict(float)
+
+    def set_value(self, value: float, **labels: str) -> None:
+        self.values[self._get_label_values(labels)] = value
+
+    def inc(self, value: float = 1, **labels: str) -> None:
+        self.values[self._get_label_values(labels)] += value
+
+    def _render_samples(self) -> List[str]:
+        return [self._format_sample(self.name, label_values, value) for label_values, value in self.values.items()]
+
+
+class Histogram(Metric):
+    """
+    Distribution of the observed values (e.g. durations) by the buckets, the cumulative count of every bucket,
+    the sum and the count of the observations are exposed.
+    """
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DURATION_BUCKETS) -> None:
+        super().__init__(name=name, documentation=documentation, label_names=label_names)
+        self.buckets = sorted(buckets)
+        self.bucket_counts: Dict[LabelValues, List[int]] = {}
+        self.sums: Dict[LabelValues, float] = defaultdict(float)
+
+    def observe(self, value: float, **labels: str) -> None:
+        label_values = self._get_label_values(labels)
+        # the last bucket is +Inf
+        bucket_counts = self.bucket_counts.setdefault(label_values, [0] * (len(self.buckets) + 1))
+        bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sums[label_values] += value
+
+    def _render_samples(self) -> List[str]:
+        lines = []
+        for label_values, bucket_counts in self.bucket_counts.items():
+            cumulative_count = 0
+            for upper_bound, count in zip(list(self.buckets) + [math.inf], bucket_counts):
+                cumulative_count += count
+                lines.append(self._format_sample(f"{self.name}_bucket", label_values, cumulative_count, extra_labels={"le": self.__format_bound(upper_bound)}))
+            lines.append(self._format_sample(f"{self.name}_sum", label_values, self.sums[label_values]))
+            lines.append(self._format_sample(f"{self.name}_count", label_values, cumulative_count))
+        return lines
+
+    def __format_bound(self, upper_bound: float) -> str:
+        return "+Inf" if math.isinf(upper_bound) else repr(float(upper_bound))
+
+
+class ApiMetrics:
+    """
+    Metrics of the documents parsing by the API workers:
+
+        * durations of the pipeline stages (converter, reader, metadata, structure, constructor, serialization) measured in the workers;
+        * waiting time for a free worker and the whole parsing time of every lane;
+        * number of the parsed documents by the lane and the status, number of parsed pages, input and output bytes;
+        * utilization of the workers: the number of workers, busy workers and the total busy time of every lane;
+        * memory and the number of recycles of every worker.
+
+    The metrics are changed only in the event loop of the API, so they don't need locks.
+    """
+    def __init__(self) -> None:
+        self.stage_duration = Histogram("dedoc_stage_duration_seconds", "Duration of the parsing pipeline stage", label_names=["stage"])
+        self.queue_wait = Histogram("dedoc_queue_wait_seconds", "Time of waiting for a free parsing worker", label_names=["lane"])
+        self.parsing_duration = Histogram("dedoc_parsing_duration_seconds", "Time of the document parsing by a worker", label_names=["lane"])
+        self.documents = Counter("dedoc_documents_total", "Number of the documents handled by the workers", label_names=["lane", "status"])
+        self.pages = Counter("dedoc_pages_total", "Number of the parsed pages")
+        self.input_bytes = Counter("dedoc_input_bytes_total", "Size of the files given to the workers")
+        self.output_bytes = Counter("dedoc_output_bytes_total", "Size of the serialized results of the workers")
+        self.workers = Gauge("dedoc_workers", "Number of the parsing workers", label_names=["lane"])
+        self.busy_workers = Gauge("dedoc_busy_workers", "Number of the workers, which are parsing documents now", label_names=["lane"])
+        self.busy_seconds = Counter("dedoc_worker_busy_seconds_total", "Total time the workers of the lane spent on parsing", label_names=["lane"])
+        self.worker_memory = Gauge("dedoc_worker_memory_bytes", "Resident memory of the worker process after the last task", label_names=["worker"])
+        self.worker_recycles = Counter("dedoc_worker_recycles_total", "Number of the worker processes replaced by recycling", label_names=["worker"])
+        self.queue_size = Gauge("dedoc_queue_size", "Number of the requests waiting for a free worker", label_names=["lane"])
+        self.lane_rejected = Counter("dedoc_lane_rejected_total", "Number of the requests rejected because the lane queue is full", label_names=["lane"])
+        self.admitted_requests = Gauge("dedoc_admitted_requests", "Number of the requests being handled by the API")
+        self.admitted_bytes = Gauge("dedoc_admitted_bytes", "Size of the requests being handled by the API")
+        self.admission_rejected = Counter("dedoc_admission_rejected_total", "Number of the requests rejected by the admission control", label_names=["reason"])
+
+    def observe_parsing(self, lane: str, parsing_duration: float, input_bytes: int, parsing_metrics: dict) -> None:
+        """
+        Save the measurements of one document handled by a worker of the lane.
+
+        :param parsing_metrics: dictionary of :class:`~dedoc.utils.parsing_metrics.ParsingMetrics` got from the worker \
+        (it's empty if the worker stopped unexpectedly)
+        """
+        self.documents.inc(lane=lane, status=parsing_metrics.get("status", "failed"))
+        self.parsing_duration.observe(parsing_duration, lane=lane)
+        self.busy_seconds.inc(parsing_duration, lane=lane)
+        self.input_bytes.inc(input_bytes)
+        self.output_bytes.inc(parsing_metrics.get("output_bytes", 0))
+        self.pages.inc(parsing_metrics.get("pages", 0))
+        for stage, duration in parsing_metrics.get("stage_durations", {}).items():
+            self.stage_duration.observe(duration, stage=stage)
+
+    def observe_worker(self, worker: ParsingWorker) -> None:
+        self.worker_memory.set_value(worker.memory, worker=worker.worker_id)
+        self.worker_recycles.set_total(worker.recycles_count, worker=worker.worker_id)
+
+    def update_queue_info(self, lanes: Dict[str, WorkerLane], admission_info: dict) -> None:
+        """
+        Copy the current state of the lanes and of the admission control (see :meth:`~dedoc.api.admission_control.AdmissionController.get_info`).
+        """
+        for name, lane in lanes.items():
+            self.queue_size.set_value(lane.queue_size, lane=name)
+            self.lane_rejected.set_total(lane.rejected, lane=name)
+        self.admitted_requests.set_value(admission_info["requests"])
+        self.admitted_bytes.set_value(admission_info["bytes"])
+        for reason, rejected in admission_info["rejected"].items():
+            self.admission_rejected.set_total(rejected, reason=reason)
+
+    def render(self) -> str:
+        metrics = [value for value in vars(self).values() if isinstance(value, Metric)]
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
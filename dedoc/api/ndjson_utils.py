@@ -0,0 +1,69 @@
+from typing import Iterator, Optional
+
+from dedoc.data_structures.parsed_document import ParsedDocument
+from dedoc.data_structures.tree_node import TreeNode
+
+
+def iter_ndjson_records(document: ParsedDocument, parent_uid: Optional[str] = None) -> Iterator[dict]:
+    """
+    Represent the document as a sequence of flat records for the ndjson return format.
+    Every record has the `type` ("document", "node", "table"), the `document` uid it belongs to and the `data` of the API schema.
+
+    The records are generated in the following order:
+
+        1. "document" record with metadata, warnings and version of the document (and `parent` uid for the attachments);
+        2. "node" records of the document tree in the depth-first order, nodes don't contain subparagraphs, \
+           the hierarchy is encoded in the node identifiers (e.g. "0.1" is a child of "0");
+        3. "table" records;
+        4. records of the attachments (starting from the "document" record) in the same order.
+
+    The API schema is built for one element at a time, so the whole document tree isn't kept in memory twice.
+    """
+    import dedoc.version
+
+    uid = document.metadata.uid
+    data = dict(metadata=document.metadata.to_api_schema().model_dump(), warnings=document.warnings, version=dedoc.version.__version__)
+    yield dict(type="document", document=uid, parent=parent_uid, data=data)
+
+    for node in __iter_nodes(document.content.structure):
+        node_data = dict(
+            node_id=node.node_id,
+            text=node.text,
+            annotations=[annotation.to_api_schema().model_dump() for annotation in node.annotations],
+            metadata=node.metadata.to_api_schema().model_dump()
+        )
+        yield dict(type="node", document=uid, data=node_data)
+
+    for table in document.content.tables:
+        yield dict(type="table", document=uid, data=table.to_api_schema().model_dump())
+
+    for attachment in document.attachments or []:
+        yield from iter_ndjson_records(attachment, parent_uid=uid)
+
+
+def write_ndjson(document: ParsedDocument, path: str) -> None:
+    """
+    Write the records of :func:`iter_ndjson_records` to the file, one json record per line.
+    The records are serialized with the same options as the json return format (e.g. numpy values are supported).
+    """
+    import orjson
+
+    with open(path, "wb") as out_file:
+        for record in iter_ndjson_records(document):
+            out_file.write(orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE))
+
+
+def read_ndjson_chunks(path: str, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+    """
+    Read the ndjson file by chunks for the streaming response.
+    """
+    with open(path, "rb") as in_file:
+        yield from iter(lambda: in_file.read(chunk_size), b"")
+
+
+def __iter_nodes(node: TreeNode) -> Iterator[TreeNode]:
+    stack = [node]
+    while stack:
+        current_node = stack.pop()
+        yield current_node
+        stack.extend(reversed(current_node.subparagraphs))
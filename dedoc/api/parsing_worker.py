@@ -0,0 +1,314 @@
+import base64
+import logging
+import os
+import pickle
+import queue
+import signal
+import tempfile
+import threading
+import traceback
+from multiprocessing import Event, Process, Queue
+from typing import Callable, Optional, Tuple
+
+import orjson
+
+from dedoc.api.attachment_store import AttachmentStore
+from dedoc.api.ndjson_utils import write_ndjson
+from dedoc.api.schema import ParsedDocument
+from dedoc.common.exceptions.dedoc_error import DedocError
+from dedoc.common.exceptions.parsing_cancelled_error import ParsingCancelledError
+from dedoc.config import get_config
+from dedoc.dedoc_manager import DedocManager
+from dedoc.utils.cancellation import set_cancellation_event
+from dedoc.utils.parameter_utils import get_param_return_attachments_refs
+from dedoc.utils.parsing_metrics import add_output_bytes, collect_parsing_metrics, measure_stage
+
+
+class ChildProcess:
+    """
+    Child process of the parsing worker with its queues and events.
+    """
+    def __init__(self, target: Callable) -> None:
+        self.input_queue = Queue()
+        self.output_queue = Queue()
+        self.cancel_event = Event()
+        # it's set by the child process when DedocManager is initialized and warmed up
+        self.ready_event = Event()
+        self.process = Process(target=target, args=[self.input_queue, self.output_queue, self.cancel_event, self.ready_event])
+        self.process.start()
+
+
+class ParsingWorker:
+    """
+    Warm child process for file parsing by DedocManager.
+
+    The child process is started once and is waiting for the tasks in its own input queue,
+    so DedocManager with all its models is initialized only at the start (or restart) of the worker.
+    The result of parsing is transferred to the master process through the worker's output queue.
+    The current task can be cancelled by :meth:`cancel`: the child process stops parsing at the nearest cancellation checkpoint
+    (see :mod:`dedoc.utils.cancellation`) and stays alive.
+
+    The child process is recycled after parsing `max_documents` documents or when its resident memory exceeds `max_memory` megabytes
+    (e.g. because of the caches of pdfminer or fragmentation of the torch allocator).
+    The replacement process is started in the background, the old process keeps parsing until the replacement is warmed up,
+    and then the replacement takes the next task, so recycling doesn't delay requests.
+    """
+    # how often (in seconds) the master process checks that the child process is still alive while waiting for the result
+    alive_check_interval = 1.0
+    # time (in seconds) of waiting for the recycled child process to exit before its termination
+    stop_timeout = 10.0
+
+    def __init__(self, worker_id: int, logger: logging.Logger, max_documents: int = 0, max_memory: int = 0) -> None:
+        """
+        :param worker_id: identifier of the worker for logging
+        :param logger: logger of the master process
+        :param max_documents: number of documents, after which the child process is recycled (0 - without recycling)
+        :param max_memory: resident memory in megabytes, after which the child process is recycled (0 - without recycling)
+        """
+        self.worker_id = worker_id
+        self.logger = logger
+        self.max_documents = max_documents
+        self.max_memory = max_memory
+        self.child: Optional[ChildProcess] = None
+        self.replacement: Optional[ChildProcess] = None
+        self.documents_count = 0
+        # resident memory of the child process (in bytes) after the last task
+        self.memory = 0
+        self.recycles_count = 0
+        self.start()
+
+    @property
+    def process(self) -> Optional[Process]:
+        return None if self.child is None else self.child.process
+
+    def start(self) -> None:
+        self.__set_child(self.__spawn())
+
+    def terminate(self) -> None:
+        """
+        Terminate the child process and its replacement (if it's started for recycling).
+        """
+        self.__terminate_child()
+        if self.replacement is not None:
+            self.replacement.process.terminate()
+            self.replacement.process.join()
+            self.replacement = None
+
+    def restart(self) -> None:
+        self.__terminate_child()
+        if not self.__has_replacement():
+            self.start()
+            return
+
+        # the replacement is already started for recycling, it's used even if it isn't warmed up yet
+        replacement, self.replacement = self.replacement, None
+        self.__set_child(replacement)
+
+    def cancel(self) -> None:
+        """
+        Ask the child process to stop parsing of the current task, the result of the cancelled task is put to the output queue as an error.
+        """
+        self.logger.info(f"Cancelling the task of the parsing worker {self.worker_id}")
+        self.child.cancel_event.set()
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def put_task(self, parameters: dict, file_path: str, tmpdir: str) -> None:
+        if self.replacement is not None and self.replacement.ready_event.is_set():
+            self.__retire()
+        if not self.is_alive():
+            self.logger.info(f"Parsing worker {self.worker_id} is not alive, restarting it")
+            self.restart()
+        self.child.cancel_event.clear()
+        self.child.input_queue.put(pickle.dumps((parameters, file_path, tmpdir)), block=True)
+
+    def get_result(self) -> Tuple[bytes, dict]:
+        """
+        Blocking wait for the pickled result of the current task and the metrics of its parsing
+        (see :class:`~dedoc.utils.parsing_metrics.ParsingMetrics`, the resident memory of the child process is added as `memory`).
+        If the child process dies before putting the result, the pickled error is returned.
+        The process and the queue are captured at the call time, so a restart of the worker releases the waiting thread.
+        """
+        process, output_queue = self.child.process, self.child.output_queue
+        while True:
+            try:
+                return output_queue.get(block=True, timeout=self.alive_check_interval)
+            except queue.Empty:
+                if not process.is_alive():
+                    error = {"msg": f"Parsing worker {self.worker_id} stopped unexpectedly (exit code {process.exitcode})", "code": 500}
+                    return pickle.dumps(error), {}
+
+    def check_recycling(self, memory: int) -> None:
+        """
+        Count the finished task and start the replacement of the child process if it has reached the limits.
+
+        :param memory: resident memory of the child process in bytes after the task
+        """
+        self.documents_count += 1
+        self.memory = memory
+        if self.__has_replacement():
+            return
+
+        if 0 < self.max_documents <= self.documents_count:
+            reason = f"{self.documents_count} documents are parsed"
+        elif 0 < self.max_memory * 1024 * 1024 < memory:
+            reason = f"memory usage is {memory // (1024 * 1024)} MB"
+        else:
+            return
+
+        self.logger.info(f"Parsing worker {self.worker_id} will be recycled ({reason}), starting the replacement process")
+        self.replacement = self.__spawn()
+
+    def __terminate_child(self) -> None:
+        if self.process is not None and self.process.is_alive():
+            self.logger.warning(f"Terminating the parsing worker {self.worker_id}")
+            self.process.terminate()
+            self.process.join()
+        self.child = None
+
+    def __has_replacement(self) -> bool:
+        if self.replacement is not None and not self.replacement.process.is_alive():
+            self.logger.warning(f"Replacement process of the parsing worker {self.worker_id} stopped unexpectedly")
+            self.replacement = None
+        return self.replacement is not None
+
+    def __spawn(self) -> ChildProcess:
+        child = ChildProcess(target=self.__parse_files)
+        self.logger.info(f"Parsing worker {self.worker_id} started (pid={child.process.pid})")
+        return child
+
+    def __set_child(self, child: ChildProcess) -> None:
+        self.child = child
+        self.documents_count = 0
+        self.memory = 0
+
+    def __retire(self) -> None:
+        """
+        Replace the child process with the warmed up replacement, the old process is stopped in the background.
+        """
+        old_child = self.child
+        self.__set_child(self.replacement)
+        self.replacement = None
+        self.recycles_count += 1
+        self.logger.info(f"Parsing worker {self.worker_id} is recycled (pid={old_child.process.pid} is replaced by pid={self.child.process.pid})")
+
+        old_child.input_queue.put(None)
+        threading.Thread(target=self.__stop_child, args=[old_child], daemon=True).start()
+
+    def __stop_child(self, child: ChildProcess) -> None:
+        child.process.join(timeout=self.stop_timeout)
+        if child.process.is_alive():
+            child.process.terminate()
+            child.process.join()
+
+    def __parse_files(self, input_queue: Queue, output_queue: Queue, cancel_event: Event, ready_event: Event) -> None:
+        """
+        Function for file parsing in a separate (child) process.
+        It's a background process, i.e. it is waiting for a task in the input queue (None task stops the process).
+        The result of parsing is returned in the output queue.
+
+        Operations with `signal` are used for saving master process while killing child process.
+        See the issue for more details: https://github.com/fastapi/fastapi/issues/1487
+        """
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        set_cancellation_event(cancel_event)
+
+        config = get_config()
+        manager = DedocManager(config=config)
+        attachment_store = AttachmentStore(path=config["api_attachments_path"], ttl=config["api_attachments_ttl"])
+        warm_up_extensions = [extension.strip() for extension in config.get("api_warm_up_extensions", "").split(",") if extension.strip()]
+        if warm_up_extensions:
+            manager.warm_up(extensions=None if "*" in warm_up_extensions else warm_up_extensions)
+        ready_event.set()
+        manager.logger.info(f"Parsing worker {self.worker_id} is waiting for the task in the input queue")
+
+        while True:
+            task = input_queue.get(block=True)
+            if task is None:
+                manager.logger.info(f"Parsing worker {self.worker_id} (pid={os.getpid()}) is stopped")
+                return
+
+            file_path = None
+            with collect_parsing_metrics() as metrics:
+                try:
+                    parameters, file_path, tmp_dir = pickle.loads(task)
+                    manager.logger.info(f"Parsing worker {self.worker_id} got task from the input queue")
+                    result = self.__parse_file(manager, attachment_store, parameters=parameters, file_path=file_path, tmp_dir=tmp_dir)
+                    manager.logger.info(f"Parsing worker {self.worker_id} put task to the output queue")
+                except ParsingCancelledError as e:
+                    manager.logger.info(f"Parsing worker {self.worker_id} stopped the cancelled task")
+                    metrics.status = "cancelled"
+                    result = pickle.dumps(e.__dict__)
+                except DedocError as e:
+                    tb = traceback.format_exc()
+                    manager.logger.error(f"Exception {e}: {e.msg_api}\n{tb}")
+                    metrics.status = "failed"
+                    result = pickle.dumps(e.__dict__)
+                except Exception as e:
+                    exc_message = f"Exception {e}\n{traceback.format_exc()}"
+                    filename = "" if file_path is None else os.path.basename(file_path)
+                    manager.logger.error(exc_message)
+                    metrics.status = "failed"
+                    result = pickle.dumps({"msg": exc_message, "filename": filename})
+            output_queue.put((result, {**metrics.to_dict(), "memory": self.__get_memory_usage()}), block=True)
+
+    def __parse_file(self, manager: DedocManager, attachment_store: AttachmentStore, parameters: dict, file_path: str, tmp_dir: str) -> bytes:
+        return_format = str(parameters.get("return_format", "json")).lower()
+        document_tree = manager.parse(file_path, parameters={**dict(parameters), "attachments_dir": tmp_dir})
+
+        with measure_stage("serialization"):
+            if get_param_return_attachments_refs(parameters):
+                self.__add_attachments_refs(document_tree, tmp_dir, attachment_store)
+            elif return_format == "html":
+                self.__add_base64_info_to_attachments(document_tree, tmp_dir)
+
+            if return_format in ("json", "ndjson"):
+                # the response is written to the file, which is sent by the master process as is,
+                # so the API schema tree isn't transferred through the queue, unpickled and serialized again in the master process
+                fd, result_path = tempfile.mkstemp(dir=tmp_dir, suffix=f".{return_format}")
+                os.close(fd)
+                if return_format == "ndjson":
+                    write_ndjson(document_tree, result_path)
+                else:
+                    self.__write_json(document_tree, result_path)
+                add_output_bytes(os.path.getsize(result_path))
+                return pickle.dumps(result_path)
+
+            result = pickle.dumps(document_tree.to_api_schema())
+            add_output_bytes(len(result))
+            return result
+
+    def __write_json(self, document_tree: ParsedDocument, path: str) -> None:
+        """
+        Write the json response with the same options as ORJSONResponse, which was used for the document in the master process before.
+        """
+        with open(path, "wb") as out_file:
+            out_file.write(orjson.dumps(document_tree.to_api_schema().model_dump(), option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY))
+
+    def __get_memory_usage(self) -> int:
+        """
+        Resident memory of the current process in bytes, 0 if it can't be measured (/proc is available only in Linux).
+        """
+        try:
+            with open("/proc/self/statm") as statm_file:
+                return int(statm_file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return 0
+
+    def __add_attachments_refs(self, document_tree: ParsedDocument, attachments_dir: str, attachment_store: AttachmentStore) -> None:
+        """
+        Save the attached files (including the nested ones) to the store, their identifiers are added to the metadata as `attachment_id`.
+        """
+        for attachment in document_tree.attachments:
+            attachment_path = os.path.join(attachments_dir, attachment.metadata.temporary_file_name)
+            if os.path.isfile(attachment_path):
+                attachment.metadata.add_attribute("attachment_id", attachment_store.put(attachment_path))
+            self.__add_attachments_refs(attachment, attachments_dir, attachment_store)
+
+    def __add_base64_info_to_attachments(self, document_tree: ParsedDocument, attachments_dir: str) -> None:
+        for attachment in document_tree.attachments:
+            with open(os.path.join(attachments_dir, attachment.metadata.temporary_file_name), "rb") as attachment_file:
+                attachment.metadata.add_attribute("base64", base64.b64encode(attachment_file.read()).decode("utf-8"))
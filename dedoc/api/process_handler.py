@@ -1,115 +1,172 @@
 import asyncio
-import base64
 import logging
 import os
 import pickle
-import signal
-import traceback
-from multiprocessing import Process, Queue
-from typing import Optional
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Union
 from urllib.request import Request
 
 from anyio import get_cancelled_exc_class
 
 from dedoc.api.cancellation import cancel_on_disconnect
+from dedoc.api.metrics import ApiMetrics
+from dedoc.api.parsing_worker import ParsingWorker
 from dedoc.api.schema import ParsedDocument
+from dedoc.api.worker_lane import WorkerLane, get_lane_name
 from dedoc.common.exceptions.dedoc_error import DedocError
 from dedoc.config import get_config
-from dedoc.dedoc_manager import DedocManager
 
 
 class ProcessHandler:
     """
     Class for file parsing by DedocManager with support for client disconnection.
-    If client disconnects during file parsing, the process of parsing is fully terminated and API is available to receive new connections.
+    If client disconnects during file parsing, the parsing is cancelled and API is available to receive new connections.
 
     Handler uses the following algorithm:
     1. Master process is used for checking current connection (client disconnect)
-    2. Child process is working on the background and waiting for the input file in the input_queue
-    3. Master process calls the child process for parsing and transfers data through the input_queue
+    2. A pool of child processes (workers) is working on the background, each worker is waiting for the input file in its own input_queue
+    3. Master process chooses the lane of workers by the expected cost of the document (see :func:`~dedoc.api.worker_lane.get_lane_name`),
+       takes a free worker of the lane (requests are served in the order of arrival) and transfers data through the worker's input_queue
     4. Child process is parsing file using DedocManager
-    5. The result of parsing is transferred to the master process through the output_queue
-    6. If client disconnects, the child process is terminated. The new child process with queues will start with the new request
+    5. The result of parsing is transferred to the master process through the worker's output_queue, the worker becomes free
+    6. If client disconnects, the corresponding child process is asked to stop parsing at the nearest cancellation checkpoint and stays warm,
+       it is terminated and restarted only if it doesn't stop in `api_cancel_timeout` seconds; other workers continue parsing
+
+    The number of workers of the slow lane is set by the `api_workers` value of the config, and the number of workers of the fast lane
+    is set by the `api_fast_workers` value (all documents are parsed by the slow lane if it's 0).
+    The child processes of workers are recycled according to the `api_worker_max_documents` and `api_worker_max_memory` values.
     """
-    def __init__(self, logger: logging.Logger) -> None:
-        self.input_queue = Queue()
-        self.output_queue = Queue()
+    def __init__(self, logger: logging.Logger, n_workers: Optional[int] = None, n_fast_workers: Optional[int] = None) -> None:
         self.logger = logger
-        self.process = Process(target=self.__parse_file, args=[self.input_queue, self.output_queue])
-        self.process.start()
-
-    async def handle(self, request: Request, parameters: dict, file_path: str, tmpdir: str) -> Optional[ParsedDocument]:
+        config = get_config()
+        n_workers = config.get("api_workers", 1) if n_workers is None else n_workers
+        n_fast_workers = config.get("api_fast_workers", 0) if n_fast_workers is None else n_fast_workers
+        self.cancel_timeout = config.get("api_cancel_timeout", 10)
+        self.fast_max_file_size = config.get("api_fast_max_file_size", 1024 * 1024)
+
+        worker_params = dict(logger=logger, max_documents=config.get("api_worker_max_documents", 0), max_memory=config.get("api_worker_max_memory", 0))
+        slow_workers = [ParsingWorker(worker_id=worker_id, **worker_params) for worker_id in range(max(1, n_workers))]
+        fast_worker_ids = range(len(slow_workers), len(slow_workers) + max(0, n_fast_workers))
+        fast_workers = [ParsingWorker(worker_id=worker_id, **worker_params) for worker_id in fast_worker_ids]
+        self.workers: List[ParsingWorker] = slow_workers + fast_workers
+        self.lanes: Dict[str, WorkerLane] = {
+            "slow": WorkerLane(name="slow", workers=slow_workers, max_queue_size=config.get("api_queue_size", 0))
+        }
+        if fast_workers:
+            self.lanes["fast"] = WorkerLane(name="fast", workers=fast_workers, max_queue_size=config.get("api_fast_queue_size", 0))
+        # threads for blocking waiting of the results from the output queues, one thread per worker
+        self.executor = ThreadPoolExecutor(max_workers=len(self.workers))
+
+        self.metrics = ApiMetrics()
+        for name, lane in self.lanes.items():
+            self.metrics.workers.set_value(len(lane.workers), lane=name)
+            self.metrics.busy_workers.set_value(0, lane=name)
+
+    async def handle(self, request: Request, parameters: dict, file_path: str, tmpdir: str) -> Optional[Union[ParsedDocument, str]]:
         """
         Handle request in a separate process.
-        Checks for client disconnection and terminate the child process if client disconnected.
+        Checks for client disconnection and cancels parsing if client disconnected.
         """
-        if self.process is None:
-            self.logger.info("Initialization of a new parsing process")
-            self.__init__(logger=self.logger)
-
-        self.logger.info("Putting file to the input queue")
-        self.input_queue.put(pickle.dumps((parameters, file_path, tmpdir)), block=True)
-
-        loop = asyncio.get_running_loop()
-        async with cancel_on_disconnect(request, self.logger):
-            try:
-                future = loop.run_in_executor(None, self.output_queue.get)
-                result = await future
-            except get_cancelled_exc_class():
-                self.logger.warning("Terminating the parsing process")
-                if self.process is not None:
-                    self.process.terminate()
-                self.process = None
-                future.cancel(DedocError)
-                return None
+        result = await self.get_result(parameters=parameters, file_path=file_path, tmpdir=tmpdir, request=request)
+        return None if result is None else self.load_result(result)
+
+    async def get_result(self,
+                         parameters: dict,
+                         file_path: str,
+                         tmpdir: str,
+                         request: Optional[Request] = None,
+                         on_start: Optional[Callable[[], None]] = None) -> Optional[bytes]:
+        """
+        Parse the file by a free worker and get the pickled result (the document in the API schema or the error dictionary).
+        If the request is given, the client disconnection is checked: the parsing is cancelled and None is returned if the client disconnected.
+        If the calling task is cancelled, the parsing is cancelled as well.
 
+        :param on_start: function, which is called when the free worker is found and the parsing is started
+        """
+        lane = self.__get_lane(file_path=file_path, parameters=parameters)
+        input_bytes = os.path.getsize(file_path)
+        wait_start = time.perf_counter()
+        worker = await lane.acquire()
+        self.metrics.queue_wait.observe(time.perf_counter() - wait_start, lane=lane.name)
+        self.metrics.busy_workers.inc(lane=lane.name)
+        parsing_start = time.perf_counter()
+        task_started = False
+        result_future = None
+        try:
+            self.logger.info(f"Putting file to the input queue of the worker {worker.worker_id} ({lane.name} lane)")
+            task_started = True
+            worker.put_task(parameters=parameters, file_path=file_path, tmpdir=tmpdir)
+
+            if on_start is not None:
+                on_start()
+
+            # the waiting thread isn't stopped by the cancellation, it receives the result of the cancelled task
+            result_future = self.executor.submit(worker.get_result)
+            if request is None:
+                try:
+                    result, _ = await asyncio.wrap_future(result_future)
+                except asyncio.CancelledError:
+                    await self.__cancel(worker, result_future)
+                    raise
+            else:
+                cancelled = False
+                async with cancel_on_disconnect(request, self.logger):
+                    try:
+                        result, _ = await asyncio.wrap_future(result_future)
+                    except get_cancelled_exc_class():
+                        cancelled = True
+                if cancelled:
+                    await self.__cancel(worker, result_future)
+                    return None
+        finally:
+            # the metrics of the task, which wasn't stopped after the cancellation, are lost with the restarted worker
+            finished = result_future is not None and result_future.done() and result_future.exception() is None
+            parsing_metrics = result_future.result()[1] if finished else dict(status="cancelled")
+
+            # the worker can't get a new task while it's busy with the previous one or its result isn't consumed,
+            # otherwise the result of the previous task is returned to the next request
+            result_consumed = result_future is not None and result_future.done()
+            if not worker.is_alive() or (task_started and not result_consumed):
+                worker.restart()
+            elif finished:
+                worker.check_recycling(memory=parsing_metrics.get("memory", 0))
+            lane.release(worker)
+
+            self.metrics.busy_workers.inc(-1, lane=lane.name)
+            if result_future is not None:
+                self.metrics.observe_parsing(lane=lane.name, parsing_duration=time.perf_counter() - parsing_start, input_bytes=input_bytes,
+                                             parsing_metrics=parsing_metrics)
+                self.metrics.observe_worker(worker)
+
+        self.logger.info(f"Got the result from the output queue of the worker {worker.worker_id}")
+        return result
+
+    @staticmethod
+    def load_result(result: bytes) -> Union[ParsedDocument, str]:
+        """
+        Unpickle the result of :meth:`get_result`, DedocError is raised if parsing failed.
+        For the json and ndjson return formats, the path to the file with the response serialized by the worker is returned instead of the document.
+        """
         result = pickle.loads(result)
-        if isinstance(result, ParsedDocument):
-            self.logger.info("Got the result from the output queue")
+        if isinstance(result, (ParsedDocument, str)):
             return result
 
         raise DedocError.from_dict(result)
 
-    def __parse_file(self, input_queue: Queue, output_queue: Queue) -> None:
+    async def __cancel(self, worker: ParsingWorker, result_future: Future) -> None:
         """
-        Function for file parsing in a separate (child) process.
-        It's a background process, i.e. it is waiting for a task in the input queue.
-        The result of parsing is returned in the output queue.
-
-        Operations with `signal` are used for saving master process while killing child process.
-        See the issue for more details: https://github.com/fastapi/fastapi/issues/1487
+        Cancel the task of the worker and wait until it stops at the cancellation checkpoint.
+        If it doesn't stop in `cancel_timeout` seconds, the worker process is restarted after that.
         """
-        signal.set_wakeup_fd(-1)
-        signal.signal(signal.SIGTERM, signal.SIG_DFL)
-        signal.signal(signal.SIGINT, signal.SIG_DFL)
-
-        manager = DedocManager(config=get_config())
-        manager.logger.info("Parsing process is waiting for the task in the input queue")
-
-        while True:
-            file_path = None
-            try:
-                parameters, file_path, tmp_dir = pickle.loads(input_queue.get(block=True))
-                manager.logger.info("Parsing process got task from the input queue")
-                return_format = str(parameters.get("return_format", "json")).lower()
-                document_tree = manager.parse(file_path, parameters={**dict(parameters), "attachments_dir": tmp_dir})
-
-                if return_format == "html":
-                    self.__add_base64_info_to_attachments(document_tree, tmp_dir)
-
-                output_queue.put(pickle.dumps(document_tree.to_api_schema()), block=True)
-                manager.logger.info("Parsing process put task to the output queue")
-            except DedocError as e:
-                tb = traceback.format_exc()
-                manager.logger.error(f"Exception {e}: {e.msg_api}\n{tb}")
-                output_queue.put(pickle.dumps(e.__dict__), block=True)
-            except Exception as e:
-                exc_message = f"Exception {e}\n{traceback.format_exc()}"
-                filename = "" if file_path is None else os.path.basename(file_path)
-                manager.logger.error(exc_message)
-                output_queue.put(pickle.dumps({"msg": exc_message, "filename": filename}), block=True)
-
-    def __add_base64_info_to_attachments(self, document_tree: ParsedDocument, attachments_dir: str) -> None:
-        for attachment in document_tree.attachments:
-            with open(os.path.join(attachments_dir, attachment.metadata.temporary_file_name), "rb") as attachment_file:
-                attachment.metadata.add_attribute("base64", base64.b64encode(attachment_file.read()).decode("utf-8"))
+        worker.cancel()
+        try:
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(result_future)), timeout=self.cancel_timeout)
+            self.logger.info(f"Parsing worker {worker.worker_id} stopped the cancelled task")
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Parsing worker {worker.worker_id} didn't stop the cancelled task in {self.cancel_timeout} seconds")
+
+    def __get_lane(self, file_path: str, parameters: dict) -> WorkerLane:
+        if len(self.lanes) == 1:
+            return self.lanes["slow"]
+        return self.lanes[get_lane_name(file_path=file_path, parameters=parameters, fast_max_file_size=self.fast_max_file_size)]
@@ -0,0 +1,82 @@
+import asyncio
+import os
+from typing import List, Optional
+
+from dedoc.api.parsing_worker import ParsingWorker
+from dedoc.common.exceptions.service_busy_error import ServiceBusyError
+
+
+class WorkerLane:
+    """
+    Group of parsing workers for the documents of the same expected cost (e.g. fast lane for small text documents and slow lane for OCR).
+    Every lane has its own workers (concurrency limit) and its own limit of the requests waiting for a free worker (queue depth),
+    so the cheap documents aren't waiting behind the expensive ones.
+    """
+    def __init__(self, name: str, workers: List[ParsingWorker], max_queue_size: int) -> None:
+        """
+        :param name: name of the lane for logging
+        :param workers: parsing workers of the lane
+        :param max_queue_size: maximum number of requests waiting for a free worker, 0 means unlimited queue
+        """
+        self.name = name
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.queue_size = 0
+        self.rejected = 0
+        # queue of free workers is created in the running event loop (at the first request)
+        self.free_workers: Optional[asyncio.Queue] = None
+
+    async def acquire(self) -> ParsingWorker:
+        """
+        Wait for a free worker of the lane (requests are served in the order of arrival).
+        ServiceBusyError is raised if the queue of the lane is full.
+        """
+        if self.free_workers is None:
+            self.free_workers = asyncio.Queue()
+            for worker in self.workers:
+                self.free_workers.put_nowait(worker)
+
+        if self.free_workers.empty() and 0 < self.max_queue_size <= self.queue_size:
+            self.rejected += 1
+            raise ServiceBusyError(f"Queue of the {self.name} lane is full ({self.queue_size} requests), try again later")
+
+        self.queue_size += 1
+        try:
+            return await self.free_workers.get()
+        finally:
+            self.queue_size -= 1
+
+    def release(self, worker: ParsingWorker) -> None:
+        self.free_workers.put_nowait(worker)
+
+
+def get_lane_name(file_path: str, parameters: dict, fast_max_file_size: int) -> str:
+    """
+    Classify the document by its expected parsing cost: "slow" lane is used for big files, documents that may need OCR
+    (images, PDF without forced text layer extraction), documents converted by external programs and archives with content analysis,
+    "fast" lane is used for the rest documents.
+    """
+    from dedoc.extensions import converted_extensions, converted_mimes, recognized_extensions, recognized_mimes
+    from dedoc.utils.parameter_utils import get_param_need_content_analysis, get_param_with_attachments
+    from dedoc.utils.utils import get_file_mime_by_content, get_mime_extension
+
+    if os.path.getsize(file_path) > fast_max_file_size:
+        return "slow"
+
+    mime, extension = get_mime_extension(file_path=file_path)
+    if mime == "application/octet-stream":
+        mime = get_file_mime_by_content(file_path)
+    extension = extension.lower()
+
+    if mime in recognized_mimes.pdf_like_format or extension in recognized_extensions.pdf_like_format:
+        return "fast" if str(parameters.get("pdf_with_text_layer", "")).lower() in ("true", "tabby") else "slow"
+
+    if mime in recognized_mimes.archive_like_format or extension in recognized_extensions.archive_like_format:
+        need_attachments_parsing = get_param_with_attachments(parameters) and get_param_need_content_analysis(parameters)
+        return "slow" if need_attachments_parsing else "fast"
+
+    # images need OCR, office documents and djvu are converted by external programs
+    slow_groups = ("image_like_format", "docx_like_format", "excel_like_format", "pptx_like_format", "pdf_like_format")
+    slow_mimes = set(recognized_mimes.image_like_format).union(*(getattr(converted_mimes, group) for group in slow_groups))
+    slow_extensions = set(recognized_extensions.image_like_format).union(*(getattr(converted_extensions, group) for group in slow_groups))
+    return "slow" if mime in slow_mimes or extension in slow_extensions else "fast"
@@ -1,9 +1,8 @@
 from typing import List, Optional, Tuple
 
-from PyPDF2.pdf import PageObject, PdfFileReader
-
 from dedoc.attachments_extractors.abstract_attachment_extractor import AbstractAttachmentsExtractor
 from dedoc.data_structures.attached_file import AttachedFile
+from dedoc.utils.pdf_utils import PdfContext
 
 
 class PDFAttachmentsExtractor(AbstractAttachmentsExtractor):
@@ -22,25 +21,26 @@ class PDFAttachmentsExtractor(AbstractAttachmentsExtractor):
         the methods' parameters.
         """
         import os
-        from PyPDF2.utils import PdfReadError
+        from pypdf.errors import PdfReadError
         from dedoc.utils.parameter_utils import get_param_attachments_dir, get_param_need_content_analysis
+        from dedoc.utils.pdf_utils import get_pdf_context
 
         parameters = {} if parameters is None else parameters
         filename = os.path.basename(file_path)
 
-        with open(file_path, "rb") as handler:
+        with get_pdf_context(file_path) as pdf_context:
             try:
-                reader = PdfFileReader(handler)
+                pdf_context.reader  # the file is parsed here
             except Exception as e:
                 self.logger.warning(f"can't handle {filename}, get {e}")
                 return []
             attachments = []
             try:
-                attachments.extend(self.__get_root_attachments(reader))
+                attachments.extend(self.__get_root_attachments(pdf_context))
             except PdfReadError:
                 self.logger.warning(f"{filename} is broken")
             try:
-                attachments.extend(self.__get_page_level_attachments(reader))
+                attachments.extend(self.__get_page_level_attachments(pdf_context))
             except PdfReadError:
                 self.logger.warning(f"{filename} is broken")
 
@@ -48,61 +48,36 @@ class PDFAttachmentsExtractor(AbstractAttachmentsExtractor):
         attachments_dir = get_param_attachments_dir(parameters, file_path)
         return self._content2attach_file(content=attachments, tmpdir=attachments_dir, need_content_analysis=need_content_analysis, parameters=parameters)
 
-    def __get_notes(self, page: PageObject) -> List[Tuple[str, bytes]]:
+    def __get_page_level_attachments(self, pdf_context: PdfContext) -> List[Tuple[str, bytes]]:
         from dedoc.utils.utils import convert_datetime
 
         attachments = []
-        if "/Annots" in page.keys():
-            for annot in page["/Annots"]:
-                # Other subtypes, such as /Link, cause errors
-                subtype = annot.getObject().get("/Subtype")
-                if subtype == "/FileAttachment":
-                    name = annot.getObject()["/FS"]["/UF"]
-                    data = annot.getObject()["/FS"]["/EF"]["/F"].getData()  # The file containing the stream data.
-                    attachments.append([name, data])
-                if subtype == "/Text" and annot.getObject().get("/Name") == "/Comment":  # it is messages (notes) in PDF
-                    note = annot.getObject()
-                    created_time = convert_datetime(note["/CreationDate"]) if "/CreationDate" in note else None
-                    modified_time = convert_datetime(note["/M"]) if "/M" in note else None
-                    user = note.get("/T")
-                    data = note.get("/Contents", "")
-
-                    name, content = self.__create_note(content=data, modified_time=modified_time, created_time=created_time, author=user)
-                    attachments.append((name, bytes(content)))
-        return attachments
-
-    def __get_page_level_attachments(self, reader: PdfFileReader) -> List[Tuple[str, bytes]]:
-        cnt_page = reader.getNumPages()
-        attachments = []
-        for i in range(cnt_page):
-            page = reader.getPage(i)
-            attachments_on_page = self.__get_notes(page)
-            attachments.extend(attachments_on_page)
-
+        for annotation in pdf_context.get_annotations():
+            # Other subtypes, such as /Link, cause errors
+            subtype = annotation.get("/Subtype")
+            if subtype == "/FileAttachment":
+                name = annotation["/FS"]["/UF"]
+                data = annotation["/FS"]["/EF"]["/F"].get_data()  # The file containing the stream data.
+                attachments.append([name, data])
+            if subtype == "/Text" and annotation.get("/Name") == "/Comment":  # it is messages (notes) in PDF
+                created_time = convert_datetime(annotation["/CreationDate"]) if "/CreationDate" in annotation else None
+                modified_time = convert_datetime(annotation["/M"]) if "/M" in annotation else None
+                user = annotation.get("/T")
+                data = annotation.get("/Contents", "")
+
+                name, content = self.__create_note(content=data, modified_time=modified_time, created_time=created_time, author=user)
+                attachments.append((name, bytes(content)))
         return attachments
 
-    def __get_root_attachments(self, reader: PdfFileReader) -> List[Tuple[str, bytes]]:
+    def __get_root_attachments(self, pdf_context: PdfContext) -> List[Tuple[str, bytes]]:
         """
-        Retrieves the file attachments of the PDF as a dictionary of file names and the file data as a bytestring.
+        Retrieves the file attachments of the PDF as a list of file names and the file data as a bytestring.
 
-        :return: dictionary of filenames and bytestrings
+        :return: list of filenames and bytestrings
         """
         import uuid
 
-        attachments = []
-        catalog = reader.trailer["/Root"]
-        if "/Names" in catalog.keys() and "/EmbeddedFiles" in catalog["/Names"].keys() and "/Names" in catalog["/Names"]["/EmbeddedFiles"].keys():
-            file_names = catalog["/Names"]["/EmbeddedFiles"]["/Names"]
-            for f in file_names:
-                if isinstance(f, str):
-                    data_index = file_names.index(f) + 1
-                    dict_object = file_names[data_index].getObject()
-                    if "/EF" in dict_object and "/F" in dict_object["/EF"]:
-                        data = dict_object["/EF"]["/F"].getData()
-                        name = dict_object.get("/UF", f"pdf_attach_{uuid.uuid4()}")
-                        attachments.append((name, data))
-
-        return attachments
+        return [(f"pdf_attach_{uuid.uuid4()}" if name is None else name, data) for name, data in pdf_context.get_embedded_files()]
 
     def __create_note(self, content: str, modified_time: int, created_time: int, author: str, size: int = None) -> [str, bytes]:
         import json
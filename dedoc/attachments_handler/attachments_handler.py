@@ -1,6 +1,7 @@
 from typing import List, Optional
 
 from dedoc.common.exceptions.dedoc_error import DedocError
+from dedoc.common.exceptions.parsing_cancelled_error import ParsingCancelledError
 from dedoc.data_structures.attached_file import AttachedFile
 from dedoc.data_structures.document_metadata import DocumentMetadata
 from dedoc.data_structures.parsed_document import ParsedDocument
@@ -17,6 +18,9 @@ class AttachmentsHandler:
         - the metadata of the attachments may be added without files parsing (if `with_attachments=true, need_content_analysis=false` in parameters)
         - they may be parsed (if `with_attachments=true, need_content_analysis=true` in parameters), \
             the parsing recursion may be set via `recursion_deep_attachments` parameter.
+
+    Attachments may be parsed in parallel threads (use `attachments_workers` key in the config to set the number of threads).
+    The threads are shared by all recursion levels: if all of them are busy, the attachment is parsed in the calling thread.
     """
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
@@ -24,10 +28,17 @@ class AttachmentsHandler:
         :param config: configuration of the handler, e.g. logger for logging
         """
         import logging
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
 
         self.config = {} if config is None else config
         self.logger = self.config.get("logger", logging.getLogger())
 
+        # the calling thread also parses attachments, so it is subtracted from the number of additional threads
+        n_threads = max(int(self.config.get("attachments_workers", 1)) - 1, 0)
+        self.__executor = ThreadPoolExecutor(max_workers=n_threads, thread_name_prefix="attachments") if n_threads > 0 else None
+        self.__free_threads = threading.BoundedSemaphore(n_threads) if n_threads > 0 else None
+
     def handle_attachments(self, document_parser: DedocManager, document: UnstructuredDocument, parameters: dict) -> List[ParsedDocument]:
         """
         Handle attachments of the document in the intermediate representation.
@@ -38,20 +49,23 @@ class AttachmentsHandler:
             are important, look to the API parameters documentation for more details).
         :return: list of parsed document attachments
         """
+        import contextvars
         import copy
-        import os
         import time
+        from concurrent.futures import Future, wait
+        from dedoc.utils.cancellation import check_cancellation
         from dedoc.utils.parameter_utils import get_param_with_attachments
 
-        attachments = []
         recursion_deep_attachments = int(parameters.get("recursion_deep_attachments", 10)) - 1
 
         if not get_param_with_attachments(parameters) or recursion_deep_attachments < 0:
-            return attachments
+            return []
 
         previous_log_time = time.time()
+        futures = []
 
         for i, attachment in enumerate(document.attachments):
+            check_cancellation()
             current_time = time.time()
             if current_time - previous_log_time > 3:
                 previous_log_time = current_time  # not log too often
@@ -64,21 +78,48 @@ class AttachmentsHandler:
             parameters_copy["is_attached"] = True
             parameters_copy["recursion_deep_attachments"] = str(recursion_deep_attachments)
 
+            if self.__free_threads is not None and self.__free_threads.acquire(blocking=False):
+                # the attachment is parsed in the copy of the current context, e.g. its parsing metrics are added to the metrics of the document
+                context = contextvars.copy_context()
+                futures.append(self.__executor.submit(context.run, self.__handle_attachment_in_thread, document_parser, attachment, parameters_copy))
+                continue
+
+            future = Future()
             try:
-                if attachment.need_content_analysis:
-                    parsed_file = document_parser.parse(attachment.get_filename_in_path(), parameters=parameters_copy)
-                else:
-                    parsed_file = self.__get_empty_document(document_parser=document_parser, attachment=attachment, parameters=parameters_copy)
-
-                parsed_file.metadata.file_name = attachment.original_name  # initial name of the attachment
-                parsed_file.metadata.temporary_file_name = os.path.split(attachment.get_filename_in_path())[-1]  # actual name in the file system
-            except DedocError:
-                # return empty ParsedDocument with Meta information
-                parsed_file = self.__get_empty_document(document_parser=document_parser, attachment=attachment, parameters=parameters_copy)
-
-            parsed_file.metadata.uid = attachment.uid
-            attachments.append(parsed_file)
-        return attachments
+                future.set_result(self.__handle_attachment(document_parser=document_parser, attachment=attachment, parameters=parameters_copy))
+            except Exception as e:
+                future.set_exception(e)
+            futures.append(future)
+
+        # all attachments are handled even if some of them failed, the results are in the order of the document attachments
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def __handle_attachment_in_thread(self, document_parser: DedocManager, attachment: AttachedFile, parameters: dict) -> ParsedDocument:
+        try:
+            return self.__handle_attachment(document_parser=document_parser, attachment=attachment, parameters=parameters)
+        finally:
+            self.__free_threads.release()
+
+    def __handle_attachment(self, document_parser: DedocManager, attachment: AttachedFile, parameters: dict) -> ParsedDocument:
+        import os
+
+        try:
+            if attachment.need_content_analysis:
+                parsed_file = document_parser.parse(attachment.get_filename_in_path(), parameters=parameters)
+            else:
+                parsed_file = self.__get_empty_document(document_parser=document_parser, attachment=attachment, parameters=parameters)
+
+            parsed_file.metadata.file_name = attachment.original_name  # initial name of the attachment
+            parsed_file.metadata.temporary_file_name = os.path.split(attachment.get_filename_in_path())[-1]  # actual name in the file system
+        except ParsingCancelledError:
+            raise
+        except DedocError:
+            # return empty ParsedDocument with Meta information
+            parsed_file = self.__get_empty_document(document_parser=document_parser, attachment=attachment, parameters=parameters)
+
+        parsed_file.metadata.uid = attachment.uid
+        return parsed_file
 
     def __get_empty_document(self, document_parser: DedocManager, attachment: AttachedFile, parameters: dict) -> ParsedDocument:
         from dedoc.utils.utils import get_empty_content
@@ -0,0 +1,16 @@
+from typing import Optional
+
+from dedoc.common.exceptions.dedoc_error import DedocError
+
+
+class ArchiveLimitError(DedocError):
+    """
+    Raise if the archive exceeds the limits of the extraction (the number of members or their total uncompressed size),
+    the archive isn't read with other readers in this case
+    """
+
+    def __init__(self, msg: str, msg_api: Optional[str] = None, filename: Optional[str] = None, version: Optional[str] = None) -> None:
+        super(ArchiveLimitError, self).__init__(msg_api=msg_api, msg=msg, filename=filename, version=version, code=413)
+
+    def __str__(self) -> str:
+        return f"ArchiveLimitError({self.msg})"
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from dedoc.common.exceptions.dedoc_error import DedocError
+
+
+class AttachmentNotFoundError(DedocError):
+    """
+    Raise if the attachment with the given identifier doesn't exist in the attachments store (or it was already removed)
+    """
+
+    def __init__(self, msg: str, msg_api: Optional[str] = None, filename: Optional[str] = None, version: Optional[str] = None) -> None:
+        super(AttachmentNotFoundError, self).__init__(msg_api=msg_api, msg=msg, filename=filename, version=version, code=404)
+
+    def __str__(self) -> str:
+        return f"AttachmentNotFoundError({self.msg})"
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from dedoc.common.exceptions.dedoc_error import DedocError
+
+
+class JobNotFoundError(DedocError):
+    """
+    Raise if the asynchronous parsing job with the given identifier doesn't exist (or it was already removed)
+    """
+
+    def __init__(self, msg: str, msg_api: Optional[str] = None, filename: Optional[str] = None, version: Optional[str] = None) -> None:
+        super(JobNotFoundError, self).__init__(msg_api=msg_api, msg=msg, filename=filename, version=version, code=404)
+
+    def __str__(self) -> str:
+        return f"JobNotFoundError({self.msg})"
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from dedoc.common.exceptions.dedoc_error import DedocError
+
+
+class ParsingCancelledError(DedocError):
+    """
+    Raise if parsing of the document was cancelled (e.g. the client disconnected), see :mod:`dedoc.utils.cancellation`
+    """
+
+    def __init__(self, msg: str, msg_api: Optional[str] = None, filename: Optional[str] = None, version: Optional[str] = None) -> None:
+        super(ParsingCancelledError, self).__init__(msg_api=msg_api, msg=msg, filename=filename, version=version, code=499)
+
+    def __str__(self) -> str:
+        return f"ParsingCancelledError({self.msg})"
@@ -0,0 +1,15 @@
+from typing import Optional
+
+from dedoc.common.exceptions.dedoc_error import DedocError
+
+
+class ServiceBusyError(DedocError):
+    """
+    Raise if the API can't accept the request now because of the limits of the parsing queue, the request can be retried later
+    """
+
+    def __init__(self, msg: str, msg_api: Optional[str] = None, filename: Optional[str] = None, version: Optional[str] = None) -> None:
+        super(ServiceBusyError, self).__init__(msg_api=msg_api, msg=msg, filename=filename, version=version, code=503)
+
+    def __str__(self) -> str:
+        return f"ServiceBusyError({self.msg})"
@@ -38,6 +38,10 @@ class Configuration(object):
                 # --------------------------------------------JOBLIB SETTINGS-------------------------------------------------------
                 # number of parallel jobs in some tasks as OCR
                 n_jobs=1,
+                # number of pages classified by the columns and orientation classifier in one forward pass (PdfImageReader)
+                orientation_batch_size=4,
+                # max number of PDF pages rasterized in a background thread and not processed yet by the page workers (PdfImageReader, PdfTxtlayerReader)
+                pdf_max_pages_in_flight=int(os.environ.get("DEDOC_PDF_MAX_PAGES_IN_FLIGHT", "8")),
 
                 # --------------------------------------------GPU SETTINGS----------------------------------------------------------
                 # set gpu in XGBoost and torch models
@@ -48,6 +52,39 @@ class Configuration(object):
                 max_content_length=512 * 1024 * 1024,
                 # application port
                 api_port=int(os.environ.get("DOCREADER_PORT", "1231")),
+                # number of worker processes for parallel parsing of the uploaded files (slow lane, it is used for all files if there is no fast lane)
+                api_workers=int(os.environ.get("DEDOC_API_WORKERS", "1")),
+                # number of worker processes of the fast lane for cheap documents (small text and office files), 0 - without the fast lane
+                api_fast_workers=int(os.environ.get("DEDOC_API_FAST_WORKERS", "0")),
+                # maximum size (in bytes) of the files parsed by the fast lane
+                api_fast_max_file_size=int(os.environ.get("DEDOC_API_FAST_MAX_FILE_SIZE", str(1024 * 1024))),
+                # maximum number of requests waiting for a free worker in the slow and the fast lanes (0 - unlimited)
+                api_queue_size=int(os.environ.get("DEDOC_API_QUEUE_SIZE", "0")),
+                api_fast_queue_size=int(os.environ.get("DEDOC_API_FAST_QUEUE_SIZE", "0")),
+                # admission control of /upload, /upload_batch and /jobs requests (0 - unlimited): maximum number of the requests being handled,
+                # their total size in bytes and maximum number of the requests of one client, other requests are rejected with 503 status
+                api_max_queued_requests=int(os.environ.get("DEDOC_API_MAX_QUEUED_REQUESTS", "0")),
+                api_max_queued_bytes=int(os.environ.get("DEDOC_API_MAX_QUEUED_BYTES", "0")),
+                api_max_client_requests=int(os.environ.get("DEDOC_API_MAX_CLIENT_REQUESTS", "0")),
+                # value (in seconds) of the Retry-After header of the rejected requests
+                api_retry_after=int(os.environ.get("DEDOC_API_RETRY_AFTER", "10")),
+                # comma separated extensions of files (e.g. ".docx,.pdf") whose handlers are constructed at the worker start ("*" - all handlers),
+                # other handlers are constructed at the first use
+                api_warm_up_extensions=os.environ.get("DEDOC_API_WARM_UP_EXTENSIONS", ""),
+                # directory for the files and results of the asynchronous parsing jobs (/jobs API)
+                api_jobs_path=os.environ.get("DEDOC_API_JOBS_PATH", os.path.join(resources_path, "api_jobs")),
+                # time (in seconds) of keeping the results of the finished jobs
+                api_jobs_ttl=int(os.environ.get("DEDOC_API_JOBS_TTL", str(24 * 60 * 60))),
+                # directory for the attached files returned by reference (return_attachments_refs=true) and time (in seconds) of keeping them
+                api_attachments_path=os.environ.get("DEDOC_API_ATTACHMENTS_PATH", os.path.join(resources_path, "api_attachments")),
+                api_attachments_ttl=int(os.environ.get("DEDOC_API_ATTACHMENTS_TTL", str(24 * 60 * 60))),
+                # time (in seconds) of waiting for the worker to stop parsing at the cancellation checkpoint after the client disconnection,
+                # the worker process is restarted if it doesn't stop in time
+                api_cancel_timeout=float(os.environ.get("DEDOC_API_CANCEL_TIMEOUT", "10")),
+                # the worker process is recycled after parsing this number of documents or when its resident memory exceeds this size in megabytes
+                # (0 - without the limit), the replacement process is started and warmed up before the old one is stopped
+                api_worker_max_documents=int(os.environ.get("DEDOC_API_WORKER_MAX_DOCUMENTS", "0")),
+                api_worker_max_memory=int(os.environ.get("DEDOC_API_WORKER_MAX_MEMORY", "0")),
                 static_files_dirs={},
                 # log settings
                 logger=logging.getLogger(),
@@ -60,8 +97,37 @@ class Configuration(object):
                 # -------------------------------------------RECOGNIZE SETTINGS-----------------------------------------------------
                 # TESSERACT OCR confidence threshold ( values: [-1 - undefined;  0.0 : 100.0 % - confidence value)
                 ocr_conf_threshold=40.0,
+                # number of long-lived tesseract workers for each language and page segmentation mode (0 - run tesseract process for every image)
+                # the workers are used only if tesserocr is installed
+                tesseract_pool_size=int(os.environ.get("DEDOC_TESSERACT_POOL_SIZE", "1")),
                 # max depth of document structure tree
                 recursion_deep_subparagraphs=30,
+                # number of threads for attachments parsing shared by all recursion levels (1 - parse attachments one by one)
+                attachments_workers=int(os.environ.get("DEDOC_ATTACHMENTS_WORKERS", "1")),
+
+                # -------------------------------------------ARCHIVE SETTINGS-------------------------------------------------------
+                # size of the chunks (in bytes) for writing archive files to disk
+                archive_chunk_size=1024 * 1024,
+                # max number of files extracted from one archive
+                archive_max_members=10000,
+                # max total uncompressed size of files extracted from one archive in bytes
+                archive_max_total_size=10 * 1024 ** 3,
+
+                # -------------------------------------------TABBY SETTINGS---------------------------------------------------------
+                # opt-in long-lived JVM for PdfTabbyReader instead of starting java for every document (JDK 11+ is required, java subprocess is used otherwise)
+                tabby_service=os.environ.get("DEDOC_TABBY_SERVICE", "false").lower() == "true",
+                # max number of documents waiting for the long-lived JVM, other documents are handled by a separate java process
+                tabby_service_max_queue_size=8,
+                # max time of handling one document by the long-lived JVM in seconds (None - no limit)
+                tabby_service_timeout=None,
+
+                # -------------------------------------------RESULTS CACHE SETTINGS-------------------------------------------------
+                # type of the parsing results cache: "" (no cache), "memory" (LRU cache in the parsing process) or "disk" (LRU cache in files)
+                results_cache=os.environ.get("DEDOC_RESULTS_CACHE", ""),
+                # directory for the "disk" results cache
+                results_cache_path=os.environ.get("DEDOC_RESULTS_CACHE_PATH", os.path.join(resources_path, "results_cache")),
+                # max total size of the cached results in bytes
+                results_cache_max_size=int(os.environ.get("DEDOC_RESULTS_CACHE_MAX_SIZE", str(512 * 1024 * 1024))),
 
                 # -------------------------------------------EXTERNAL SERVICES SETTINGS---------------------------------------------
                 grobid_max_connection_attempts=3
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from dedoc.api.api_args import QueryParameters
 from dedoc.common.exceptions.bad_file_error import BadFileFormatError
@@ -32,6 +32,7 @@ class DedocManager:
             - structure_constructor (:class:`~dedoc.structure_constructors.StructureConstructorComposition`)
             - document_metadata_extractor (:class:`~dedoc.metadata_extractors.MetadataExtractorComposition`)
             - attachments_handler (:class:`~dedoc.attachments_handler.AttachmentsHandler`)
+            - results_cache (optional) (:class:`~dedoc.results_cache.AbstractResultsCache`)
         """
         import logging
 
@@ -53,6 +54,7 @@ class DedocManager:
         assert self.document_metadata_extractor is not None, "Document metadata extractor shouldn't be None"
         self.attachments_handler = manager_config.get("attachments_handler", None)
         assert self.attachments_handler is not None, "Attachments handler shouldn't be None"
+        self.results_cache = manager_config.get("results_cache", None)
 
         self.default_parameters = QueryParameters().to_dict()
 
@@ -71,7 +73,9 @@ class DedocManager:
         self.logger.info(f"Get file {os.path.basename(file_path)} with parameters {parameters}")
 
         try:
-            return self.__parse_no_error_handling(file_path=file_path, parameters=parameters)
+            if self.results_cache is None or not self.results_cache.can_cache(parameters):
+                return self.__parse_no_error_handling(file_path=file_path, parameters=parameters)
+            return self.__parse_with_cache(file_path=file_path, parameters=parameters)
         except DedocError as e:
             from dedoc.metadata_extractors.concrete_metadata_extractors.base_metadata_extractor import BaseMetadataExtractor
 
@@ -80,6 +84,82 @@ class DedocManager:
             e.metadata = BaseMetadataExtractor._get_base_meta_information(directory=file_dir, filename=file_name, name_actual=file_name)
             raise e
 
+    def warm_up(self, extensions: Optional[List[str]] = None, document_types: Optional[List[str]] = None, parameters: Optional[Dict[str, str]] = None) -> None:
+        """
+        Construct the components of the manager config, which are created lazily at the first use (see :class:`~dedoc.utils.lazy_component.LazyComponent`),
+        so that the first parsing doesn't spend time on their initialization.
+
+        :param extensions: extensions of files (e.g. [".docx", ".pdf"]), the converters, readers and metadata extractors \
+        chosen for them will be constructed, all components are constructed if None
+        :param document_types: document types (e.g. ["other", "law"]), the structure extractors for them will be constructed, \
+        all structure extractors are constructed if None
+        :param parameters: parameters of parsing, that influence the choice of components (e.g. `pdf_with_text_layer`)
+        """
+        import mimetypes
+        from dedoc.utils.lazy_component import LazyComponent
+
+        parameters = {**self.default_parameters, **({} if parameters is None else parameters)}
+        converters = [] if self.converter is None else self.converter.converters
+
+        if extensions is None:
+            for component in list(converters) + list(self.reader.readers) + list(self.document_metadata_extractor.extractors):
+                if isinstance(component, LazyComponent):
+                    component.get()
+            extensions = []
+
+        # can_* methods construct the lazy components, the components are checked in the same order as during parsing
+        for extension in extensions:
+            file_path = f"file{extension}"
+            mime = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+            for converter in converters:
+                if converter.can_convert(file_path=file_path, mime=mime, extension=extension, parameters=parameters):
+                    break
+            for reader in self.reader.readers:
+                if reader.can_read(file_path=file_path, mime=mime, extension=extension, parameters=parameters):
+                    break
+            for extractor in self.document_metadata_extractor.extractors:
+                if extractor.can_extract(file_path=file_path, parameters=parameters, mime=mime, extension=extension):
+                    break
+
+        document_types = list(self.structure_extractor.extractors.keys()) if document_types is None else document_types
+        for document_type in document_types:
+            extractor = self.structure_extractor.extractors.get(document_type)
+            if isinstance(extractor, LazyComponent):
+                extractor.get()
+
+    def __parse_with_cache(self, file_path: str, parameters: Dict[str, str]) -> ParsedDocument:
+        """
+        Get the parsed document from the results cache or parse the file and save the result into the cache.
+        Metadata of the uploaded file (name, temporary name, type, size, times) are taken from the given file in case of cache hit.
+        """
+        import os.path
+        from dedoc.metadata_extractors.concrete_metadata_extractors.base_metadata_extractor import BaseMetadataExtractor
+        from dedoc.utils.utils import get_file_mime_type, get_unique_name, splitext_
+
+        if not os.path.isfile(path=file_path):
+            raise FileNotFoundError(file_path)
+
+        key = self.results_cache.get_key(file_path=file_path, parameters=parameters)
+        parsed_document = self.results_cache.get(key)
+        if parsed_document is None:
+            parsed_document = self.__parse_no_error_handling(file_path=file_path, parameters=parameters)
+            self.results_cache.put(key, parsed_document)
+            return parsed_document
+
+        file_dir, file_name = os.path.split(file_path)
+        base_metadata = BaseMetadataExtractor._get_base_meta_information(directory=file_dir, filename=file_name, name_actual=file_name)
+        for attribute in ("file_name", "size", "access_time", "created_time", "modified_time"):
+            parsed_document.metadata.add_attribute(attribute, base_metadata[attribute])
+
+        # the temporary name is unique for every parsing ([timestamp]_[random number][extension]), it may have the extension detected by the content
+        _, extension = splitext_(file_name)
+        cached_suffix = "".join(parsed_document.metadata.temporary_file_name.partition(".")[1:])
+        temporary_file_name = get_unique_name("") + extension + cached_suffix[len(extension):]
+        parsed_document.metadata.add_attribute("temporary_file_name", temporary_file_name)
+        parsed_document.metadata.add_attribute("file_type", get_file_mime_type(temporary_file_name))
+        self.logger.info(f"Get parsed document {file_name} from the results cache")
+        return parsed_document
+
     def __parse_no_error_handling(self, file_path: str, parameters: Dict[str, str]) -> ParsedDocument:
         """
         Function of complete document parsing without errors handling.
@@ -91,6 +171,9 @@ class DedocManager:
         import os.path
         import shutil
         import tempfile
+        from dedoc.utils.cancellation import check_cancellation
+        from dedoc.utils.parsing_metrics import measure_stage
+        from dedoc.utils.pdf_utils import share_pdf_contexts
         from dedoc.utils.utils import get_unique_name
 
         if not os.path.isfile(path=file_path):
@@ -99,7 +182,8 @@ class DedocManager:
         file_dir, file_name = os.path.split(file_path)
         unique_filename = get_unique_name(file_name)
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
+        # pdf files of the parsing are read and parsed with pypdf once for all readers and extractors
+        with tempfile.TemporaryDirectory() as tmp_dir, share_pdf_contexts(tmp_dir):
             tmp_file_path = os.path.join(tmp_dir, unique_filename)
             shutil.copy(file_path, tmp_file_path)
 
@@ -108,17 +192,22 @@ class DedocManager:
                 file_name=file_name, parameters=parameters, file_path=tmp_file_path
             )
             self.logger.info(f"Extract content from file {file_name}")
+            check_cancellation()
 
             # Step 4 - Extract structure
-            unstructured_document = self.structure_extractor.extract(unstructured_document, parameters)
+            with measure_stage("structure"):
+                unstructured_document = self.structure_extractor.extract(unstructured_document, parameters)
             self.logger.info(f"Extract structure from file {file_name}")
+            check_cancellation()
 
             if self.config.get("labeling_mode", False):
                 self.__save(converted_file_path, unstructured_document)
 
             # Step 5 - Form the output structure
-            parsed_document = self.structure_constructor.construct(document=unstructured_document, parameters=parameters)
+            with measure_stage("constructor"):
+                parsed_document = self.structure_constructor.construct(document=unstructured_document, parameters=parameters)
             self.logger.info(f"Get structured document {file_name}")
+            check_cancellation()
 
             # Step 6 - Get attachments
             attachments = self.attachments_handler.handle_attachments(document_parser=self, document=unstructured_document, parameters=parameters)
@@ -168,15 +257,22 @@ class DedocManager:
 
     def __parse_file(self, file_path: str, file_name: str, parameters: Optional[dict], extension: str, mime: str) -> Tuple[str, UnstructuredDocument]:
         import os.path
+        from dedoc.utils.parsing_metrics import add_pages, measure_stage
         from dedoc.utils.utils import get_mime_extension
 
-        converted_file_path = self.converter.convert(file_path, parameters=parameters, mime=mime, extension=extension)
+        with measure_stage("converter"):
+            converted_file_path = self.converter.convert(file_path, parameters=parameters, mime=mime, extension=extension)
         if converted_file_path != file_path:
             mime, extension = get_mime_extension(file_path=converted_file_path)
 
-        unstructured_document = self.reader.read(file_path=converted_file_path, parameters=parameters, mime=mime, extension=extension)
-        metadata = self.document_metadata_extractor.extract(file_path=file_path, converted_filename=os.path.basename(converted_file_path),
-                                                            original_filename=file_name, parameters=parameters, mime=mime, extension=extension)
+        with measure_stage("reader"):
+            unstructured_document = self.reader.read(file_path=converted_file_path, parameters=parameters, mime=mime, extension=extension)
+        if unstructured_document.lines:
+            add_pages(max(line.metadata.page_id for line in unstructured_document.lines) + 1)
+
+        with measure_stage("metadata"):
+            metadata = self.document_metadata_extractor.extract(file_path=file_path, converted_filename=os.path.basename(converted_file_path),
+                                                                original_filename=file_name, parameters=parameters, mime=mime, extension=extension)
 
         unstructured_document.metadata = {**unstructured_document.metadata, **metadata}
         return converted_file_path, unstructured_document
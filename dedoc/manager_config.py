@@ -1,5 +1,7 @@
 from typing import Optional
 
+from dedoc.results_cache.abstract_results_cache import AbstractResultsCache
+
 
 def _get_manager_config(config: dict) -> dict:
     """
@@ -49,54 +51,56 @@ def _get_manager_config(config: dict) -> dict:
     from dedoc.structure_extractors.concrete_structure_extractors.law_structure_excractor import LawStructureExtractor
     from dedoc.structure_extractors.concrete_structure_extractors.tz_structure_extractor import TzStructureExtractor
     from dedoc.structure_extractors.structure_extractor_composition import StructureExtractorComposition
+    from dedoc.utils.lazy_component import LazyComponent
 
+    # converters, readers, metadata and structure extractors are constructed at the first use, see DedocManager.warm_up
     converters = [
-        DocxConverter(config=config),
-        ExcelConverter(config=config),
-        PptxConverter(config=config),
-        TxtConverter(config=config),
-        PDFConverter(config=config),
-        PNGConverter(config=config),
-        BinaryConverter(config=config)
+        LazyComponent(DocxConverter, config=config),
+        LazyComponent(ExcelConverter, config=config),
+        LazyComponent(PptxConverter, config=config),
+        LazyComponent(TxtConverter, config=config),
+        LazyComponent(PDFConverter, config=config),
+        LazyComponent(PNGConverter, config=config),
+        LazyComponent(BinaryConverter, config=config)
     ]
     readers = [
-        ArticleReader(config=config),
-        DocxReader(config=config),
-        ExcelReader(config=config),
-        PptxReader(config=config),
-        RawTextReader(config=config),
-        CSVReader(config=config),
-        HtmlReader(config=config),
-        NoteReader(config=config),
-        JsonReader(config=config),
-        ArchiveReader(config=config),
-        PdfAutoReader(config=config),
-        PdfTabbyReader(config=config),
-        PdfTxtlayerReader(config=config),
-        PdfImageReader(config=config),
-        EmailReader(config=config),
-        MhtmlReader(config=config)
+        LazyComponent(ArticleReader, config=config),
+        LazyComponent(DocxReader, config=config),
+        LazyComponent(ExcelReader, config=config),
+        LazyComponent(PptxReader, config=config),
+        LazyComponent(RawTextReader, config=config),
+        LazyComponent(CSVReader, config=config),
+        LazyComponent(HtmlReader, config=config),
+        LazyComponent(NoteReader, config=config),
+        LazyComponent(JsonReader, config=config),
+        LazyComponent(ArchiveReader, config=config),
+        LazyComponent(PdfAutoReader, config=config),
+        LazyComponent(PdfTabbyReader, config=config),
+        LazyComponent(PdfTxtlayerReader, config=config),
+        LazyComponent(PdfImageReader, config=config),
+        LazyComponent(EmailReader, config=config),
+        LazyComponent(MhtmlReader, config=config)
     ]
 
     metadata_extractors = [
-        DocxMetadataExtractor(config=config),
-        PdfMetadataExtractor(config=config),
-        ImageMetadataExtractor(config=config),
-        NoteMetadataExtractor(config=config),
-        BaseMetadataExtractor(config=config)
+        LazyComponent(DocxMetadataExtractor, config=config),
+        LazyComponent(PdfMetadataExtractor, config=config),
+        LazyComponent(ImageMetadataExtractor, config=config),
+        LazyComponent(NoteMetadataExtractor, config=config),
+        LazyComponent(BaseMetadataExtractor, config=config)
     ]
 
     law_extractors = {
-        FoivLawStructureExtractor.document_type: FoivLawStructureExtractor(config=config),
-        LawStructureExtractor.document_type: LawStructureExtractor(config=config)
+        FoivLawStructureExtractor.document_type: LazyComponent(FoivLawStructureExtractor, config=config),
+        LawStructureExtractor.document_type: LazyComponent(LawStructureExtractor, config=config)
     }
     structure_extractors = {
-        DefaultStructureExtractor.document_type: DefaultStructureExtractor(config=config),
-        DiplomaStructureExtractor.document_type: DiplomaStructureExtractor(config=config),
-        TzStructureExtractor.document_type: TzStructureExtractor(config=config),
-        ClassifyingLawStructureExtractor.document_type: ClassifyingLawStructureExtractor(extractors=law_extractors, config=config),
-        ArticleStructureExtractor.document_type: ArticleStructureExtractor(config=config),
-        FintocStructureExtractor.document_type: FintocStructureExtractor(config=config)
+        DefaultStructureExtractor.document_type: LazyComponent(DefaultStructureExtractor, config=config),
+        DiplomaStructureExtractor.document_type: LazyComponent(DiplomaStructureExtractor, config=config),
+        TzStructureExtractor.document_type: LazyComponent(TzStructureExtractor, config=config),
+        ClassifyingLawStructureExtractor.document_type: LazyComponent(ClassifyingLawStructureExtractor, extractors=law_extractors, config=config),
+        ArticleStructureExtractor.document_type: LazyComponent(ArticleStructureExtractor, config=config),
+        FintocStructureExtractor.document_type: LazyComponent(FintocStructureExtractor, config=config)
     }
 
     return dict(
@@ -108,10 +112,27 @@ def _get_manager_config(config: dict) -> dict:
             default_constructor=TreeConstructor()
         ),
         document_metadata_extractor=MetadataExtractorComposition(extractors=metadata_extractors),
-        attachments_handler=AttachmentsHandler(config=config)
+        attachments_handler=AttachmentsHandler(config=config),
+        results_cache=_get_results_cache(config)
     )
 
 
+def _get_results_cache(config: dict) -> Optional[AbstractResultsCache]:
+    """
+    The results cache is disabled by default, it's enabled by the `results_cache` value of the config ("memory" or "disk")
+    """
+    from dedoc.results_cache.disk_results_cache import DiskResultsCache
+    from dedoc.results_cache.memory_results_cache import MemoryResultsCache
+
+    cache_type = str(config.get("results_cache", "")).lower()
+    max_size = config.get("results_cache_max_size", 512 * 1024 * 1024)
+    if cache_type == "memory":
+        return MemoryResultsCache(max_size=max_size, config=config)
+    if cache_type == "disk":
+        return DiskResultsCache(path=config["results_cache_path"], max_size=max_size, config=config)
+    return None
+
+
 class ConfigurationManager(object):
     """
     Pattern Singleton for configuration service
@@ -18,6 +18,10 @@ class PdfMetadataExtractor(AbstractMetadataExtractor):
         - keywords;
         - creation date;
         - modification date.
+
+    If the file can't be parsed by `pypdf <https://pypdf.readthedocs.io>`_, the field broken_pdf=True is added instead of them.
+    pypdf parses the files in the non-strict mode, so some files with minor errors in their structure (e.g. incorrect cross-reference tables)
+    aren't considered as broken.
     """
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
@@ -58,15 +62,12 @@ class PdfMetadataExtractor(AbstractMetadataExtractor):
         return result
 
     def _get_pdf_info(self, path: str) -> dict:
-        from PyPDF2 import PdfFileReader
-        from PyPDF2.utils import PdfReadError
+        from pypdf.errors import PdfReadError
+        from dedoc.utils.pdf_utils import get_pdf_context
 
         try:
-            with open(path, "rb") as file:
-                document = PdfFileReader(file)
-                document_info = document.getDocumentInfo() if document.getDocumentInfo() is not None else {}
-                result = self.__prettify_metadata(document_info)
-            return result
+            with get_pdf_context(path) as pdf_context:
+                return self.__prettify_metadata(pdf_context.document_info)
         except PdfReadError:
             return {"broken_pdf": True}
         except Exception as e:
@@ -1,19 +1,56 @@
 from typing import IO, Iterator, List, Optional
 
+from dedoc.common.exceptions.archive_limit_error import ArchiveLimitError
 from dedoc.common.exceptions.bad_file_error import BadFileFormatError
 from dedoc.data_structures.attached_file import AttachedFile
 from dedoc.data_structures.unstructured_document import UnstructuredDocument
 from dedoc.readers.base_reader import BaseReader
 
 
+class _ExtractionBudget:
+    """
+    Limits of the archive extraction, they are checked while the members are written to disk
+    """
+    def __init__(self, path: str, max_members: int, max_total_size: int) -> None:
+        self.path = path
+        self.max_members = max_members
+        self.max_total_size = max_total_size
+        self.members = 0
+        self.total_size = 0
+
+    def add_member(self) -> None:
+        self.members += 1
+        if self.members > self.max_members:
+            raise ArchiveLimitError(f"Archive {self.path} contains more than {self.max_members} files")
+
+    def add_size(self, size: int) -> None:
+        self.check_size(size)
+        self.total_size += size
+
+    def check_size(self, size: int) -> None:
+        if self.total_size + size > self.max_total_size:
+            raise ArchiveLimitError(f"Uncompressed size of archive {self.path} exceeds {self.max_total_size} bytes")
+
+
 class ArchiveReader(BaseReader):
     """
     This reader allows to get archived files as attachments of the :class:`~dedoc.data_structures.UnstructuredDocument`.
     Documents with the following extensions can be parsed: .zip, .tar, .tar.gz, .rar, .7z.
+
+    Archive members are written to disk by chunks (`archive_chunk_size` in the config), so the whole member isn't kept in memory
+    (except .7z members, the library reads them entirely).
+    The number of members and their total uncompressed size are limited (`archive_max_members` and `archive_max_total_size` in the config),
+    the limits are checked during the extraction, :class:`~dedoc.common.exceptions.archive_limit_error.ArchiveLimitError` is raised if they are exceeded.
+    The members extracted before the error are removed.
     """
+    recognized_formats = ("archive_like_format",)
+
     def __init__(self, *, config: Optional[dict] = None) -> None:
         from dedoc.extensions import recognized_extensions, recognized_mimes
         super().__init__(config=config, recognized_extensions=recognized_extensions.archive_like_format, recognized_mimes=recognized_mimes.archive_like_format)
+        self.chunk_size = self.config.get("archive_chunk_size", 1024 * 1024)
+        self.max_members = self.config.get("archive_max_members", 10000)
+        self.max_total_size = self.config.get("archive_max_total_size", 10 * 1024 ** 3)
 
     def read(self, file_path: str, parameters: Optional[dict] = None) -> UnstructuredDocument:
         """
@@ -34,24 +71,38 @@ class ArchiveReader(BaseReader):
         return UnstructuredDocument(lines=[], tables=[], attachments=attachments)
 
     def __get_attachments(self, path: str, tmp_dir: str, need_content_analysis: bool) -> List[AttachedFile]:
+        import os
         import rarfile
         import tarfile
         import zipfile
         from dedoc.utils.utils import get_file_mime_type
 
         mime = get_file_mime_type(path)
+        budget = _ExtractionBudget(path=path, max_members=self.max_members, max_total_size=self.max_total_size)
         if zipfile.is_zipfile(path) and mime == "application/zip":
-            return list(self.__read_zip_archive(path=path, tmp_dir=tmp_dir, need_content_analysis=need_content_analysis))
-        if tarfile.is_tarfile(path):
-            return list(self.__read_tar_archive(path=path, tmp_dir=tmp_dir, need_content_analysis=need_content_analysis))
-        if rarfile.is_rarfile(path):
-            return list(self.__read_rar_archive(path=path, tmp_dir=tmp_dir, need_content_analysis=need_content_analysis))
-        if mime == "application/x-7z-compressed":
-            return list(self.__read_7z_archive(path=path, tmp_dir=tmp_dir, need_content_analysis=need_content_analysis))
-        # if no one can handle this archive raise exception
-        raise BadFileFormatError(f"bad archive {path}")
-
-    def __read_zip_archive(self, path: str, tmp_dir: str, need_content_analysis: bool) -> Iterator[AttachedFile]:
+            read_archive = self.__read_zip_archive
+        elif tarfile.is_tarfile(path):
+            read_archive = self.__read_tar_archive
+        elif rarfile.is_rarfile(path):
+            read_archive = self.__read_rar_archive
+        elif mime == "application/x-7z-compressed":
+            read_archive = self.__read_7z_archive
+        else:
+            # if no one can handle this archive raise exception
+            raise BadFileFormatError(f"bad archive {path}")
+
+        attachments = []
+        try:
+            for attachment in read_archive(path=path, tmp_dir=tmp_dir, need_content_analysis=need_content_analysis, budget=budget):
+                attachments.append(attachment)
+        except BaseException:
+            # the archive isn't read, so the members extracted before the error are removed
+            for attachment in attachments:
+                os.remove(attachment.get_filename_in_path())
+            raise
+        return attachments
+
+    def __read_zip_archive(self, path: str, tmp_dir: str, need_content_analysis: bool, budget: _ExtractionBudget) -> Iterator[AttachedFile]:
         import zipfile
         import zlib
 
@@ -60,50 +111,61 @@ class ArchiveReader(BaseReader):
                 names = [member.filename for member in arch_file.infolist() if member.file_size > 0]
                 for name in names:
                     with arch_file.open(name) as file:
-                        yield self.__save_archive_file(tmp_dir=tmp_dir, file_name=name, file=file, need_content_analysis=need_content_analysis)
+                        yield self.__save_archive_file(tmp_dir=tmp_dir, file_name=name, file=file, need_content_analysis=need_content_analysis, budget=budget)
         except (zipfile.BadZipFile, zlib.error) as e:
             self.logger.warning(f"Can't read file {path} ({e})")
             raise BadFileFormatError(f"Can't read file {path} ({e})")
 
-    def __read_tar_archive(self, path: str, tmp_dir: str, need_content_analysis: bool) -> Iterator[AttachedFile]:
+    def __read_tar_archive(self, path: str, tmp_dir: str, need_content_analysis: bool, budget: _ExtractionBudget) -> Iterator[AttachedFile]:
         import tarfile
 
         with tarfile.open(path, "r") as arch_file:
             names = [member.name for member in arch_file.getmembers() if member.isfile()]
             for name in names:
-                file = arch_file.extractfile(name)
-                yield self.__save_archive_file(tmp_dir=tmp_dir, file_name=name, file=file, need_content_analysis=need_content_analysis)
-                file.close()
+                with arch_file.extractfile(name) as file:
+                    yield self.__save_archive_file(tmp_dir=tmp_dir, file_name=name, file=file, need_content_analysis=need_content_analysis, budget=budget)
 
-    def __read_rar_archive(self, path: str, tmp_dir: str, need_content_analysis: bool) -> Iterator[AttachedFile]:
+    def __read_rar_archive(self, path: str, tmp_dir: str, need_content_analysis: bool, budget: _ExtractionBudget) -> Iterator[AttachedFile]:
         import rarfile
 
         with rarfile.RarFile(path, "r") as arch_file:
             names = [item.filename for item in arch_file.infolist() if item.compress_size > 0]
             for name in names:
                 with arch_file.open(name) as file:
-                    yield self.__save_archive_file(tmp_dir=tmp_dir, file_name=name, file=file, need_content_analysis=need_content_analysis)
+                    yield self.__save_archive_file(tmp_dir=tmp_dir, file_name=name, file=file, need_content_analysis=need_content_analysis, budget=budget)
 
-    def __read_7z_archive(self, path: str, tmp_dir: str, need_content_analysis: bool) -> Iterator[AttachedFile]:
+    def __read_7z_archive(self, path: str, tmp_dir: str, need_content_analysis: bool, budget: _ExtractionBudget) -> Iterator[AttachedFile]:
+        import io
         import py7zlib
 
         with open(path, "rb") as content:
             arch_file = py7zlib.Archive7z(content)
             names = arch_file.getnames()
             for name in names:
-                file = arch_file.getmember(name)
-                yield self.__save_archive_file(tmp_dir=tmp_dir, file_name=name, file=file, need_content_analysis=need_content_analysis)
-
-    def __save_archive_file(self, tmp_dir: str, file_name: str, file: IO[bytes], need_content_analysis: bool) -> AttachedFile:
+                member = arch_file.getmember(name)
+                # py7zlib can't read a member by chunks, so its size is checked before reading
+                budget.check_size(member.size)
+                data = member.read()
+                file = io.BytesIO(data.encode() if isinstance(data, str) else data)
+                yield self.__save_archive_file(tmp_dir=tmp_dir, file_name=name, file=file, need_content_analysis=need_content_analysis, budget=budget)
+
+    def __save_archive_file(self, tmp_dir: str, file_name: str, file: IO[bytes], need_content_analysis: bool, budget: _ExtractionBudget) -> AttachedFile:
         import os
         import uuid
-        from dedoc.utils.utils import save_data_to_unique_file
+        from dedoc.utils.utils import open_unique_file
 
+        budget.add_member()
         file_name = os.path.basename(file_name)
-        binary_data = file.read()
-        if isinstance(binary_data, str):
-            binary_data = binary_data.encode()
-        tmp_path = save_data_to_unique_file(directory=tmp_dir, filename=file_name, binary_data=binary_data)
+        tmp_file, tmp_path = open_unique_file(directory=tmp_dir, filename=file_name)
+        try:
+            with tmp_file:
+                for chunk in iter(lambda: file.read(self.chunk_size), b""):
+                    budget.add_size(len(chunk))
+                    tmp_file.write(chunk)
+        except BaseException:
+            os.remove(os.path.join(tmp_dir, tmp_path))
+            raise
+
         attachment = AttachedFile(
             original_name=file_name,
             tmp_file_path=os.path.join(tmp_dir, tmp_path),
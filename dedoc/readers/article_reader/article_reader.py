@@ -15,6 +15,7 @@ class ArticleReader(BaseReader):
     """
     This class is used for parsing scientific articles with .pdf extension using `GROBID <https://grobid.readthedocs.io/en/latest/>`_ system.
     """
+    recognized_formats = ("pdf_like_format",)
 
     def __init__(self, config: Optional[dict] = None) -> None:
         import os
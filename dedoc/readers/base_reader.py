@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Set
+from typing import Optional, Set, Tuple
 
 from dedoc.data_structures.unstructured_document import UnstructuredDocument
 
@@ -14,6 +14,9 @@ class BaseReader(ABC):
     Some of the readers can also extract information about line type and hierarchy level (for example, list item) -
     this information is stored in the `tag_hierarchy_level` attribute of the class :class:`~dedoc.data_structures.LineMetadata`.
     """
+    # names of the formats of `dedoc.extensions` (e.g. "docx_like_format") which the reader can read, they are used by :meth:`can_read_format`
+    recognized_formats: Tuple[str, ...] = ()
+
     def __init__(self, *, config: Optional[dict] = None, recognized_extensions: Optional[Set[str]] = None, recognized_mimes: Optional[Set[str]] = None) -> None:
         """
         :param config: configuration of the reader, e.g. logger for logging
@@ -44,6 +47,26 @@ class BaseReader(ABC):
         mime, extension = get_mime_extension(file_path=file_path, mime=mime, extension=extension)
         return extension.lower() in self._recognized_extensions or mime in self._recognized_mimes
 
+    @classmethod
+    def can_read_format(cls: "BaseReader", mime: Optional[str] = None, extension: Optional[str] = None) -> bool:
+        """
+        Check by the class of the reader (without its construction) if the reader may handle the file of the given format.
+        If False is returned, :meth:`can_read` also returns False, but :meth:`can_read` may return False if True is returned here
+        (e.g. because of the parameters).
+        The check is done only if `recognized_formats` are set in the class itself (its subclasses may read other formats), True is returned otherwise.
+
+        :param mime: MIME type of a file
+        :param extension: file extension, for example .doc or .pdf
+        :return: False if this reader can't handle the file of the given format
+        """
+        from dedoc.extensions import recognized_extensions, recognized_mimes
+
+        formats = cls.__dict__.get("recognized_formats", ())
+        if not formats:
+            return True
+        extension = "" if extension is None else extension.lower()
+        return any(extension in getattr(recognized_extensions, name) or mime in getattr(recognized_mimes, name) for name in formats)
+
     @abstractmethod
     def read(self, file_path: str, parameters: Optional[dict] = None) -> UnstructuredDocument:
         """
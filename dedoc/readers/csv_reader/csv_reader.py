@@ -8,6 +8,7 @@ class CSVReader(BaseReader):
     """
     This class allows to parse files with the following extensions: .csv, .tsv.
     """
+    recognized_formats = ("csv_like_format",)
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
         from dedoc.extensions import recognized_extensions, recognized_mimes
@@ -10,6 +10,7 @@ class DocxReader(BaseReader):
     This class is used for parsing documents with .docx extension.
     Please use :class:`~dedoc.converters.DocxConverter` for getting docx file from similar formats.
     """
+    recognized_formats = ("docx_like_format",)
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
         from dedoc.attachments_extractors.concrete_attachments_extractors.docx_attachments_extractor import DocxAttachmentsExtractor
@@ -11,6 +11,7 @@ class EmailReader(BaseReader):
     """
     This class is used for parsing documents with .eml extension (e-mail messages saved into files).
     """
+    recognized_formats = ("eml_like_format",)
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
         from dedoc.extensions import recognized_extensions, recognized_mimes
@@ -12,6 +12,8 @@ class ExcelReader(BaseReader):
     This class is used for parsing documents with .xlsx extension.
     Please use :class:`~dedoc.converters.ExcelConverter` for getting xlsx file from similar formats.
     """
+    recognized_formats = ("excel_like_format",)
+
     import xlrd
     xlrd.xlsx.ensure_elementtree_imported(False, None)
     xlrd.xlsx.Element_has_iter = True
@@ -12,6 +12,7 @@ class HtmlReader(BaseReader):
     """
     This reader allows to handle documents with the following extensions: .htm, .html, .shtml
     """
+    recognized_formats = ("html_like_format",)
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
         from dedoc.extensions import recognized_extensions, recognized_mimes
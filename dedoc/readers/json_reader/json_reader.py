@@ -11,6 +11,7 @@ class JsonReader(BaseReader):
     """
     This reader allows handle .json files.
     """
+    recognized_formats = ("json_like_format",)
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
         from dedoc.attachments_extractors.concrete_attachments_extractors.json_attachment_extractor import JsonAttachmentsExtractor
@@ -9,6 +9,7 @@ class MhtmlReader(BaseReader):
     """
     This reader can process files with the following extensions: .mhtml, .mht, .mhtml.gz, .mht.gz
     """
+    recognized_formats = ("mhtml_like_format",)
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
         from dedoc.extensions import recognized_extensions, recognized_mimes
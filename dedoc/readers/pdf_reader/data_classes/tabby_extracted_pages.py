@@ -0,0 +1,29 @@
+from tempfile import TemporaryDirectory
+from typing import List
+
+
+class TabbyExtractedPages:
+    """
+    Output of the java tabby extraction for the pages from `start_page` to `end_page` of the PDF document
+    (page numeration starts with 1, both ends are included).
+    It allows to extract the pages once and to read them several times, e.g. in textual layer detection and in the final reading.
+    The images of the pages are kept in the temporary directory, they are moved to the attachments directory by the reading with attachments,
+    so only the last reading may extract attachments. The temporary directory is removed by :meth:`close`.
+    """
+
+    def __init__(self, path: str, start_page: int, end_page: int, remove_frame: bool, pages: List[dict], tmp_dir: TemporaryDirectory) -> None:
+        self.path = path
+        self.start_page = start_page
+        self.end_page = end_page
+        self.remove_frame = remove_frame
+        self.pages = pages
+        self.tmp_dir = tmp_dir
+
+    def can_be_reused(self, path: str, start_page: int, remove_frame: bool) -> bool:
+        """
+        Check if the extracted pages are the beginning of the pages from `start_page` of the document `path` extracted with the same settings.
+        """
+        return self.path == path and self.remove_frame == remove_frame and self.start_page <= start_page <= self.end_page
+
+    def close(self) -> None:
+        self.tmp_dir.cleanup()
@@ -1,7 +1,8 @@
-from typing import Optional
+from typing import List, Optional, Set
 
 from dedoc.data_structures.unstructured_document import UnstructuredDocument
 from dedoc.readers.base_reader import BaseReader
+from dedoc.readers.pdf_reader.data_classes.tabby_extracted_pages import TabbyExtractedPages
 
 
 class PdfAutoReader(BaseReader):
@@ -16,8 +17,12 @@ class PdfAutoReader(BaseReader):
 
     * if PDF document doesn't have a correct textual layer then :class:`~dedoc.readers.PdfImageReader` is used for document content extraction.
 
+    If PDF document has a correct textual layer, its pages are also checked separately, and the pages without a correct textual layer
+    (e.g. scanned pages inserted into the document) are recognized by :class:`~dedoc.readers.PdfImageReader`.
+
     For more information, look to `pdf_with_text_layer` option description in :ref:`pdf_handling_parameters`.
     """
+    recognized_formats = ("pdf_like_format",)
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
         from dedoc.extensions import recognized_extensions, recognized_mimes
@@ -56,13 +61,17 @@ class PdfAutoReader(BaseReader):
         warnings = []
         txtlayer_parameters = self.txtlayer_detector.detect_txtlayer(path=file_path, parameters=parameters)
 
-        if txtlayer_parameters.is_correct_text_layer:
-            result = self.__handle_correct_text_layer(is_first_page_correct=txtlayer_parameters.is_first_page_correct,
-                                                      parameters=parameters,
-                                                      path=file_path,
-                                                      warnings=warnings)
-        else:
-            result = self.__handle_incorrect_text_layer(parameters, file_path, warnings)
+        try:
+            if txtlayer_parameters.is_correct_text_layer:
+                result = self.__handle_correct_text_layer(extracted_pages=txtlayer_parameters.extracted_pages,
+                                                          parameters=parameters,
+                                                          path=file_path,
+                                                          warnings=warnings)
+            else:
+                result = self.__handle_incorrect_text_layer(parameters, file_path, warnings)
+        finally:
+            if txtlayer_parameters.extracted_pages is not None:
+                txtlayer_parameters.extracted_pages.close()
 
         result.warnings.extend(warnings)
         return result
@@ -75,79 +84,104 @@ class PdfAutoReader(BaseReader):
         result = self.pdf_image_reader.read(file_path=path, parameters=parameters_copy)
         return result
 
-    def __handle_correct_text_layer(self, is_first_page_correct: bool, parameters: dict, path: str, warnings: list) -> UnstructuredDocument:
+    def __handle_correct_text_layer(self, extracted_pages: Optional[TabbyExtractedPages], parameters: dict, path: str, warnings: list) -> UnstructuredDocument:
         import os
         from dedoc.utils.parameter_utils import get_param_pdf_with_txt_layer
 
         self.logger.info(f"Assume document {os.path.basename(path)} has a correct textual layer")
         warnings.append("Assume document has a correct textual layer")
-        recognized_first_page = None
 
-        if not is_first_page_correct:
-            message = "Assume the first page hasn't a textual layer"
+        if get_param_pdf_with_txt_layer(parameters) == "auto":
+            result = self.pdf_txtlayer_reader.read(file_path=path, parameters=parameters)
+        else:
+            # the pages read by the tabby reader for the textual layer detection aren't extracted by java again
+            result = self.pdf_tabby_reader.read(file_path=path, parameters=parameters, extracted_pages=extracted_pages)
+
+        # every page is checked separately, pages without a correct textual layer (e.g. scanned inserts) are recognized like scanned pages
+        page_ids = self.__get_page_ids(path, parameters)
+        scanned_pages = self.txtlayer_detector.detect_pages_without_txtlayer(lines=result.lines, page_ids=page_ids, parameters=parameters)
+        if not scanned_pages:
+            return result
+
+        for message in self.__get_scanned_pages_warnings(scanned_pages):
             warnings.append(message)
             self.logger.info(message)
 
-            # GET THE FIRST PAGE: recognize the first page like a scanned page
-            scan_parameters = self.__preparing_first_page_parameters(parameters)
-            recognized_first_page = self.pdf_image_reader.read(file_path=path, parameters=scan_parameters)
+        scan_parameters_list = self.__preparing_scanned_pages_parameters(parameters, scanned_pages)
+        recognized_pages = [self.pdf_image_reader.read(file_path=path, parameters=scan_parameters) for scan_parameters in scan_parameters_list]
+        return self.__merge_documents(result, recognized_pages, set(scanned_pages))
 
-            # PREPARE PARAMETERS: from the second page we recognize the content like PDF with a textual layer
-            parameters = self.__preparing_other_pages_parameters(parameters)
+    def __get_scanned_pages_warnings(self, scanned_pages: List[int]) -> List[str]:
+        # the message about the first page is kept as it was before the other pages were checked
+        messages = ["Assume the first page hasn't a textual layer"] if 0 in scanned_pages else []
+        other_pages = [page_id for page_id in scanned_pages if page_id != 0]
+        if other_pages:
+            pages_str = ", ".join(str(page_id + 1) for page_id in other_pages)
+            messages.append(f"Assume page {pages_str} hasn't a textual layer" if len(other_pages) == 1 else f"Assume pages {pages_str} haven't a textual layer")
+        return messages
 
-        pdf_with_txt_layer = get_param_pdf_with_txt_layer(parameters)
-        reader = self.pdf_txtlayer_reader if pdf_with_txt_layer == "auto" else self.pdf_tabby_reader
-        result = reader.read(file_path=path, parameters=parameters)
-        result = self.__merge_documents(recognized_first_page, result) if recognized_first_page is not None else result
-        return result
-
-    def __preparing_first_page_parameters(self, parameters: dict) -> dict:
-        import copy
+    def __get_page_ids(self, path: str, parameters: dict) -> List[int]:
         from dedoc.utils.parameter_utils import get_param_page_slice
+        from dedoc.utils.pdf_utils import get_pdf_page_count
 
         first_page, last_page = get_param_page_slice(parameters)
-        # calculate indexes for the first page parsing
-        first_page_index = 0 if first_page is None else first_page
-        last_page_index = 0
-        scan_parameters = copy.deepcopy(parameters)
+        page_count = get_pdf_page_count(path)
+        first_page = 0 if first_page is None else first_page
+        last_page = page_count if last_page is None or (page_count is not None and last_page > page_count) else last_page
+        return list(range(first_page, last_page)) if last_page is not None else []
 
-        # page numeration in parameters starts with 1, both ends are included
-        scan_parameters["pages"] = f"{first_page_index + 1}:{last_page_index + 1}"
-        # if the first page != 0 then we won't read it (because first_page_index > last_page_index)
-        return scan_parameters
-
-    def __preparing_other_pages_parameters(self, parameters: dict) -> dict:
-        from dedoc.utils.parameter_utils import get_param_page_slice
+    def __preparing_scanned_pages_parameters(self, parameters: dict, scanned_pages: List[int]) -> List[dict]:
+        import copy
 
-        first_page, last_page = get_param_page_slice(parameters)
-        # parameters for reading pages from the second page
-        first_page_index = 1 if first_page is None else first_page
-        last_page_index = "" if last_page is None else last_page
-        parameters["pages"] = f"{first_page_index + 1}:{last_page_index}"
+        # consecutive scanned pages are recognized together
+        pages_groups = []
+        for page_id in scanned_pages:
+            if pages_groups and pages_groups[-1][1] == page_id - 1:
+                pages_groups[-1][1] = page_id
+            else:
+                pages_groups.append([page_id, page_id])
 
-        return parameters
+        scan_parameters_list = []
+        for first_page_index, last_page_index in pages_groups:
+            scan_parameters = copy.deepcopy(parameters)
+            # page numeration in parameters starts with 1, both ends are included
+            scan_parameters["pages"] = f"{first_page_index + 1}:{last_page_index + 1}"
+            scan_parameters_list.append(scan_parameters)
+        return scan_parameters_list
 
-    def __merge_documents(self, first: UnstructuredDocument, second: UnstructuredDocument) -> UnstructuredDocument:
+    def __merge_documents(self, document: UnstructuredDocument, recognized_pages: List[UnstructuredDocument], scanned_pages: Set[int]) -> UnstructuredDocument:
+        """
+        Replace the content of the scanned pages of the document by the recognized pages, lines are sorted by the page order.
+        Warnings of the recognized pages are added to the warnings of the document.
+        """
         from itertools import chain
         from dedoc.data_structures.concrete_annotations.table_annotation import TableAnnotation
         from dedoc.data_structures.line_with_meta import LineWithMeta
 
-        tables = first.tables
+        tables = []
         dropped_tables = set()
-        for table in second.tables:
-            if table.metadata.page_id != 0:
-                tables.append(table)
-            else:
+        for table in document.tables:
+            if table.metadata.page_id in scanned_pages:
                 dropped_tables.add(table.metadata.uid)
+            else:
+                tables.append(table)
+        tables.extend(table for recognized_document in recognized_pages for table in recognized_document.tables)
+
+        document_lines = [line for line in document.lines if line.metadata.page_id not in scanned_pages]
+        recognized_lines = [line for recognized_document in recognized_pages for line in recognized_document.lines]
+        # sorting is stable, so the order of lines inside every page is kept
+        all_lines = sorted(chain(document_lines, recognized_lines), key=lambda line: line.metadata.page_id)
 
         lines = []
-        line_id = 0
-        for line in chain(first.lines, second.lines):
+        for line_id, line in enumerate(all_lines):
             line.metadata.line_id = line_id
-            line_id += 1
             annotations = [
                 annotation for annotation in line.annotations if not (isinstance(annotation, TableAnnotation) and annotation.value in dropped_tables)
             ]
             new_line = LineWithMeta(line=line.line, metadata=line.metadata, annotations=annotations, uid=line.uid)
             lines.append(new_line)
-        return UnstructuredDocument(tables=tables, lines=lines, attachments=first.attachments + second.attachments, metadata=second.metadata)
+
+        attachments = document.attachments + [attachment for recognized_document in recognized_pages for attachment in recognized_document.attachments]
+        recognized_warnings = [warning for recognized_document in recognized_pages for warning in recognized_document.warnings]
+        warnings = list(dict.fromkeys(document.warnings + recognized_warnings))  # the same warnings of several recognized groups of pages are added once
+        return UnstructuredDocument(tables=tables, lines=lines, attachments=attachments, warnings=warnings, metadata=document.metadata)
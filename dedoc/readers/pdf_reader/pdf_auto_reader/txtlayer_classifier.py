@@ -50,12 +50,28 @@ class TxtlayerClassifier:
         :param lines: list of document textual lines.
         :returns: True if the textual layer is correct, False otherwise.
         """
-        text_layer = "".join([line.line for line in lines])
-        if not text_layer:
-            return False
+        return self.predict_pages([lines])[0]
 
-        if len(text_layer) < 150:
-            text_layer = f"\n{text_layer}" * (150 // len(text_layer))
+    def predict_pages(self, pages_lines: List[List[LineWithMeta]]) -> List[bool]:
+        """
+        Classifies the correctness of the text layer of every page of a PDF document, all pages are classified in one batch.
+
+        :param pages_lines: list of textual lines of every page.
+        :returns: list with True for pages with a correct textual layer, False otherwise.
+        """
+        text_layers = [self.__get_text_layer(lines) for lines in pages_lines]
+        result = [False] * len(text_layers)
+        not_empty_indices = [i for i, text_layer in enumerate(text_layers) if text_layer]
+        if not not_empty_indices:
+            return result
+
+        features = self.feature_extractor.transform([text_layers[i] for i in not_empty_indices])
+        for i, prediction in zip(not_empty_indices, self.__get_model.predict(features)):
+            result[i] = bool(prediction == 1)
+        return result
 
-        features = self.feature_extractor.transform([text_layer])
-        return self.__get_model.predict(features)[0] == 1
+    def __get_text_layer(self, lines: List[LineWithMeta]) -> str:
+        text_layer = "".join([line.line for line in lines])
+        if text_layer and len(text_layer) < 150:
+            text_layer = f"\n{text_layer}" * (150 // len(text_layer))
+        return text_layer
@@ -7,7 +7,8 @@ from dedoc.data_structures.line_with_meta import LineWithMeta
 from dedoc.readers.pdf_reader.pdf_auto_reader.txtlayer_classifier import TxtlayerClassifier
 from dedoc.readers.pdf_reader.pdf_txtlayer_reader.pdf_tabby_reader import PdfTabbyReader
 
-PdfTxtlayerParameters = namedtuple("PdfTxtlayerParameters", ["is_correct_text_layer", "is_first_page_correct"])
+# extracted_pages are the pages read by the tabby reader for the detection, they can be reused by the final reading and should be closed after it
+PdfTxtlayerParameters = namedtuple("PdfTxtlayerParameters", ["is_correct_text_layer", "extracted_pages"], defaults=[None])
 
 
 class TxtLayerDetector:
@@ -27,31 +28,46 @@ class TxtLayerDetector:
         :param parameters: parameters for the txtlayer classifier
         :return: information about a textual layer in the PDF document
         """
+        parameters_copy = deepcopy(parameters)
+        parameters_copy["pages"] = "1:8"  # two batches for pdf_txtlayer_reader
+        parameters_copy["need_pdf_table_analysis"] = "false"
+        # the images of the extracted pages are left for the final reading
+        parameters_copy["with_attachments"] = "false"
+        extracted_pages = None
         try:
-            lines = self.__get_lines_for_predict(path=path, parameters=parameters)
-            if str(parameters.get("fast_textual_layer_detection", "false")).lower() == "true":
+            extracted_pages = self.pdf_reader.extract_pages(path, parameters=parameters_copy)
+            lines = self.pdf_reader.read(path, parameters=parameters_copy, extracted_pages=extracted_pages).lines
+            if self.__is_fast_detection(parameters):
                 is_correct = any(line.line.strip() for line in lines)
-                first_page_lines = [line for line in lines if line.metadata.page_id == 0]
-                first_page_correct = bool(first_page_lines) and any(line.line.strip() for line in first_page_lines)
             else:
                 is_correct = self.txtlayer_classifier.predict(lines)
-                first_page_correct = self.__is_first_page_correct(lines=lines, is_txt_layer_correct=is_correct)
-            return PdfTxtlayerParameters(is_correct_text_layer=is_correct, is_first_page_correct=first_page_correct)
+            return PdfTxtlayerParameters(is_correct_text_layer=is_correct, extracted_pages=extracted_pages)
 
         except Exception as e:
+            if extracted_pages is not None:
+                extracted_pages.close()
             self.logger.debug(f"Error occurred white detecting PDF textual layer ({e})")
-            return PdfTxtlayerParameters(is_correct_text_layer=False, is_first_page_correct=False)
+            return PdfTxtlayerParameters(is_correct_text_layer=False)
 
-    def __get_lines_for_predict(self, path: str, parameters: dict) -> List[LineWithMeta]:
-        parameters_copy = deepcopy(parameters)
-        parameters_copy["pages"] = "1:8"  # two batches for pdf_txtlayer_reader
-        parameters_copy["need_pdf_table_analysis"] = "false"
-        document = self.pdf_reader.read(path, parameters=parameters_copy)
-        return document.lines
+    def detect_pages_without_txtlayer(self, lines: List[LineWithMeta], page_ids: List[int], parameters: dict) -> List[int]:
+        """
+        Detect pages of the PDF document, which don't have a correct textual layer (e.g. scanned pages inserted into a document with a textual layer).
+
+        :param lines: lines of the document read from its textual layer
+        :param page_ids: numbers of the pages to check (numeration starts with 0)
+        :param parameters: parameters for the txtlayer classifier
+        :return: numbers of the pages without a correct textual layer
+        """
+        pages_lines = {page_id: [] for page_id in page_ids}
+        for line in lines:
+            if line.metadata.page_id in pages_lines:
+                pages_lines[line.metadata.page_id].append(line)
 
-    def __is_first_page_correct(self, lines: List[LineWithMeta], is_txt_layer_correct: bool) -> bool:
-        if not is_txt_layer_correct:
-            return False
+        if self.__is_fast_detection(parameters):
+            is_correct = [any(line.line.strip() for line in page_lines) for page_lines in pages_lines.values()]
+        else:
+            is_correct = self.txtlayer_classifier.predict_pages(list(pages_lines.values()))
+        return [page_id for page_id, page_is_correct in zip(pages_lines, is_correct) if not page_is_correct]
 
-        first_page_lines = [line for line in lines if line.metadata.page_id == 0]
-        return self.txtlayer_classifier.predict(first_page_lines)
+    def __is_fast_detection(self, parameters: dict) -> bool:
+        return str(parameters.get("fast_textual_layer_detection", "false")).lower() == "true"
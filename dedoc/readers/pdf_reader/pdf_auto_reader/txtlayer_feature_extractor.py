@@ -1,4 +1,3 @@
-from collections import defaultdict
 from typing import List
 
 import numpy as np
@@ -6,57 +5,105 @@ import pandas as pd
 
 
 class TxtlayerFeatureExtractor:
+    """
+    Features of the texts for the textual layer classifier: proportions of the character classes, numbers of the symbols,
+    changes of the character classes between neighbouring characters and statistics of the words lengths and the character codes.
 
-    def transform(self, texts: List[str]) -> pd.DataFrame:
+    The text is handled as an array of code points, the character classes and the indices of the symbols are looked up in the tables precomputed by codes.
+    """
+
+    def __init__(self) -> None:
         from dedoc.structure_extractors.feature_extractors.char_features import letters, digits, special_symbols, brackets, rus, eng, prohibited_symbols, \
-            lower_letters, upper_letters, symbols, count_symbols
-
-        features = defaultdict(list)
-
-        for text in texts:
-            num_letters = count_symbols(text, letters)
-            num_digits = count_symbols(text, digits)
-            num_special_symbols = count_symbols(text, special_symbols)
-            num_brackets = count_symbols(text, brackets)
-            num_rus = count_symbols(text, rus + rus.upper())
-            num_eng = count_symbols(text, eng + eng.upper())
-
-            features["letters_proportion"].append(num_letters / len(text))
-            features["digits_proportion"].append(num_digits / len(text))
-            features["special_symbols_proportion"].append(num_special_symbols / len(text))
-            features["brackets_proportion"].append(num_brackets / len(text))
-            features["rus_proportion"].append(num_rus / len(text))
-            features["eng_proportion"].append(num_eng / len(text))
-
-            for symbol in letters + digits:
-                n = num_letters + num_digits
-                # proportion of occurring english and russian letters
-                features[f"{symbol}_proportion"].append(text.count(symbol) / n if n != 0 else 0.0)
-
-            for symbol in special_symbols + brackets:
-                # number of symbols
-                symbol_name = symbol if symbol not in prohibited_symbols else f"symbol{prohibited_symbols[symbol]}"
-                features[f"{symbol_name}_number"].append(text.count(symbol))
-
-            # proportion of letters with symbols
-            features["all_proportion"].append((num_letters + num_digits + num_brackets + num_special_symbols) / len(text) if len(text) != 0 else 0)
-
-            case_changes = sum(1 for s1, s2 in zip(text[:-1], text[1:]) if (s1 in lower_letters) and (s2 in upper_letters))
-            features["case_changes"].append(case_changes / len(text))
-            symbol_changes = sum(1 for s1, s2 in zip(text[:-1], text[1:]) if (s1 in symbols) != (s2 in symbols))
-            features["symbol_changes"].append(symbol_changes / len(text))
-            letter_changes = sum(1 for s1, s2 in zip(text[:-1], text[1:]) if (s1 in letters) and (s2 not in symbols))
-            features["letter_changes"].append(letter_changes / len(text))
-
-            features["mean_word_length"].append(np.mean([len(word) for word in text.split()]))
-            features["median_word_length"].append(np.median([len(word) for word in text.split()]))
-
-            all_characters_ord = [ord(character) for character in text]
-            trash_chars = sum(1 for s in all_characters_ord if s <= 32 or 160 <= s <= 879)
-            features["trash_chars_proportion"].append(trash_chars / len(text))
-            features["trash_chars_number"].append(trash_chars)
-            features["std_char_ord"].append(np.std(all_characters_ord))
-            features["mean_char_ord"].append(np.mean(all_characters_ord))
-            features["median_char_ord"].append(np.median(all_characters_ord))
-        features = pd.DataFrame(features)
-        return features[sorted(features.columns)].astype(float)
+            lower_letters, upper_letters, symbols
+
+        proportion_symbols = letters + digits
+        number_symbols = special_symbols + brackets
+        self.__counted_symbols = proportion_symbols + number_symbols
+        number_names = [symbol if symbol not in prohibited_symbols else f"symbol{prohibited_symbols[symbol]}" for symbol in number_symbols]
+        self.__feature_names = [
+            "letters_proportion", "digits_proportion", "special_symbols_proportion", "brackets_proportion", "rus_proportion", "eng_proportion",
+            *[f"{symbol}_proportion" for symbol in proportion_symbols],
+            *[f"{symbol_name}_number" for symbol_name in number_names],
+            "all_proportion", "case_changes", "symbol_changes", "letter_changes", "mean_word_length", "median_word_length",
+            "trash_chars_proportion", "trash_chars_number", "std_char_ord", "mean_char_ord", "median_char_ord"
+        ]
+        self.__columns_order = np.argsort(self.__feature_names, kind="stable")
+        self.__columns = [self.__feature_names[i] for i in self.__columns_order]
+        self.__proportion_slice = slice(0, len(proportion_symbols))
+        self.__number_slice = slice(len(proportion_symbols), len(self.__counted_symbols))
+
+        # the last element of the tables is used for all characters with bigger codes
+        self.__table_size = max(ord(symbol) for symbol in self.__counted_symbols + rus.upper()) + 2
+        self.__symbol_index = np.full(self.__table_size, len(self.__counted_symbols), dtype=np.int64)
+        self.__symbol_index[[ord(symbol) for symbol in self.__counted_symbols]] = np.arange(len(self.__counted_symbols))
+
+        self.__letters_indices = self.__get_indices(letters)
+        self.__digits_indices = self.__get_indices(digits)
+        self.__special_symbols_indices = self.__get_indices(special_symbols)
+        self.__brackets_indices = self.__get_indices(brackets)
+        self.__rus_indices = self.__get_indices(rus + rus.upper())
+        self.__eng_indices = self.__get_indices(eng + eng.upper())
+
+        self.__is_letter = self.__get_mask(letters)
+        self.__is_lower_letter = self.__get_mask(lower_letters)
+        self.__is_upper_letter = self.__get_mask(upper_letters)
+        self.__is_symbol = self.__get_mask(symbols)
+
+    def transform(self, texts: List[str]) -> pd.DataFrame:
+        features = np.array([self.__get_text_features(text) for text in texts], dtype=float).reshape(len(texts), len(self.__feature_names))
+        # columns are sorted by their names
+        return pd.DataFrame(features[:, self.__columns_order], columns=self.__columns)
+
+    def __get_text_features(self, text: str) -> List[float]:
+        """
+        Get the features of the text in the order of self.__feature_names.
+        """
+        codes = np.frombuffer(text.encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32).astype(np.int64)
+        table_codes = np.minimum(codes, self.__table_size - 1)
+        symbol_counts = np.bincount(self.__symbol_index[table_codes], minlength=len(self.__counted_symbols) + 1)
+
+        num_letters = int(symbol_counts[self.__letters_indices].sum())
+        num_digits = int(symbol_counts[self.__digits_indices].sum())
+        num_special_symbols = int(symbol_counts[self.__special_symbols_indices].sum())
+        num_brackets = int(symbol_counts[self.__brackets_indices].sum())
+        num_rus = int(symbol_counts[self.__rus_indices].sum())
+        num_eng = int(symbol_counts[self.__eng_indices].sum())
+
+        features = [
+            num_letters / len(text),
+            num_digits / len(text),
+            num_special_symbols / len(text),
+            num_brackets / len(text),
+            num_rus / len(text),
+            num_eng / len(text)
+        ]
+
+        # proportion of occurring english and russian letters
+        n = num_letters + num_digits
+        features.extend((symbol_counts[self.__proportion_slice] / n).tolist() if n != 0 else [0.0] * self.__proportion_slice.stop)
+        # number of symbols
+        features.extend(symbol_counts[self.__number_slice].tolist())
+
+        # proportion of letters with symbols
+        features.append((num_letters + num_digits + num_brackets + num_special_symbols) / len(text) if len(text) != 0 else 0)
+
+        is_letter, is_symbol = self.__is_letter[table_codes], self.__is_symbol[table_codes]
+        case_changes = int(np.count_nonzero(self.__is_lower_letter[table_codes[:-1]] & self.__is_upper_letter[table_codes[1:]]))
+        symbol_changes = int(np.count_nonzero(is_symbol[:-1] != is_symbol[1:]))
+        letter_changes = int(np.count_nonzero(is_letter[:-1] & ~is_symbol[1:]))
+        features.extend([case_changes / len(text), symbol_changes / len(text), letter_changes / len(text)])
+
+        words_lengths = [len(word) for word in text.split()]
+        features.extend([np.mean(words_lengths), np.median(words_lengths)])
+
+        trash_chars = int(np.count_nonzero((codes <= 32) | ((codes >= 160) & (codes <= 879))))
+        features.extend([trash_chars / len(text), trash_chars, np.std(codes), np.mean(codes), np.median(codes)])
+        return features
+
+    def __get_indices(self, symbols: str) -> np.ndarray:
+        return self.__symbol_index[[ord(symbol) for symbol in symbols]]
+
+    def __get_mask(self, symbols: str) -> np.ndarray:
+        mask = np.zeros(self.__table_size, dtype=bool)
+        mask[[ord(symbol) for symbol in symbols]] = True
+        return mask
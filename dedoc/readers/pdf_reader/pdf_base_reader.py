@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from collections import namedtuple
-from typing import Dict, Iterator, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 from dedocutils.data_structures.bbox import BBox
 from numpy import ndarray
@@ -14,22 +14,44 @@ from dedoc.readers.pdf_reader.data_classes.pdf_image_attachment import PdfImageA
 from dedoc.readers.pdf_reader.data_classes.tables.scantable import ScanTable
 
 
-ParametersForParseDoc = namedtuple("ParametersForParseDoc", [
-    "is_one_column_document",
-    "document_orientation",
-    "language",
-    "need_header_footers_analysis",
-    "need_pdf_table_analysis",
-    "first_page",
-    "last_page",
-    "need_binarization",
-    "table_type",
-    "with_attachments",
-    "attachments_dir",
-    "need_content_analysis",
-    "need_gost_frame_analysis",
-    "pdf_with_txt_layer"
-])
+ParametersForParseDoc = namedtuple(
+    typename="ParametersForParseDoc",
+    field_names=[
+        "is_one_column_document",
+        "document_orientation",
+        "language",
+        "need_header_footers_analysis",
+        "need_pdf_table_analysis",
+        "first_page",
+        "last_page",
+        "need_binarization",
+        "table_type",
+        "with_attachments",
+        "attachments_dir",
+        "need_content_analysis",
+        "need_gost_frame_analysis",
+        "pdf_with_txt_layer",
+        "gost_frame_boxes"  # page number -> (bbox of the frame content, original image shape), it is filled during the gost frame analysis
+    ],
+    defaults=[None]
+)
+
+T = TypeVar("T")
+
+# readers of the page worker process: reader class -> (key of the reader in the main process, reader)
+_worker_readers: Dict[type, Tuple[str, "PdfBaseReader"]] = {}
+
+
+def _process_page_in_worker(reader_class: type, config: dict, reader_key: str, method_name: str, *task: object) -> T:
+    """
+    Call the method of the reader for the page in the page worker process.
+    The reader is created in the worker once (for every reader of the main process), so the reader with its models isn't sent to the worker with every page.
+    """
+    key, reader = _worker_readers.get(reader_class, (None, None))
+    if key != reader_key:
+        reader = reader_class(config=config)
+        _worker_readers[reader_class] = (reader_key, reader)
+    return getattr(reader, method_name)(*task)
 
 
 class PdfBaseReader(BaseReader):
@@ -47,7 +69,11 @@ class PdfBaseReader(BaseReader):
         from dedoc.readers.pdf_reader.utils.line_object_linker import LineObjectLinker
         from dedoc.attachments_extractors.concrete_attachments_extractors.pdf_attachments_extractor import PDFAttachmentsExtractor
 
+        import uuid
+
         self.config["n_jobs"] = self.config.get("n_jobs", 1)
+        # the reader is created again in the page worker processes, the key allows to find out that the worker has the reader with the same config
+        self.__worker_key = uuid.uuid4().hex
         self.table_recognizer = TableRecognizer(config=self.config)
         self.metadata_extractor = LineMetadataExtractor(config=self.config)
         self.attachment_extractor = PDFAttachmentsExtractor(config=self.config)
@@ -97,24 +123,23 @@ class PdfBaseReader(BaseReader):
     def _parse_document(self, path: str, parameters: ParametersForParseDoc) -> (
             Tuple)[List[LineWithMeta], List[ScanTable], List[PdfImageAttachment], List[str], Optional[dict]]:
         import math
-        from joblib import Parallel, delayed
         from dedoc.data_structures.hierarchy_level import HierarchyLevel
         from dedoc.readers.pdf_reader.utils.header_footers_analysis import footer_header_analysis
         from dedoc.utils.pdf_utils import get_pdf_page_count
         from dedoc.readers.pdf_reader.pdf_image_reader.pdf_image_reader import PdfImageReader
         from dedoc.readers.pdf_reader.pdf_txtlayer_reader.pdf_txtlayer_reader import PdfTxtlayerReader
+        from dedoc.utils.cancellation import cancellable
         from dedoc.utils.utils import flatten
 
         first_page = 0 if parameters.first_page is None or parameters.first_page < 0 else parameters.first_page
         last_page = math.inf if parameters.last_page is None else parameters.last_page
-        images = self._get_images(path, first_page, last_page)
+        # parsing can be cancelled between pages
+        images = cancellable(self._get_images(path, first_page, last_page))
 
         if parameters.need_gost_frame_analysis and isinstance(self, (PdfImageReader, PdfTxtlayerReader)):
             result, gost_analyzed_images = self._process_document_with_gost_frame(images=images, first_page=first_page, parameters=parameters, path=path)
         else:
-            result = Parallel(n_jobs=self.config["n_jobs"])(
-                delayed(self._process_one_page)(image, parameters, page_number, path) for page_number, image in enumerate(images, start=first_page)
-            )
+            result = self._process_pages(images=images, first_page=first_page, parameters=parameters, path=path)
 
         page_count = get_pdf_page_count(path)
         page_count = math.inf if page_count is None else page_count
@@ -157,13 +182,43 @@ class PdfBaseReader(BaseReader):
         page_range = range(first_page, first_page + len(gost_analyzed_images))
         gost_analyzed_images = dict(zip(page_range, gost_analyzed_images))
         if isinstance(self, PdfTxtlayerReader):
-            self.gost_frame_boxes = dict(zip(page_range, [(item[1], item[2]) for item in gost_analyzed_images.values()]))
-        result = Parallel(n_jobs=self.config["n_jobs"])(
-            delayed(self._process_one_page)(image, parameters, page_number, path) for page_number, (image, box, original_image_shape) in
-            gost_analyzed_images.items()
-        )
+            # the boxes are passed with the parameters of the document, the reader doesn't keep them, so it can handle several documents at once
+            parameters = parameters._replace(gost_frame_boxes={page_number: (box, shape) for page_number, (_, box, shape) in gost_analyzed_images.items()})
+        images = (image for image, box, original_image_shape in gost_analyzed_images.values())
+        result = self._process_pages(images=images, first_page=first_page, parameters=parameters, path=path)
         return result, gost_analyzed_images
 
+    def _process_pages(self, images: Iterator[ndarray], first_page: int, parameters: ParametersForParseDoc, path: str) \
+            -> List[Tuple[List[LineWithLocation], List[ScanTable], List[PdfImageAttachment], List[float]]]:
+        """
+        Process pages images (starting from the page `first_page`) in parallel, the result for every page is returned by :meth:`_process_one_page`
+        """
+        tasks = ((image, parameters, page_number, path) for page_number, image in enumerate(images, start=first_page))
+        return self._run_page_pipeline("_process_one_page", tasks)
+
+    def _run_page_pipeline(self, method_name: str, tasks: Iterable[Tuple[Any, ...]], pages_per_task: int = 1) -> List[T]:
+        """
+        Call the method of the reader `method_name(*task)` for every task in parallel,
+        the tasks (with pages images) are taken from the lazy iterable in a background thread,
+        see :func:`~dedoc.readers.pdf_reader.utils.page_pipeline.run_page_pipeline`.
+        If a task contains several pages (`pages_per_task`), fewer tasks are taken in advance, so the number of pages in flight is the same.
+
+        The page worker processes get only the data of the page and create their own reader (with the same config) once,
+        so this reader isn't pickled for every page.
+        """
+        import functools
+        from joblib import effective_n_jobs
+        from dedoc.readers.pdf_reader.utils.page_pipeline import run_page_pipeline
+
+        n_jobs = effective_n_jobs(self.config["n_jobs"])
+        if n_jobs == 1:
+            function = getattr(self, method_name)
+        else:
+            function = functools.partial(_process_page_in_worker, type(self), self.config, self.__worker_key, method_name)
+
+        max_pages_in_flight = self.config.get("pdf_max_pages_in_flight", 8) // max(1, pages_per_task)
+        return run_page_pipeline(function=function, tasks=tasks, n_jobs=n_jobs, max_pages_in_flight=max_pages_in_flight)
+
     def _shift_all_contents(self, lines: List[LineWithMeta], unref_tables: List[ScanTable], attachments: List[PdfImageAttachment],
                             gost_analyzed_images: Dict[int, Tuple[ndarray, BBox, Tuple[int, ...]]]) -> None:
         # shift unref_tables
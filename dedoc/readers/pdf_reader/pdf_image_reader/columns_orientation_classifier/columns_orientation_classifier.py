@@ -2,7 +2,7 @@ import logging
 import os
 import warnings
 from os import path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -101,18 +101,31 @@ class ColumnsOrientationClassifier(object):
         """
         Predict class orientation of input image
         """
+        return self.predict_batch([image])[0]
+
+    def predict_batch(self, images: List[np.ndarray], batch_size: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        Predict columns number and orientation of input images, images are classified by batches in one forward pass per batch
+
+        :param images: list of page images
+        :param batch_size: max number of images in one forward pass, all images are handled in one batch if None
+        :return: list of (columns, angle) predictions in the order of images
+        """
+        batch_size = len(images) if batch_size is None else max(1, batch_size)
+        result = []
         self.net.eval()
         with torch.no_grad():
-            tensor_image = self.get_features(image)
-            outputs = self.net(tensor_image)
-            # first 2 classes mean columns number
-            # last 4 classes mean orientation
-            columns_out, orientation_out = outputs[:, :2], outputs[:, 2:]
-
-            _, columns_predicted = torch.max(columns_out, 1)
-            _, orientation_predicted = torch.max(orientation_out, 1)
-
-        columns, orientation = int(columns_predicted[0]), int(orientation_predicted[0])
-        columns_predict = self.classes[columns]
-        angle_predict = self.classes[2 + orientation]
-        return columns_predict, angle_predict
+            for batch_start in range(0, len(images), batch_size):
+                tensor_images = torch.cat([self.get_features(image) for image in images[batch_start:batch_start + batch_size]])
+                outputs = self.net(tensor_images)
+                # first 2 classes mean columns number
+                # last 4 classes mean orientation
+                columns_out, orientation_out = outputs[:, :2], outputs[:, 2:]
+
+                _, columns_predicted = torch.max(columns_out, 1)
+                _, orientation_predicted = torch.max(orientation_out, 1)
+
+                for columns, orientation in zip(columns_predicted.tolist(), orientation_predicted.tolist()):
+                    result.append((self.classes[columns], self.classes[2 + orientation]))
+
+        return result
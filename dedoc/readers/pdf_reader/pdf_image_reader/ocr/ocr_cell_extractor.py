@@ -73,7 +73,7 @@ class OCRCellExtractor:
             os.makedirs(debug_dir, exist_ok=True)
             image_path = os.path.join(debug_dir, f"stacked_batch_image_{num_batch}.png")
             cv2.imwrite(image_path, concatenated)
-        ocr_result = get_text_with_bbox_from_cells(concatenated, language, ocr_conf_threshold=0.0)
+        ocr_result = get_text_with_bbox_from_cells(concatenated, language, ocr_conf_threshold=0.0, config=self.config)
 
         return ocr_result, chunk_boxes
 
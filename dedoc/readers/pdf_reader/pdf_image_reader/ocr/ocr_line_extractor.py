@@ -24,9 +24,9 @@ class OCRLineExtractor:
     def __split_image2bboxes(self, image: np.ndarray, page_num: int, language: str, is_one_column_document: bool) -> List[TextWithBBox]:
         ocr_conf_threshold = self.config.get("ocr_conf_threshold", -1)
         if is_one_column_document:
-            output_dict = get_text_with_bbox_from_document_page_one_column(image, language, ocr_conf_threshold)
+            output_dict = get_text_with_bbox_from_document_page_one_column(image, language, ocr_conf_threshold, config=self.config)
         else:
-            output_dict = get_text_with_bbox_from_document_page(image, language, ocr_conf_threshold)
+            output_dict = get_text_with_bbox_from_document_page(image, language, ocr_conf_threshold, config=self.config)
 
         height, width = image.shape[:2]
         extract_line_bbox = self.config.get("labeling_mode", False)
@@ -1,46 +1,67 @@
+from typing import Dict, List, Optional
+
 import numpy as np
 import pytesseract
 
 from dedoc.readers.pdf_reader.pdf_image_reader.ocr.ocr_page.ocr_page import OcrPage
+from dedoc.readers.pdf_reader.pdf_image_reader.ocr.tesseract_pool import get_tesseract_pool
+
+
+def image_to_data(image: np.ndarray, language: str, psm: int, config: Optional[dict] = None) -> Dict[str, List]:
+    """
+    Run Tesseract OCR on the image, the result has the format of `pytesseract.image_to_data` with `output_type=DICT`.
+    Long-lived tesseract workers are used if the pool is enabled (see `tesseract_pool_size` in the config),
+    otherwise a new tesseract process is started for the image.
+    :param image: document image
+    :param language: document language as rus, eng or rus+eng
+    :param psm: tesseract page segmentation mode
+    :param config: configuration of the caller (reader), the pool is disabled if it isn't given
+    :return:
+    """
+    pool = get_tesseract_pool({} if config is None else config)
+    if pool is not None:
+        return pool.image_to_data(image, language=language, psm=psm)
+
+    return pytesseract.image_to_data(image, lang=language, output_type=pytesseract.Output.DICT, config=f"--psm {psm}")
 
 
-def get_text_with_bbox_from_document_page_one_column(image: np.ndarray, language: str, ocr_conf_threshold: float) -> OcrPage:
+def get_text_with_bbox_from_document_page_one_column(image: np.ndarray, language: str, ocr_conf_threshold: float, config: Optional[dict] = None) -> OcrPage:
     """
     Extract text from image with Tesseract OCR.
     :param image: document image (assume that it is black and white text)
     :param language: document language as rus, eng or rus+eng
     :param ocr_conf_threshold: minimal confidence value
+    :param config: configuration of the caller (reader)
     :return:
     """
-    config = "--psm 4"
-    rec_dict = pytesseract.image_to_data(image, lang=language, output_type=pytesseract.Output.DICT, config=config)
+    rec_dict = image_to_data(image, language=language, psm=4, config=config)
 
     return OcrPage.from_dict(rec_dict, ocr_conf_threshold)
 
 
-def get_text_with_bbox_from_document_page(image: np.ndarray, language: str, ocr_conf_threshold: float = -1.0) -> OcrPage:
+def get_text_with_bbox_from_document_page(image: np.ndarray, language: str, ocr_conf_threshold: float = -1.0, config: Optional[dict] = None) -> OcrPage:
     """
     Extract text from image with Tesseract OCR.
     :param image: document image (assume that it is black and white text)
     :param language: document language as rus, eng or rus+eng
     :param ocr_conf_threshold: minimal confidence value
+    :param config: configuration of the caller (reader)
     :return:
     """
-    config = "--psm 3"
-    rec_dict = pytesseract.image_to_data(image, lang=language, output_type=pytesseract.Output.DICT, config=config)
+    rec_dict = image_to_data(image, language=language, psm=3, config=config)
 
     return OcrPage.from_dict(rec_dict, ocr_conf_threshold)
 
 
-def get_text_with_bbox_from_cells(image: np.ndarray, language: str, ocr_conf_threshold: float = -1.0) -> OcrPage:
+def get_text_with_bbox_from_cells(image: np.ndarray, language: str, ocr_conf_threshold: float = -1.0, config: Optional[dict] = None) -> OcrPage:
     """
     Extract text from image with Tesseract OCR.
     :param image: document image (assume that it is black and white text)
     :param language: document language as rus, eng or rus+eng
     :param ocr_conf_threshold: minimal confidence value
+    :param config: configuration of the caller (reader)
     :return:
     """
-    config = "--psm 6"
-    rec_dict = pytesseract.image_to_data(image, lang=language, output_type=pytesseract.Output.DICT, config=config)
+    rec_dict = image_to_data(image, language=language, psm=6, config=config)
 
     return OcrPage.from_dict(rec_dict, ocr_conf_threshold)
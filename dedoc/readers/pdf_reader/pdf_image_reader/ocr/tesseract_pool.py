@@ -0,0 +1,131 @@
+import logging
+import os
+import queue
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+TSV_HEADER = "level\tpage_num\tblock_num\tpar_num\tline_num\tword_num\tleft\ttop\twidth\theight\tconf\ttext"
+
+
+class TesseractPool:
+    """
+    Pool of long-lived tesseract workers keyed by language and page segmentation mode (psm).
+
+    Every worker is a tesseract API instance (`tesserocr` bindings) with already loaded traineddata,
+    images are passed to the worker in memory, so tesseract process start and model loading are paid once per worker
+    instead of every call. The result has the same format as `pytesseract.image_to_data` with `output_type=DICT`.
+    """
+
+    def __init__(self, max_workers: int = 1, logger: Optional[logging.Logger] = None) -> None:
+        """
+        :param max_workers: max number of workers for one (language, psm) pair
+        :param logger: logger
+        """
+        self.max_workers = max(1, max_workers)
+        self.logger = logger if logger is not None else logging.getLogger()
+
+        self.__lock = threading.Lock()
+        self.__free_workers = defaultdict(queue.LifoQueue)
+        self.__workers_count = defaultdict(int)
+
+    def image_to_data(self, image: np.ndarray, language: str, psm: int) -> Dict[str, List]:
+        """
+        Recognize the image by a free worker for the given language and psm (the call is blocked if all workers are busy).
+
+        :param image: image for OCR
+        :param language: tesseract language as rus, eng or rus+eng
+        :param psm: tesseract page segmentation mode
+        :return: dictionary with TSV columns (level, page_num, ..., conf, text) as keys
+        """
+        from PIL import Image
+
+        key = (language, psm)
+        worker = self.__acquire(key)
+        try:
+            worker.SetImage(Image.fromarray(image))
+            worker.Recognize()
+            tsv = worker.GetTSVText(0)
+        except Exception:
+            self.__remove(key, worker)
+            raise
+
+        self.__free_workers[key].put(worker)
+        return self.tsv_to_dict(tsv)
+
+    @staticmethod
+    def tsv_to_dict(tsv: str) -> Dict[str, List]:
+        """
+        Convert TSV text of tesseract (without header) to the dictionary like `pytesseract.image_to_data` does
+        """
+        from pytesseract.pytesseract import file_to_dict
+
+        return file_to_dict(f"{TSV_HEADER}\n{tsv}", "\t", -1)
+
+    def __acquire(self, key: Tuple[str, int]) -> "tesserocr.PyTessBaseAPI":  # noqa
+        free_workers = self.__free_workers[key]
+        try:
+            return free_workers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self.__lock:
+            need_new_worker = self.__workers_count[key] < self.max_workers
+            if need_new_worker:
+                self.__workers_count[key] += 1
+
+        if not need_new_worker:
+            return free_workers.get(block=True)
+
+        try:
+            return self.__create_worker(*key)
+        except Exception:
+            with self.__lock:
+                self.__workers_count[key] -= 1
+            raise
+
+    def __create_worker(self, language: str, psm: int) -> "tesserocr.PyTessBaseAPI":  # noqa
+        import tesserocr
+
+        self.logger.info(f"Starting tesseract worker for language={language}, psm={psm}")
+        kwargs = dict(lang=language, psm=psm)
+        tessdata_path = os.environ.get("TESSDATA_PREFIX")
+        if tessdata_path:
+            kwargs["path"] = tessdata_path
+        return tesserocr.PyTessBaseAPI(**kwargs)
+
+    def __remove(self, key: Tuple[str, int], worker: "tesserocr.PyTessBaseAPI") -> None:  # noqa
+        try:
+            worker.End()
+        finally:
+            with self.__lock:
+                self.__workers_count[key] -= 1
+
+
+_pools = {}
+_pools_pid = None
+_pools_lock = threading.Lock()
+
+
+def get_tesseract_pool(config: dict) -> Optional[TesseractPool]:
+    """
+    Get the tesseract pool of the current process for `tesseract_pool_size` from the given config (the config of the reader).
+    None is returned if the pool is disabled in the config (`tesseract_pool_size` is 0) or `tesserocr` isn't installed.
+    """
+    global _pools_pid
+    from importlib.util import find_spec
+
+    pool_size = config.get("tesseract_pool_size", 0)
+    if pool_size <= 0 or find_spec("tesserocr") is None:
+        return None
+
+    with _pools_lock:
+        # tesseract workers aren't shared with the forked processes
+        if _pools_pid != os.getpid():
+            _pools.clear()
+            _pools_pid = os.getpid()
+        if pool_size not in _pools:
+            _pools[pool_size] = TesseractPool(max_workers=pool_size, logger=config.get("logger", logging.getLogger()))
+        return _pools[pool_size]
@@ -1,5 +1,5 @@
 import os
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 from numpy import ndarray
 
@@ -31,6 +31,7 @@ class PdfImageReader(PdfBaseReader):
 
     It isn't recommended to use this reader for extracting content from PDF documents with a correct textual layer, use other PDF readers instead.
     """
+    recognized_formats = ("image_like_format", "pdf_like_format")
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
         from dedocutils.preprocessing import AdaptiveBinarizer, SkewCorrector
@@ -57,18 +58,47 @@ class PdfImageReader(PdfBaseReader):
     def read(self, file_path: str, parameters: Optional[dict] = None) -> UnstructuredDocument:
         return super().read(file_path, parameters)
 
+    def _process_pages(self, images: Iterator[ndarray], first_page: int, parameters: ParametersForParseDoc, path: str) \
+            -> List[Tuple[List[LineWithLocation], List[ScanTable], List[PdfImageAttachment], List[float]]]:
+        """
+        Process pages images by chunks of `orientation_batch_size` pages:
+        columns and orientation of all pages of the chunk are predicted in one forward pass of the classifier (in the background thread of the page pipeline),
+        then the pages are processed by the page workers
+        """
+        from itertools import islice
+
+        need_classification = parameters.is_one_column_document is None or parameters.document_orientation is None
+        batch_size = max(1, self.config.get("orientation_batch_size", 1))
+        images = iter(images)
+
+        def get_tasks() -> Iterator[Tuple[ndarray, ParametersForParseDoc, int, str, Optional[Tuple[int, int]]]]:
+            page_number = first_page
+            while True:
+                batch = list(islice(images, batch_size))
+                if not batch:
+                    return
+
+                predictions = self.column_orientation_classifier.predict_batch(batch) if need_classification else [None] * len(batch)
+                for i, (image, columns_orientation) in enumerate(zip(batch, predictions)):
+                    yield image, parameters, page_number + i, path, columns_orientation
+                page_number += len(batch)
+
+        return self._run_page_pipeline("_process_one_page", get_tasks())
+
     def _process_one_page(self,
                           image: ndarray,
                           parameters: ParametersForParseDoc,
                           page_number: int,
-                          path: str) -> Tuple[List[LineWithLocation], List[ScanTable], List[PdfImageAttachment], List[float]]:
+                          path: str,
+                          columns_orientation: Optional[Tuple[int, int]] = None) \
+            -> Tuple[List[LineWithLocation], List[ScanTable], List[PdfImageAttachment], List[float]]:
         import os
         from datetime import datetime
         import cv2
         from dedoc.utils.parameter_utils import get_path_param
 
         #  --- Step 1: correct orientation and detect column count ---
-        rotated_image, is_one_column_document, angle = self._detect_column_count_and_orientation(image, parameters)
+        rotated_image, is_one_column_document, angle = self._detect_column_count_and_orientation(image, parameters, columns_orientation)
         if self.config.get("debug_mode", False):
             self.logger.info(f"Angle page rotation = {angle}")
 
@@ -96,12 +126,16 @@ class PdfImageReader(PdfBaseReader):
         lines = self.metadata_extractor.extract_metadata_and_set_annotations(page_with_lines=page)
         return lines, tables, page.attachments, [angle]
 
-    def _detect_column_count_and_orientation(self, image: ndarray, parameters: ParametersForParseDoc) -> Tuple[ndarray, bool, float]:
+    def _detect_column_count_and_orientation(self,
+                                             image: ndarray,
+                                             parameters: ParametersForParseDoc,
+                                             columns_orientation: Optional[Tuple[int, int]] = None) -> Tuple[ndarray, bool, float]:
         """
         Function :
             - detects the number of page columns
             - detects page orientation angle
             - rotates the page on detected angle
+        If columns_orientation (columns, angle) is already predicted for the page (e.g. in a batch), the classifier isn't called.
         Return: rotated_image and indicator if the page is one-column
         """
         import os
@@ -112,7 +146,7 @@ class PdfImageReader(PdfBaseReader):
         columns, angle = None, None
 
         if parameters.is_one_column_document is None or parameters.document_orientation is None:
-            columns, angle = self.column_orientation_classifier.predict(image)
+            columns, angle = self.column_orientation_classifier.predict(image) if columns_orientation is None else columns_orientation
             self.logger.info(f"Predicted orientation angle = {angle}, columns = {columns}")
 
         is_one_column_document = columns == 1 if parameters.is_one_column_document is None else parameters.is_one_column_document
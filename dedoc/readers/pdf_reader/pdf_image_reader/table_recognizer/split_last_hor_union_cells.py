@@ -1,5 +1,5 @@
 import copy
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 from dedocutils.data_structures.bbox import BBox
@@ -11,7 +11,7 @@ from dedoc.readers.pdf_reader.pdf_image_reader.ocr.ocr_cell_extractor import OCR
 from dedoc.readers.pdf_reader.pdf_image_reader.ocr.ocr_utils import get_text_with_bbox_from_cells
 
 
-def split_last_column(matrix_table: List[List[Cell]], language: str, image: np.array) -> List[List[Cell]]:
+def split_last_column(matrix_table: List[List[Cell]], language: str, image: np.array, config: Optional[dict] = None) -> List[List[Cell]]:
     """
                   A         B       C       D
             --------------------------------------
@@ -57,7 +57,7 @@ def split_last_column(matrix_table: List[List[Cell]], language: str, image: np.a
 
         if row_id == len(last_column) - 1 and len(union_cells) > 1 or cell.id_con != prev_cell.id_con and len(union_cells) > 1:
             result_matrix[start_union_cell:start_union_cell + len(union_cells)] = \
-                _split_each_row(union_cells, matrix_table[start_union_cell:start_union_cell + len(union_cells)], language=language, image=image)
+                _split_each_row(union_cells, matrix_table[start_union_cell:start_union_cell + len(union_cells)], language=language, image=image, config=config)
             union_cells = [cell]
             start_union_cell = -1
 
@@ -74,7 +74,7 @@ def split_last_column(matrix_table: List[List[Cell]], language: str, image: np.a
     return result_matrix
 
 
-def _split_each_row(union_cells: List[Cell], matrix_table: List[List[Cell]], language: str, image: np.array) -> List[List[Cell]]:
+def _split_each_row(union_cells: List[Cell], matrix_table: List[List[Cell]], language: str, image: np.array, config: Optional[dict]) -> List[List[Cell]]:
     assert len(union_cells) == len(matrix_table)
     if len(matrix_table[0]) < 1:
         return matrix_table
@@ -109,7 +109,8 @@ def _split_each_row(union_cells: List[Cell], matrix_table: List[List[Cell]], lan
                     _split_row(cell_splitter=matrix_table[row_id][col_id],
                                union_cell=matrix_table[row_id][end_union_cell:start_union_cell + 1],
                                language=language,
-                               image=image)
+                               image=image,
+                               config=config)
 
                 union_cells = []
                 start_union_cell, end_union_cell = -1, -1
@@ -121,7 +122,7 @@ def _split_each_row(union_cells: List[Cell], matrix_table: List[List[Cell]], lan
     return result_matrix
 
 
-def _split_row(cell_splitter: Cell, union_cell: List[Cell], language: str, image: np.array) -> List[Cell]:
+def _split_row(cell_splitter: Cell, union_cell: List[Cell], language: str, image: np.array, config: Optional[dict]) -> List[Cell]:
     if len(union_cell) == 0:
         return union_cell
 
@@ -148,16 +149,18 @@ def _split_row(cell_splitter: Cell, union_cell: List[Cell], language: str, image
         result_row[col_id].lines = __get_ocr_lines(cell_image, language, page_image=image,
                                                    cell_bbox=BBox(x_top_left=x_left, y_top_left=y_top_split,
                                                                   width=x_right - x_left, height=y_bottom_split - y_top_split),
-                                                   padding_cell_value=padding_value)
+                                                   padding_cell_value=padding_value,
+                                                   config=config)
 
         col_id -= 1
 
     return result_row
 
 
-def __get_ocr_lines(cell_image: np.ndarray, language: str, page_image: np.ndarray, cell_bbox: BBox, padding_cell_value: int) -> List[LineWithMeta]:
+def __get_ocr_lines(cell_image: np.ndarray, language: str, page_image: np.ndarray, cell_bbox: BBox, padding_cell_value: int, config: Optional[dict]) \
+        -> List[LineWithMeta]:
 
-    ocr_result = get_text_with_bbox_from_cells(cell_image, language)
+    ocr_result = get_text_with_bbox_from_cells(cell_image, language, config=config)
     cell_lines = []
     for line in list(ocr_result.lines):
         text_line = OCRCellExtractor.get_line_with_meta("")
@@ -15,17 +15,15 @@ class MultiPageTableExtractor(BaseTableExtractor):
 
     def __init__(self, *, config: dict, logger: logging.Logger) -> None:
         super().__init__(config=config, logger=logger)
-        self.single_tables = [[]]  # simple tables on all pages
 
     def extract_multipage_tables(self, single_tables: List[ScanTable], lines_with_meta: List[LineWithMeta]) -> List[ScanTable]:
-        self.single_tables = single_tables
         multipages_tables = []
         list_page_with_tables = []
         total_pages = max((table.location.page_number + 1 for table in single_tables), default=0)
         for cur_page in range(total_pages):
             # 1. get possible diapason of neighbors pages with tables
             # pages distribution
-            list_mp_table = [t for t in self.single_tables if t.location.page_number == cur_page]
+            list_mp_table = [t for t in single_tables if t.location.page_number == cur_page]
             list_page_with_tables.append(list_mp_table)
 
         total_cur_page = 0
@@ -1,6 +1,6 @@
 import copy
 import logging
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 
@@ -21,13 +21,10 @@ class OnePageTableExtractor(BaseTableExtractor):
     def __init__(self, *, config: dict, logger: logging.Logger) -> None:
         super().__init__(config=config, logger=logger)
 
-        self.image = None
-        self.page_number = 0
         self.table_header_extractor = TableHeaderExtractor(logger=self.logger)
         self.count_vertical_extended = 0
         self.splitter = CellSplitter()
         self.table_options = TableTypeAdditionalOptions()
-        self.language = "rus"
 
     def extract_onepage_tables_from_image(self, image: np.ndarray, page_number: int, language: str, table_type: str) -> List[ScanTable]:
         """
@@ -37,13 +34,9 @@ class OnePageTableExtractor(BaseTableExtractor):
         :param language: language for Tesseract
         :return: List[ScanTable]
         """
-        self.image = image
-        self.page_number = page_number
-        self.language = language
-
         # Read the image
         tables_tree, contours, angle_rotate = detect_tables_by_contours(image, language=language, config=self.config, table_type=table_type)
-        tables = self.__build_structure_table_from_tree(tables_tree=tables_tree, table_type=table_type)
+        tables = self.__build_structure_table_from_tree(tables_tree=tables_tree, table_type=table_type, page_number=page_number, language=language, image=image)
 
         for table in tables:
             for location in table.locations:
@@ -52,7 +45,7 @@ class OnePageTableExtractor(BaseTableExtractor):
 
         return tables
 
-    def __get_matrix_table_from_tree(self, table_tree: TableTree) -> ScanTable:
+    def __get_matrix_table_from_tree(self, table_tree: TableTree, page_number: int) -> ScanTable:
         """
         Function builds matrix table from sorted cells of the tree table
         :param table_tree: tree of cells
@@ -73,27 +66,27 @@ class OnePageTableExtractor(BaseTableExtractor):
         for i, row in enumerate(matrix):
             matrix[i] = sorted(row, key=lambda cell: cell.bbox.x_top_left, reverse=False)
 
-        matrix_table = ScanTable(cells=matrix, bbox=table_tree.cell_box, page_number=self.page_number)
+        matrix_table = ScanTable(cells=matrix, bbox=table_tree.cell_box, page_number=page_number)
 
         return matrix_table
 
-    def __build_structure_table_from_tree(self, tables_tree: TableTree, table_type: str) -> List[ScanTable]:
+    def __build_structure_table_from_tree(self, tables_tree: TableTree, table_type: str, page_number: int, language: str, image: np.ndarray) -> List[ScanTable]:
         """
         Parsing all tables that exist in the tables_tree
         """
         tables = []
         for table_tree in tables_tree.children:
             try:
-                table = self.__get_matrix_table_from_tree(table_tree)
-                table.cells = self.handle_cells(table.cells, table_type)
+                table = self.__get_matrix_table_from_tree(table_tree, page_number=page_number)
+                table.cells = self.handle_cells(table.cells, table_type, language=language, image=image)
                 tables.append(table)
             except Exception as ex:
-                self.logger.warning(f"Warning: unrecognized table into page {self.page_number}. {ex}")
+                self.logger.warning(f"Warning: unrecognized table into page {page_number}. {ex}")
                 if self.config.get("debug_mode", False):
                     raise ex
         return tables
 
-    def handle_cells(self, cells: List[List[Cell]], table_type: str = "") -> List[List[Cell]]:
+    def handle_cells(self, cells: List[List[Cell]], table_type: str = "", language: str = "rus", image: Optional[np.ndarray] = None) -> List[List[Cell]]:
         # Эвристика 1: Таблица должна состоять из 1 строк и более
         if len(cells) < 1:
             raise RecognizeError("Invalid recognized table")
@@ -106,7 +99,7 @@ class OnePageTableExtractor(BaseTableExtractor):
 
         # Postprocess table
         if self.table_options.split_last_column in table_type:
-            cells = split_last_column(cells, language=self.language, image=self.image)
+            cells = split_last_column(cells, language=language, image=image, config=self.config)
 
         self.table_header_extractor.set_header_cells(cells)
 
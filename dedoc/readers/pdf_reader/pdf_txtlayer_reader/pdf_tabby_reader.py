@@ -12,6 +12,7 @@ from dedoc.data_structures.table import Table
 from dedoc.data_structures.unstructured_document import UnstructuredDocument
 from dedoc.readers.pdf_reader.data_classes.line_with_location import LineWithLocation
 from dedoc.readers.pdf_reader.data_classes.pdf_image_attachment import PdfImageAttachment
+from dedoc.readers.pdf_reader.data_classes.tabby_extracted_pages import TabbyExtractedPages
 from dedoc.readers.pdf_reader.data_classes.tables.scantable import ScanTable
 from dedoc.readers.pdf_reader.pdf_base_reader import ParametersForParseDoc, PdfBaseReader
 
@@ -25,6 +26,7 @@ class PdfTabbyReader(PdfBaseReader):
     if you don't need to check textual layer correctness.
     For more information, look to `pdf_with_text_layer` option description in :ref:`pdf_handling_parameters`.
     """
+    recognized_formats = ("pdf_like_format",)
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
         import os
@@ -33,6 +35,7 @@ class PdfTabbyReader(PdfBaseReader):
             OnePageTableExtractor
         from dedoc.readers.pdf_reader.pdf_image_reader.table_recognizer.table_extractors.concrete_extractors.table_attribute_extractor import \
             TableHeaderExtractor
+        from dedoc.readers.pdf_reader.pdf_txtlayer_reader.tabbypdf.tabby_service import get_tabby_service
 
         super().__init__(config=config, recognized_extensions=recognized_extensions.pdf_like_format, recognized_mimes=recognized_mimes.pdf_like_format)
         self.tabby_java_version = "2.0.0"
@@ -42,6 +45,7 @@ class PdfTabbyReader(PdfBaseReader):
         self.default_config = {"JAR_PATH": os.path.join(self.jar_dir, self.jar_name)}
         self.table_header_selector = TableHeaderExtractor(logger=self.logger)
         self.table_extractor = OnePageTableExtractor(config=config, logger=self.logger)
+        self.tabby_service = get_tabby_service(jar_path=self.__jar_path(), config=self.config)
 
     def can_read(self, file_path: Optional[str] = None, mime: Optional[str] = None, extension: Optional[str] = None, parameters: Optional[dict] = None) -> bool:
         """
@@ -55,13 +59,16 @@ class PdfTabbyReader(PdfBaseReader):
         from dedoc.utils.parameter_utils import get_param_pdf_with_txt_layer
         return super().can_read(file_path=file_path, mime=mime, extension=extension) and get_param_pdf_with_txt_layer(parameters) == "tabby"
 
-    def read(self, file_path: str, parameters: Optional[dict] = None) -> UnstructuredDocument:
+    def read(self, file_path: str, parameters: Optional[dict] = None, extracted_pages: Optional[TabbyExtractedPages] = None) -> UnstructuredDocument:
         """
         The method return document content with all document's lines, tables and attachments.
         This reader is able to add some additional information to the `tag_hierarchy_level` of :class:`~dedoc.data_structures.LineMetadata`.
         Look to the documentation of :meth:`~dedoc.readers.BaseReader.read` to get information about the method's parameters.
 
         You can also see :ref:`pdf_handling_parameters` to get more information about `parameters` dictionary possible arguments.
+
+        :param extracted_pages: pages of the document extracted by :meth:`extract_pages` before, they are used instead of running java \
+        for the same pages again (java is run only for the rest pages)
         """
         import tempfile
         from dedoc.utils.parameter_utils import get_param_with_attachments
@@ -69,7 +76,11 @@ class PdfTabbyReader(PdfBaseReader):
         warnings = []
 
         with tempfile.TemporaryDirectory() as tmp_dir:
-            lines, tables, attachments, document_metadata = self.__extract(path=file_path, parameters=parameters, warnings=warnings, tmp_dir=tmp_dir)
+            lines, tables, attachments, document_metadata = self.__extract(path=file_path,
+                                                                           parameters=parameters,
+                                                                           warnings=warnings,
+                                                                           tmp_dir=tmp_dir,
+                                                                           extracted_pages=extracted_pages)
 
         if get_param_with_attachments(parameters) and self.attachment_extractor.can_extract(file_path):
             attachments += self.attachment_extractor.extract(file_path=file_path, parameters=parameters)
@@ -80,11 +91,36 @@ class PdfTabbyReader(PdfBaseReader):
 
         return self._postprocess(result)
 
-    def __extract(self, path: str, parameters: dict, warnings: List[str], tmp_dir: str)\
-            -> Tuple[List[LineWithMeta], List[Table], List[PdfImageAttachment], Optional[dict]]:
+    def extract_pages(self, file_path: str, parameters: Optional[dict] = None) -> TabbyExtractedPages:
+        """
+        Run java extraction for the pages given in `parameters` (all pages by default) without handling its output.
+        The result can be given to :meth:`read` in order to read these pages without running java again, it should be closed after use.
+        """
         import math
+        import tempfile
         from dedoc.utils.pdf_utils import get_pdf_page_count
-        from dedoc.utils.utils import calculate_file_hash
+        from dedoc.utils.parameter_utils import get_param_page_slice, get_param_need_gost_frame_analysis
+
+        parameters = {} if parameters is None else parameters
+        page_count = get_pdf_page_count(file_path)
+        page_count = math.inf if page_count is None else page_count
+        first_page, last_page = get_param_page_slice(parameters)
+        start_page, end_page = self.__get_tabby_pages_range(first_page=first_page, last_page=last_page, page_count=page_count)
+        remove_gost_frame = get_param_need_gost_frame_analysis(parameters)
+
+        tmp_dir = tempfile.TemporaryDirectory()
+        try:
+            pages = self.__get_pages(path=file_path, start_page=start_page, end_page=end_page, page_count=page_count, remove_frame=remove_gost_frame,
+                                     tmp_dir=tmp_dir.name)
+        except Exception:
+            tmp_dir.cleanup()
+            raise
+        return TabbyExtractedPages(path=file_path, start_page=start_page, end_page=end_page, remove_frame=remove_gost_frame, pages=pages, tmp_dir=tmp_dir)
+
+    def __extract(self, path: str, parameters: dict, warnings: List[str], tmp_dir: str, extracted_pages: Optional[TabbyExtractedPages])\
+            -> Tuple[List[LineWithMeta], List[Table], List[PdfImageAttachment], Optional[dict]]:
+        import math
+        from dedoc.utils.pdf_utils import get_pdf_context
         from dedoc.utils.parameter_utils import get_param_page_slice, get_param_with_attachments
         from dedoc.utils.parameter_utils import get_param_need_gost_frame_analysis
 
@@ -92,8 +128,8 @@ class PdfTabbyReader(PdfBaseReader):
         with_attachments = get_param_with_attachments(parameters)
         document_metadata = None
 
-        file_hash = calculate_file_hash(path=path)
-        page_count = get_pdf_page_count(path)
+        with get_pdf_context(path) as pdf_context:
+            file_hash, page_count = pdf_context.file_hash, pdf_context.page_count
         page_count = math.inf if page_count is None else page_count
         first_page, last_page = get_param_page_slice(parameters)
 
@@ -109,21 +145,15 @@ class PdfTabbyReader(PdfBaseReader):
                 return all_lines, all_tables, all_attached_images, document_metadata
 
         remove_gost_frame = get_param_need_gost_frame_analysis(parameters)
-        gost_json_path = self.__save_gost_frame_boxes_to_json(first_page=first_page, last_page=last_page, page_count=page_count, tmp_dir=tmp_dir, path=path) \
-            if remove_gost_frame else ""
-
-        # in java tabby reader page numeration starts with 1, end_page is included
-        first_tabby_page = first_page + 1 if first_page is not None else 1
-        last_tabby_page = page_count if (last_page is None) or (last_page is not None and last_page > page_count) else last_page
-        self.logger.info(f"Reading PDF pages from {first_tabby_page} to {last_tabby_page}")
-        document = self.__process_pdf(path=path,
-                                      start_page=first_tabby_page,
-                                      end_page=last_tabby_page,
-                                      tmp_dir=tmp_dir,
-                                      gost_json_path=gost_json_path,
-                                      remove_frame=remove_gost_frame)
+        first_tabby_page, last_tabby_page = self.__get_tabby_pages_range(first_page=first_page, last_page=last_page, page_count=page_count)
+        pages = self.__get_pages(path=path,
+                                 start_page=first_tabby_page,
+                                 end_page=last_tabby_page,
+                                 page_count=page_count,
+                                 remove_frame=remove_gost_frame,
+                                 tmp_dir=tmp_dir,
+                                 extracted_pages=extracted_pages)
 
-        pages = document.get("pages", [])
         for page in pages:
             page_lines = self.__get_lines_with_location(page, file_hash)
             if page_lines:
@@ -140,6 +170,43 @@ class PdfTabbyReader(PdfBaseReader):
 
         return all_lines, mp_tables, all_attached_images, document_metadata
 
+    def __get_tabby_pages_range(self, first_page: Optional[int], last_page: Optional[int], page_count: int) -> Tuple[int, int]:
+        # in java tabby reader page numeration starts with 1, end_page is included
+        first_tabby_page = first_page + 1 if first_page is not None else 1
+        last_tabby_page = page_count if (last_page is None) or (last_page is not None and last_page > page_count) else last_page
+        return first_tabby_page, last_tabby_page
+
+    def __get_pages(self,
+                    path: str,
+                    start_page: int,
+                    end_page: int,
+                    page_count: int,
+                    remove_frame: bool,
+                    tmp_dir: str,
+                    extracted_pages: Optional[TabbyExtractedPages] = None) -> List[dict]:
+        reused_pages = []
+        if extracted_pages is not None and extracted_pages.can_be_reused(path=path, start_page=start_page, remove_frame=remove_frame):
+            reused_pages = [page for page in extracted_pages.pages if start_page <= page["number"] + 1 <= end_page]
+            self.logger.info(f"Reusing extracted PDF pages from {start_page} to {min(end_page, extracted_pages.end_page)}")
+            start_page = extracted_pages.end_page + 1
+
+        if start_page > end_page:
+            return reused_pages
+
+        gost_json_path = ""
+        if remove_frame:
+            gost_json_path = self.__save_gost_frame_boxes_to_json(first_page=start_page - 1, last_page=end_page, page_count=page_count,
+                                                                  tmp_dir=tmp_dir, path=path)
+
+        self.logger.info(f"Reading PDF pages from {start_page} to {end_page}")
+        document = self.__process_pdf(path=path,
+                                      start_page=start_page,
+                                      end_page=end_page,
+                                      tmp_dir=tmp_dir,
+                                      gost_json_path=gost_json_path,
+                                      remove_frame=remove_frame)
+        return reused_pages + document.get("pages", [])
+
     def __save_gost_frame_boxes_to_json(self, first_page: Optional[int], last_page: Optional[int], page_count: int, path: str, tmp_dir: str) -> str:
         from joblib import Parallel, delayed
         import json
@@ -210,7 +277,7 @@ class PdfTabbyReader(PdfBaseReader):
                 cells = self.table_extractor.handle_cells(cells)
                 scan_tables.append(ScanTable(page_number=page_number, cells=cells, bbox=table_bbox, order=order))
             except Exception as ex:
-                self.logger.warning(f"Warning: unrecognized table on page {self.page_number}. {ex}")
+                self.logger.warning(f"Warning: unrecognized table on page {page_number}. {ex}")
                 if self.config.get("debug_mode", False):
                     raise ex
 
@@ -342,13 +409,19 @@ class PdfTabbyReader(PdfBaseReader):
               ) -> bytes:
         import subprocess
 
-        args = ["java"] + ["-jar", self.__jar_path(), "-i", path, "-tmp", f"{tmp_dir}/"]
+        args = ["-i", path, "-tmp", f"{tmp_dir}/"]
         if remove_frame:
             args += ["-rf", gost_json_path]
         if start_page is not None and end_page is not None:
             args += ["-sp", str(start_page), "-ep", str(end_page)]
+
+        # long-lived JVM is used if it's enabled, java subprocess is the fallback (documents failed inside the service aren't handled again)
+        if self.tabby_service is not None and self.tabby_service.run(args):
+            return b""
+
         try:
-            result = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, stdin=subprocess.DEVNULL, check=True)
+            command = ["java", "-jar", self.__jar_path()] + args
+            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, stdin=subprocess.DEVNULL, check=True)
             if result.stderr:
                 self.logger.warning(f"Got stderr: {result.stderr.decode(encoding)}")
             return result.stdout
@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 from dedocutils.data_structures import BBox
 from numpy import ndarray
@@ -8,6 +8,7 @@ from dedoc.readers.pdf_reader.data_classes.line_with_location import LineWithLoc
 from dedoc.readers.pdf_reader.data_classes.pdf_image_attachment import PdfImageAttachment
 from dedoc.readers.pdf_reader.data_classes.tables.scantable import ScanTable
 from dedoc.readers.pdf_reader.pdf_base_reader import ParametersForParseDoc, PdfBaseReader
+from dedoc.readers.pdf_reader.pdf_txtlayer_reader.pdfminer_reader.pdfminer_extractor import PdfminerPageLayout
 
 
 class PdfTxtlayerReader(PdfBaseReader):
@@ -17,6 +18,7 @@ class PdfTxtlayerReader(PdfBaseReader):
 
     For more information, look to `pdf_with_text_layer` option description in :ref:`pdf_handling_parameters`.
     """
+    recognized_formats = ("pdf_like_format",)
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
         from dedoc.extensions import recognized_extensions, recognized_mimes
@@ -41,11 +43,50 @@ class PdfTxtlayerReader(PdfBaseReader):
     def read(self, file_path: str, parameters: Optional[dict] = None) -> UnstructuredDocument:
         return super().read(file_path, parameters)
 
+    def _process_pages(self, images: Iterator[ndarray], first_page: int, parameters: ParametersForParseDoc, path: str) \
+            -> List[Tuple[List[LineWithLocation], List[ScanTable], List[PdfImageAttachment], List[float]]]:
+        """
+        Pages are processed in parallel by contiguous ranges, the page worker analyzes the text layer of the range in a single forward pass
+        over the pdf file, which stays opened for the next ranges (see :meth:`PdfminerExtractor.get_page_layouts`),
+        so the pages aren't enumerated from the beginning of the document for every page.
+        """
+        import itertools
+        from joblib import effective_n_jobs
+
+        # ranges are small enough for all the page workers to be busy within the limit of pages in flight
+        n_jobs = effective_n_jobs(self.config["n_jobs"])
+        pages_per_task = 1 if n_jobs == 1 else max(1, self.config.get("pdf_max_pages_in_flight", 8) // (2 * n_jobs))
+
+        def get_tasks() -> Iterator[Tuple[List[ndarray], ParametersForParseDoc, int, str]]:
+            images_iterator = iter(images)
+            for page_number in itertools.count(first_page, pages_per_task):
+                page_images = list(itertools.islice(images_iterator, pages_per_task))
+                if not page_images:
+                    return
+                yield page_images, parameters, page_number, path
+
+        try:
+            results = self._run_page_pipeline("_process_page_range", get_tasks(), pages_per_task=pages_per_task)
+        finally:
+            self.extractor_layer.close_document(path)
+        return [page_result for range_results in results for page_result in range_results]
+
+    def _process_page_range(self, images: List[ndarray], parameters: ParametersForParseDoc, first_page: int, path: str) \
+            -> List[Tuple[List[LineWithLocation], List[ScanTable], List[PdfImageAttachment], List[float]]]:
+        page_layouts = self.extractor_layer.get_page_layouts(path=path, first_page=first_page, last_page=first_page + len(images))
+        results = []
+        for page_number, image in enumerate(images, start=first_page):
+            page_layout = next(page_layouts, None)
+            results.append(self._process_one_page(image, parameters, page_number, path, page_layout) if page_layout is not None else ([], [], [], []))
+        return results
+
     def _process_one_page(self,
                           image: ndarray,
                           parameters: ParametersForParseDoc,
                           page_number: int,
-                          path: str) -> Tuple[List[LineWithLocation], List[ScanTable], List[PdfImageAttachment], List[float]]:
+                          path: str,
+                          page_layout: Optional[PdfminerPageLayout] = None) \
+            -> Tuple[List[LineWithLocation], List[ScanTable], List[PdfImageAttachment], List[float]]:
         if parameters.need_pdf_table_analysis:
             gray_image = self._convert_to_gray(image)
             cleaned_image, tables = self.table_recognizer.recognize_tables_from_image(
@@ -57,12 +98,15 @@ class PdfTxtlayerReader(PdfBaseReader):
         else:
             tables = []
 
-        page = self.extractor_layer.extract_text_layer(path=path, page_number=page_number, parameters=parameters)
+        # the image of the page rasterized in _get_images is reused by the extractor (the image is changed by the gost frame analysis)
+        page_image = None if parameters.need_gost_frame_analysis else image
+        page = self.extractor_layer.extract_text_layer(path=path, page_number=page_number, parameters=parameters, page_layout=page_layout,
+                                                       page_image=page_image)
         if page is None:
             return [], [], [], []
         if parameters.need_gost_frame_analysis:
-            page_shift = self.gost_frame_boxes[page_number][0]
-            self._move_table_cells(tables=tables, page_shift=page_shift, page=self.gost_frame_boxes[page_number][1])
+            page_shift, page_shape = parameters.gost_frame_boxes[page_number]
+            self._move_table_cells(tables=tables, page_shift=page_shift, page=page_shape)
             self.__change_table_boxes_page_width_heigth(pdf_width=page.pdf_page_width, pdf_height=page.pdf_page_height, tables=tables)
             readable_block = page_shift  # bbox representing the content of the gost frame
             page.bboxes = [bbox for bbox in page.bboxes if self._inside_any_unreadable_block(bbox.bbox, [readable_block])]  # exclude boxes outside the frame
@@ -2,6 +2,7 @@ import binascii
 import itertools
 import logging
 import os
+import threading
 import uuid
 from collections import namedtuple
 from typing import BinaryIO, Iterator, List, Optional, Tuple
@@ -35,6 +36,33 @@ from dedoc.utils.pdf_utils import get_page_image
 
 logging.getLogger("pdfminer").setLevel(logging.ERROR)
 WordObj = namedtuple("Word", ["start", "end", "value"])
+PdfminerPageLayout = namedtuple("PdfminerPageLayout", ["page_number", "layout", "mediabox"])
+
+
+class _OpenedDocument:
+    """
+    Pdf document opened by pdfminer, its pages are enumerated forward, `next_page` is the number of the next page of the `pages` iterator
+    """
+
+    def __init__(self, path: str, device: PDFPageAggregator, interpreter: PDFPageInterpreter) -> None:
+        self.path = path
+        self.file_id = self.__get_file_id(path)
+        self.file = open(path, "rb")
+        self.pages = PDFPage.get_pages(self.file)
+        self.next_page = 0
+        self.device, self.interpreter = device, interpreter
+
+    def can_analyze(self, path: str, page_number: int) -> bool:
+        return self.path == path and page_number >= self.next_page and not self.file.closed and self.file_id == self.__get_file_id(path)
+
+    @staticmethod
+    def __get_file_id(path: str) -> Tuple[int, int, int]:
+        stat = os.stat(path)
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+# the document opened in the thread (e.g. in the page worker process) for the analysis of the next pages
+_opened_documents = threading.local()
 
 
 class PdfminerExtractor:
@@ -50,43 +78,85 @@ class PdfminerExtractor:
     def get_pages(fp: BinaryIO) -> Iterator[PDFPage]:
         return PDFPage.get_pages(fp)
 
-    def extract_text_layer(self, path: str, page_number: int, parameters: ParametersForParseDoc) -> Optional[PageWithBBox]:
+    def extract_text_layer(self,
+                           path: str,
+                           page_number: int,
+                           parameters: ParametersForParseDoc,
+                           page_layout: Optional[PdfminerPageLayout] = None,
+                           page_image: Optional[np.ndarray] = None) -> Optional[PageWithBBox]:
         """
         Extract text information with metadata from pdf with help pdfminer.six
         :param path: path to pdf
         :param page_number: number of the page to read
         :param parameters: parameters of document parsing
+        :param page_layout: layout of the page obtained by :meth:`get_page_layouts`, if None, the page is analyzed by :meth:`get_page_layouts`
+        :param page_image: already rasterized image of the whole page (with default DPI), if None, the page is rasterized again
         :return: pages_with_bbox - page with extracted text
         """
-        with open(path, "rb") as fp:
-            pages = PdfminerExtractor.get_pages(fp)
-            for page_num, page in enumerate(pages):
-                if page_num != page_number:
-                    continue
-                return self.__handle_page(page=page, page_number=page_number, path=path, parameters=parameters)
-
-    def __handle_page(self, page: PDFPage, page_number: int, path: str, parameters: ParametersForParseDoc) -> PageWithBBox:
-        device, interpreter = self.__get_interpreter()
-        try:
-            interpreter.process_page(page)
-        except Exception as e:
-            raise BadFileFormatError(f"can't handle file {path} get {e}")
+        if page_layout is None:
+            page_layout = next(self.get_page_layouts(path=path, first_page=page_number, last_page=page_number + 1), None)
+        if page_layout is None:
+            return None
+        return self.__handle_page(page_layout=page_layout, path=path, parameters=parameters, page_image=page_image)
+
+    def get_page_layouts(self, path: str, first_page: int, last_page: float) -> Iterator[PdfminerPageLayout]:
+        """
+        Analyze the layout of the contiguous range of pages of the pdf document.
+        The document stays opened in the current thread after the analysis (until the other document is analyzed or :meth:`close_document` is called),
+        the same resource manager (with cached fonts) and interpreter are used for all pages.
+        So if the next range of pages of the same document is analyzed in this thread, the page tree isn't enumerated from the beginning again:
+        a page worker opens the document once and analyzes all its ranges of pages in a single forward pass.
 
-        layout = device.get_result()
-        image_page = self.__get_image(path=path, page_num=page_number)
+        :param path: path to pdf
+        :param first_page: number of the first page to analyze (numeration starts with 0)
+        :param last_page: number of the page after the last page to analyze (math.inf for all the rest pages)
+        :return: iterator over layouts of the pages in the order of pages
+        """
+        document = getattr(_opened_documents, "document", None)
+        if document is None or not document.can_analyze(path=path, page_number=first_page):
+            self.close_document()
+            device, interpreter = self.__get_interpreter()
+            document = _opened_documents.document = _OpenedDocument(path=path, device=device, interpreter=interpreter)
+
+        while document.next_page < last_page:
+            page = next(document.pages, None)
+            if page is None:
+                break
+            page_number, document.next_page = document.next_page, document.next_page + 1
+            if page_number < first_page:
+                continue
+            try:
+                document.interpreter.process_page(page)
+            except Exception as e:
+                raise BadFileFormatError(f"can't handle file {path} get {e}")
+            yield PdfminerPageLayout(page_number=page_number, layout=document.device.get_result(), mediabox=page.mediabox)
+
+    @staticmethod
+    def close_document(path: Optional[str] = None) -> None:
+        """
+        Close the document opened in the current thread by :meth:`get_page_layouts` (only if it is the document `path`, if the path is given)
+        """
+        document = getattr(_opened_documents, "document", None)
+        if document is not None and (path is None or document.path == path):
+            document.file.close()
+            _opened_documents.document = None
+
+    def __handle_page(self, page_layout: PdfminerPageLayout, path: str, parameters: ParametersForParseDoc, page_image: Optional[np.ndarray]) -> PageWithBBox:
+        page_number, layout, mediabox = page_layout
+        image_page = self.__get_image(path=path, page_num=page_number, page_image=page_image)
         image_height, image_width, *_ = image_page.shape
 
-        height = int(page.mediabox[3])
-        width = int(page.mediabox[2])
+        height = int(mediabox[3])
+        width = int(mediabox[2])
         if height > 0 and width > 0:
-            k_w, k_h = image_width / page.mediabox[2], image_height / page.mediabox[3]
+            k_w, k_h = image_width / mediabox[2], image_height / mediabox[3]
             page_broken = False
         else:
             page_broken = True
             k_w, k_h = None, None
 
         if self.config.get("debug_mode", False):
-            self.__debug_extract_layout(image_page, layout, page_number, k_w, k_h, page, width, height)
+            self.__debug_extract_layout(image_page, layout, page_number, k_w, k_h, width, height)
 
         # 1. extract textline objects and image (as LTImage)
         images = []
@@ -145,9 +215,9 @@ class PdfminerExtractor:
         return attachment
 
     @staticmethod
-    def __get_image(path: str, page_num: int) -> np.ndarray:
-        image_page = np.array(get_page_image(path=path, page_id=page_num))
-        image_page = np.array(image_page)
+    def __get_image(path: str, page_num: int, page_image: Optional[np.ndarray] = None) -> np.ndarray:
+        # the page is rasterized only if it wasn't rasterized before
+        image_page = np.array(get_page_image(path=path, page_id=page_num)) if page_image is None else page_image
         if len(image_page.shape) == 2:
             image_page = cv2.cvtColor(image_page, cv2.COLOR_GRAY2BGR)
         return image_page
@@ -262,8 +332,7 @@ class PdfminerExtractor:
 
         return annotations
 
-    def __debug_extract_layout(self, image_src: np.ndarray, layout: LTContainer, page_num: int, k_w: float, k_h: float, page: PDFPage,
-                               width: int, height: int) -> None:
+    def __debug_extract_layout(self, image_src: np.ndarray, layout: LTContainer, page_num: int, k_w: float, k_h: float, width: int, height: int) -> None:
         """
         Function for debugging of pdfminer.six layout
         :param layout: container of layout element
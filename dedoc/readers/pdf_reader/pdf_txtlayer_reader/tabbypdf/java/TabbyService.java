@@ -0,0 +1,66 @@
+import java.io.BufferedReader;
+import java.io.FileDescriptor;
+import java.io.FileOutputStream;
+import java.io.InputStreamReader;
+import java.io.OutputStream;
+import java.io.PrintStream;
+import java.nio.charset.StandardCharsets;
+
+import org.json.JSONArray;
+
+/**
+ * Long-lived wrapper over DedocTableExtractor, it is used by dedoc in order not to start a new JVM for every document.
+ * It is launched as a single-file source program (java 11+ with the jdk.compiler module, i.e. JDK): java -cp ispras_tbl_extr.jar TabbyService.java
+ *
+ * Protocol: "READY" is written to stdout when the service is started,
+ * then every line of stdin is a JSON array with command line arguments of DedocTableExtractor,
+ * for every request exactly one line is written to stdout: "OK", "ERROR <message>" if the document can't be handled
+ * or "FATAL <message>" if the JVM may be broken or is stopping (dedoc starts a new JVM for the next request in this case).
+ * Output of the extractor isn't used, so it is discarded, errors of the extractor are written to stderr.
+ */
+public class TabbyService {
+    private static volatile boolean handlingRequest = false;
+
+    public static void main(String[] args) throws Exception {
+        PrintStream protocolOut = new PrintStream(new FileOutputStream(FileDescriptor.out), true, "UTF-8");
+        System.setOut(new PrintStream(OutputStream.nullOutputStream()));
+        // the extractor stops the JVM (System.exit) in case of incorrect arguments, the current request is answered before the exit
+        Runtime.getRuntime().addShutdownHook(new Thread(() -> {
+            if (handlingRequest) {
+                protocolOut.println("FATAL the extractor stopped the JVM");
+            }
+        }));
+        BufferedReader in = new BufferedReader(new InputStreamReader(System.in, StandardCharsets.UTF_8));
+        protocolOut.println("READY");
+
+        String request;
+        while ((request = in.readLine()) != null) {
+            if (request.trim().isEmpty()) {
+                continue;
+            }
+
+            handlingRequest = true;
+            try {
+                JSONArray jsonArgs = new JSONArray(request);
+                String[] extractorArgs = new String[jsonArgs.length()];
+                for (int i = 0; i < jsonArgs.length(); i++) {
+                    extractorArgs[i] = jsonArgs.getString(i);
+                }
+                DedocTableExtractor.main(extractorArgs);
+                protocolOut.println("OK");
+            } catch (Exception e) {
+                e.printStackTrace();
+                protocolOut.println("ERROR " + getMessage(e));
+            } catch (Throwable e) {
+                // the JVM may be broken after errors like OutOfMemoryError
+                e.printStackTrace();
+                protocolOut.println("FATAL " + getMessage(e));
+            }
+            handlingRequest = false;
+        }
+    }
+
+    private static String getMessage(Throwable e) {
+        return String.valueOf(e).replace('\n', ' ').replace('\r', ' ');
+    }
+}
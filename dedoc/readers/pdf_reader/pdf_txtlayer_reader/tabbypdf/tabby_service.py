@@ -0,0 +1,222 @@
+import atexit
+import json
+import logging
+import os
+import select
+import subprocess
+import threading
+import time
+from typing import IO, List, Optional
+
+SERVICE_SOURCE_PATH = os.path.join(os.path.abspath(os.path.dirname(__file__)), "java", "TabbyService.java")
+
+
+class TabbyService:
+    """
+    Long-lived local JVM with tabby extractor (see java/TabbyService.java), which allows not to pay JVM startup and JIT warm-up for every document.
+    The JVM is started lazily at the first request and receives requests through the stdin pipe, one request is handled at a time.
+    The service is launched as a single-file source program, so it requires JDK 11+ (java with the jdk.compiler module),
+    the service is disabled if java doesn't support it.
+
+    If the JVM can't be started or the service is disabled, the request isn't handled (:meth:`run` returns False)
+    and the caller should use the usual per-call `java` subprocess as a fallback.
+    If the document was sent to the JVM and its handling failed, :class:`~dedoc.common.exceptions.tabby_pdf_error.TabbyPdfError` is raised,
+    such documents aren't handled again by the fallback.
+    After `max_failures` consecutive failures of the JVM the service is disabled for the current process.
+    Stderr of the JVM is written to the logger.
+    """
+
+    def __init__(self,
+                 jar_path: str,
+                 logger: logging.Logger,
+                 max_queue_size: int = 8,
+                 timeout: Optional[float] = None,
+                 max_failures: int = 3,
+                 start_timeout: float = 60.) -> None:
+        """
+        :param jar_path: path to the tabby jar
+        :param logger: logger
+        :param max_queue_size: max number of requests waiting for the JVM, other requests are handled by the fallback
+        :param timeout: max time of one request in seconds, the JVM is restarted if it exceeds the timeout (None means no timeout)
+        :param max_failures: number of consecutive failures after which the service is disabled
+        :param start_timeout: max time of the JVM start in seconds
+        """
+        self.jar_path = jar_path
+        self.logger = logger
+        self.timeout = timeout
+        self.max_failures = max_failures
+        self.start_timeout = start_timeout
+
+        self.__process = None
+        self.__stderr_thread = None
+        self.__pid = None  # pid of the process that started the JVM, the JVM isn't shared with forked processes
+        self.__stdout_buffer = b""
+        self.__failures = 0
+        self.__source_launch_checked = False
+        self.__lock = threading.Lock()
+        self.__queue_semaphore = threading.BoundedSemaphore(max_queue_size)
+        atexit.register(self.stop)
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.__failures < self.max_failures
+
+    def run(self, args: List[str]) -> bool:
+        """
+        Run tabby extractor with the given command line arguments (without `java -jar <jar_path>`) in the long-lived JVM.
+
+        :param args: arguments of the tabby extractor
+        :return: True if the request was handled successfully, False if the fallback should be used
+        :raises TabbyPdfError: if the document was sent to the JVM and its handling failed
+        """
+        if not self.is_enabled or not self.__queue_semaphore.acquire(blocking=False):
+            return False
+
+        try:
+            with self.__lock:
+                return self.__run(args)
+        finally:
+            self.__queue_semaphore.release()
+
+    def stop(self) -> None:
+        if self.__process is None or self.__pid != os.getpid():
+            return
+
+        try:
+            self.__process.stdin.close()
+            self.__process.wait(timeout=5)
+        except Exception:
+            self.__process.kill()
+        self.__stderr_thread.join(timeout=5)
+        self.__process = None
+
+    def __run(self, args: List[str]) -> bool:
+        from dedoc.common.exceptions.tabby_pdf_error import TabbyPdfError
+
+        if not self.__is_alive():
+            if not self.__check_source_launch():
+                return False
+
+            try:
+                self.__start()
+            except OSError as e:  # TimeoutError is a subclass of OSError
+                self.__failures += 1
+                self.logger.warning(f"Tabby service can't be started ({e}), use java subprocess instead")
+                self.__kill()
+                return False
+
+        try:
+            self.__process.stdin.write(f"{json.dumps(args)}\n".encode("utf-8"))
+            self.__process.stdin.flush()
+        except OSError as e:  # the JVM stopped before the request, the document wasn't handled yet
+            self.__failures += 1
+            self.logger.warning(f"Tabby service failed ({e}), use java subprocess instead")
+            self.__kill()
+            return False
+
+        try:
+            response = self.__read_line(self.timeout)
+        except OSError as e:
+            self.__failures += 1
+            self.__kill()
+            raise TabbyPdfError(f"Tabby service failed: {e}")
+
+        self.__failures = 0
+        if response == "OK":
+            return True
+
+        # FATAL means that the JVM may be broken (e.g. OutOfMemoryError) or is stopping, it's restarted at the next request
+        if response.startswith("FATAL"):
+            self.__kill()
+        raise TabbyPdfError(f"Tabby service returned error: {response}")
+
+    def __check_source_launch(self) -> bool:
+        """
+        Check once that java is able to launch single-file source programs (it requires the jdk.compiler module), disable the service otherwise
+        """
+        if self.__source_launch_checked:
+            return True
+
+        try:
+            modules = subprocess.run(["java", "--list-modules"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=self.start_timeout).stdout
+            is_supported = any(module.split(b"@")[0].strip() == b"jdk.compiler" for module in modules.splitlines())
+        except (OSError, subprocess.SubprocessError):
+            is_supported = False
+
+        if not is_supported:
+            self.__failures = self.max_failures
+            self.logger.warning("Tabby service is disabled: java can't launch source programs (JDK 11+ is required), use java subprocess instead")
+            return False
+
+        self.__source_launch_checked = True
+        return True
+
+    def __start(self) -> None:
+        self.logger.info("Starting tabby service")
+        command = ["java", "-cp", self.jar_path, SERVICE_SOURCE_PATH]
+        self.__process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        self.__pid = os.getpid()
+        self.__stdout_buffer = b""
+        self.__stderr_thread = threading.Thread(target=self.__log_stderr, args=(self.__process.stderr, ), daemon=True)
+        self.__stderr_thread.start()
+
+        response = self.__read_line(self.start_timeout)
+        if response != "READY":
+            raise OSError(f"unexpected response {response!r}")
+
+    def __log_stderr(self, stderr: IO[bytes]) -> None:
+        for line in stderr:
+            self.logger.warning(f"Tabby service stderr: {line.decode('utf-8', errors='replace').rstrip()}")
+
+    def __is_alive(self) -> bool:
+        return self.__process is not None and self.__pid == os.getpid() and self.__process.poll() is None
+
+    def __kill(self) -> None:
+        if self.__process is not None and self.__pid == os.getpid():
+            self.__process.kill()
+            self.__process.wait()
+            self.__stderr_thread.join(timeout=5)
+        self.__process = None
+
+    def __read_line(self, timeout: Optional[float]) -> str:
+        """
+        Read one line from the JVM stdout, the JVM (and the request) is considered failed if stdout is closed or timeout is exceeded
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        stdout_fd = self.__process.stdout.fileno()
+
+        while b"\n" not in self.__stdout_buffer:
+            wait_time = None if deadline is None else max(0., deadline - time.monotonic())
+            ready, _, _ = select.select([stdout_fd], [], [], wait_time)
+            if not ready:
+                raise TimeoutError(f"no response in {timeout} seconds")
+
+            chunk = os.read(stdout_fd, 4096)
+            if not chunk:
+                raise OSError(f"JVM stopped with code {self.__process.wait()}")
+            self.__stdout_buffer += chunk
+
+        line, self.__stdout_buffer = self.__stdout_buffer.split(b"\n", 1)
+        return line.decode("utf-8").strip()
+
+
+_services = {}
+_services_lock = threading.Lock()
+
+
+def get_tabby_service(jar_path: str, config: dict) -> Optional[TabbyService]:
+    """
+    Get the tabby service shared by all readers of the current process, None is returned if the service is disabled in the config.
+    """
+    if not config.get("tabby_service", False):
+        return None
+
+    with _services_lock:
+        if jar_path not in _services:
+            _services[jar_path] = TabbyService(
+                jar_path=jar_path,
+                logger=config.get("logger", logging.getLogger()),
+                max_queue_size=config.get("tabby_service_max_queue_size", 8),
+                timeout=config.get("tabby_service_timeout", None)
+            )
+        return _services[jar_path]
@@ -0,0 +1,78 @@
+import queue
+import threading
+from typing import Any, Callable, Iterable, List, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# kinds of the items passed from the producer thread to the consumer
+_TASK, _END, _ERROR = range(3)
+
+
+def run_page_pipeline(function: Callable[..., T], tasks: Iterable[Tuple[Any, ...]], n_jobs: int, max_pages_in_flight: int) -> List[T]:
+    """
+    Call `function(*task)` for every task (e.g. `(image, parameters, page_number, path)`), the results are returned in the order of the tasks.
+
+    This is a bounded producer-consumer pipeline: the tasks are taken from the lazy iterable in a background thread,
+    so the pages are rasterized while the previous pages are processed, and the page workers take the next page as soon as they are free
+    (the function is called by `n_jobs` joblib processes, or in the calling thread if `n_jobs` is 1).
+    The function and the task are pickled for every task in case of several processes, so they should contain only the data of the page
+    (e.g. a module-level function instead of a method of the reader with its models).
+    At most `max_pages_in_flight` tasks are taken from the iterable and not processed yet, so the memory is bounded for long documents.
+
+    The exceptions raised by the iterable (e.g. :class:`~dedoc.common.exceptions.parsing_cancelled_error.ParsingCancelledError`)
+    and by the function are raised by this function.
+    """
+    from joblib import effective_n_jobs
+
+    slots = threading.Semaphore(max(1, max_pages_in_flight))
+    ready_tasks = queue.Queue()
+    stopped = threading.Event()
+
+    def produce() -> None:
+        try:
+            iterator = iter(tasks)
+            while not stopped.is_set():
+                # wait for a free slot, but don't block the stop of the pipeline
+                if not slots.acquire(timeout=0.1):
+                    continue
+                task = next(iterator, None)
+                if task is None:
+                    ready_tasks.put((_END, None))
+                    return
+                ready_tasks.put((_TASK, task))
+        except BaseException as e:
+            ready_tasks.put((_ERROR, e))
+
+    producer = threading.Thread(target=produce, name="page_pipeline_producer", daemon=True)
+    producer.start()
+
+    n_jobs = effective_n_jobs(n_jobs)
+    executor = None
+    if n_jobs > 1:
+        from joblib.externals.loky import get_reusable_executor
+        executor = get_reusable_executor(max_workers=n_jobs)
+
+    results = []
+    try:
+        while True:
+            kind, value = ready_tasks.get()
+            if kind == _ERROR:
+                raise value
+            if kind == _END:
+                break
+
+            if executor is None:
+                results.append(function(*value))
+                slots.release()
+            else:
+                future = executor.submit(function, *value)
+                future.add_done_callback(lambda _: slots.release())
+                results.append(future)
+
+        return [future.result() for future in results] if executor is not None else results
+    finally:
+        stopped.set()
+        if executor is not None:
+            for future in results:
+                future.cancel()
+        producer.join()
@@ -14,6 +14,7 @@ class PptxReader(BaseReader):
     This class is used for parsing documents with .pptx extension.
     Please use :class:`~dedoc.converters.PptxConverter` for getting pptx file from similar formats.
     """
+    recognized_formats = ("pptx_like_format",)
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
         from dedoc.attachments_extractors.concrete_attachments_extractors.pptx_attachments_extractor import PptxAttachmentsExtractor
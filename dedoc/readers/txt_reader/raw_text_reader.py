@@ -10,6 +10,7 @@ class RawTextReader(BaseReader):
     """
     This class allows to parse files with the following extensions: .txt, .txt.gz
     """
+    recognized_formats = ("txt_like_format",)
 
     def __init__(self, *, config: Optional[dict] = None) -> None:
         import re
@@ -0,0 +1,5 @@
+from .abstract_results_cache import AbstractResultsCache
+from .disk_results_cache import DiskResultsCache
+from .memory_results_cache import MemoryResultsCache
+
+__all__ = ["AbstractResultsCache", "DiskResultsCache", "MemoryResultsCache"]
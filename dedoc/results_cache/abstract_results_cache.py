@@ -0,0 +1,97 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from dedoc.data_structures.parsed_document import ParsedDocument
+
+
+class AbstractResultsCache(ABC):
+    """
+    Cache of the document parsing results, it allows to skip the whole parsing pipeline for already parsed files.
+    The key of the cached result consists of the file content hash, the file extension and mime (they define the reader),
+    the normalized parsing parameters and the dedoc version.
+
+    Results are stored in the pickled form, so every cache hit returns a new copy of the parsed document.
+    The total size of the stored results is limited, the least recently used results are evicted first.
+    """
+    # parameters that don't influence the parsing result
+    ignored_parameters = ("attachments_dir",)
+
+    def __init__(self, max_size: int, config: Optional[dict] = None) -> None:
+        """
+        :param max_size: maximum total size of the stored (pickled) results in bytes
+        :param config: configuration of the cache
+        """
+        import logging
+
+        self.max_size = max_size
+        self.config = {} if config is None else config
+        self.logger = self.config.get("logger", logging.getLogger())
+
+    def can_cache(self, parameters: dict) -> bool:
+        """
+        Check if the parsing result with the given parameters can be restored from the cache.
+        Extracted attachments are saved as files into `attachments_dir`, so such results aren't cached.
+        """
+        return str(parameters.get("with_attachments", "false")).lower() != "true" and not self.config.get("labeling_mode", False)
+
+    def get_key(self, file_path: str, parameters: dict) -> str:
+        """
+        Calculate the key of the parsing result: hash of the file content, lower-cased extension and mime of the file, normalized parameters and dedoc version.
+        """
+        import hashlib
+        import json
+
+        import dedoc.version
+        from dedoc.utils.utils import calculate_file_hash, get_mime_extension
+
+        mime, extension = get_mime_extension(file_path=file_path)
+        normalized_parameters = {key: str(value).lower() for key, value in parameters.items() if key not in self.ignored_parameters and value is not None}
+        key_data = json.dumps([calculate_file_hash(file_path), extension.lower(), mime, normalized_parameters, dedoc.version.__version__], sort_keys=True)
+        return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[ParsedDocument]:
+        """
+        Get the parsed document by the key (see :meth:`get_key`), None is returned if there is no such document in the cache.
+        """
+        import pickle
+
+        value = self._get(key)
+        if value is None:
+            return None
+
+        self.logger.info(f"Parsing result {key} is found in the cache")
+        return pickle.loads(value)
+
+    def put(self, key: str, document: ParsedDocument) -> None:
+        """
+        Save the parsed document into the cache, the least recently used documents are evicted if the size limit is exceeded.
+        """
+        import pickle
+
+        value = pickle.dumps(document)
+        if len(value) > self.max_size:
+            self.logger.info(f"Parsing result {key} is too large for the cache ({len(value)} bytes)")
+            return
+
+        self._put(key, value)
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all the stored results.
+        """
+        pass
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[bytes]:
+        """
+        Get the pickled result by the key and mark it as the most recently used.
+        """
+        pass
+
+    @abstractmethod
+    def _put(self, key: str, value: bytes) -> None:
+        """
+        Save the pickled result and evict the least recently used results if needed.
+        """
+        pass
@@ -0,0 +1,76 @@
+import os
+from typing import Optional
+
+from dedoc.results_cache.abstract_results_cache import AbstractResultsCache
+
+
+class DiskResultsCache(AbstractResultsCache):
+    """
+    On-disk LRU cache of the parsing results. Every result is saved into a separate file in the cache directory,
+    the modification time of the file is used as the time of the last usage.
+    The directory can be shared between several processes (e.g. API workers).
+    """
+    extension = ".pickle"
+
+    def __init__(self, path: str, max_size: int, config: Optional[dict] = None) -> None:
+        """
+        :param path: directory for the cached results
+        :param max_size: maximum total size of the stored (pickled) results in bytes
+        :param config: configuration of the cache
+        """
+        super().__init__(max_size=max_size, config=config)
+        self.path = path
+        os.makedirs(self.path, exist_ok=True)
+
+    def clear(self) -> None:
+        for file_name in os.listdir(self.path):
+            if file_name.endswith(self.extension):
+                self.__remove(os.path.join(self.path, file_name))
+
+    def _get(self, key: str) -> Optional[bytes]:
+        file_path = self.__get_path(key)
+        try:
+            with open(file_path, "rb") as file:
+                value = file.read()
+            os.utime(file_path)
+            return value
+        except FileNotFoundError:
+            # the file may be evicted by another process
+            return None
+
+    def _put(self, key: str, value: bytes) -> None:
+        import tempfile
+
+        # write into a temporary file in the same directory and rename it, so other processes never read a partially written result
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(value)
+        os.replace(tmp_path, self.__get_path(key))
+        self.__evict()
+
+    def __evict(self) -> None:
+        files = []
+        for file_name in os.listdir(self.path):
+            if not file_name.endswith(self.extension):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.path, file_name))
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file_name))
+
+        total_size = sum(size for _, size, _ in files)
+        for _, size, file_name in sorted(files):
+            if total_size <= self.max_size:
+                break
+            self.__remove(os.path.join(self.path, file_name))
+            total_size -= size
+
+    def __get_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}{self.extension}")
+
+    def __remove(self, file_path: str) -> None:
+        try:
+            os.remove(file_path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,42 @@
+from collections import OrderedDict
+from typing import Optional
+
+from dedoc.results_cache.abstract_results_cache import AbstractResultsCache
+
+
+class MemoryResultsCache(AbstractResultsCache):
+    """
+    In-memory LRU cache of the parsing results. The cache is local for the process, where the documents are parsed.
+    """
+
+    def __init__(self, max_size: int, config: Optional[dict] = None) -> None:
+        import threading
+
+        super().__init__(max_size=max_size, config=config)
+        self.__values = OrderedDict()
+        self.__size = 0
+        self.__lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__values.clear()
+            self.__size = 0
+
+    def _get(self, key: str) -> Optional[bytes]:
+        with self.__lock:
+            if key not in self.__values:
+                return None
+            self.__values.move_to_end(key)
+            return self.__values[key]
+
+    def _put(self, key: str, value: bytes) -> None:
+        with self.__lock:
+            if key in self.__values:
+                self.__size -= len(self.__values.pop(key))
+
+            self.__values[key] = value
+            self.__size += len(value)
+
+            while self.__size > self.max_size:
+                _, evicted_value = self.__values.popitem(last=False)
+                self.__size -= len(evicted_value)
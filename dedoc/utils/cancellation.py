@@ -0,0 +1,42 @@
+from typing import Iterable, Iterator, Optional, TypeVar
+
+from dedoc.common.exceptions.parsing_cancelled_error import ParsingCancelledError
+
+T = TypeVar("T")
+
+# event of the current process, which is checked at the cancellation checkpoints
+_cancellation_event = None
+
+
+def set_cancellation_event(event: Optional[object]) -> None:
+    """
+    Set the event, which is checked at the cancellation checkpoints of the current process (None disables the checks).
+
+    :param event: object with the `is_set()` method, e.g. `threading.Event` or `multiprocessing.Event`
+    """
+    global _cancellation_event
+    _cancellation_event = event
+
+
+def is_cancelled() -> bool:
+    return _cancellation_event is not None and _cancellation_event.is_set()
+
+
+def check_cancellation() -> None:
+    """
+    Cancellation checkpoint: raise ParsingCancelledError if the cancellation event of the current process is set.
+
+    The checkpoints are placed between the pipeline stages, between pages of PDF documents and between attachments,
+    so the current document is aborted, but the process with all loaded models stays alive and can parse the next document.
+    """
+    if is_cancelled():
+        raise ParsingCancelledError("Parsing was cancelled")
+
+
+def cancellable(items: Iterable[T]) -> Iterator[T]:
+    """
+    Iterate over the items with the cancellation check before each of them.
+    """
+    for item in items:
+        check_cancellation()
+        yield item
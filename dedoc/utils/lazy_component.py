@@ -0,0 +1,70 @@
+import threading
+from typing import Optional
+
+
+class LazyComponent:
+    """
+    Proxy for a component of the manager config (converter, reader, metadata or structure extractor), which is constructed at the first use.
+    All attributes of the component are available through the proxy, e.g. `LazyComponent(DocxReader, config=config).can_read(...)`
+    constructs the reader and calls its method.
+
+    It allows not to load models and other resources of the components that aren't used for parsing the documents of the current deployment.
+    The readers aren't constructed by `can_read` for the files of other formats, the format is checked by the class of the reader
+    (see :meth:`~dedoc.readers.BaseReader.can_read_format`). The other `can_*` methods (e.g. of converters) construct the component.
+    """
+
+    def __init__(self, component_class: type, *args: object, **kwargs: object) -> None:
+        """
+        :param component_class: class of the component
+        :param args: positional arguments of the component constructor
+        :param kwargs: keyword arguments of the component constructor
+        """
+        self.component_class = component_class
+        self.__args = args
+        self.__kwargs = kwargs
+        self.__component = None
+        self.__lock = threading.Lock()
+
+    @property
+    def is_initialized(self) -> bool:
+        return self.__component is not None
+
+    def get(self) -> object:
+        """
+        Get the component, it's constructed during the first call
+        """
+        if self.__component is None:
+            with self.__lock:
+                if self.__component is None:
+                    self.__component = self.component_class(*self.__args, **self.__kwargs)
+        return self.__component
+
+    def can_read(self, file_path: Optional[str] = None, mime: Optional[str] = None, extension: Optional[str] = None, parameters: Optional[dict] = None) -> bool:
+        """
+        Check if the reader can read the file, the reader isn't constructed if the format of the file isn't suitable for the class of the reader
+        """
+        if self.__component is None and hasattr(self.component_class, "can_read_format"):
+            from dedoc.utils.utils import get_mime_extension
+
+            mime, extension = get_mime_extension(file_path=file_path, mime=mime, extension=extension)
+            if not self.component_class.can_read_format(mime=mime, extension=extension):
+                return False
+        return self.get().can_read(file_path=file_path, mime=mime, extension=extension, parameters=parameters)
+
+    def __getattr__(self, name: str) -> object:
+        # special attributes (e.g. for pickling) are looked up only in the proxy itself
+        if name.startswith("__") or name.startswith("_LazyComponent__"):
+            raise AttributeError(name)
+        return getattr(self.get(), name)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_LazyComponent__lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"LazyComponent({self.component_class.__name__}, initialized={self.is_initialized})"
@@ -45,6 +45,12 @@ def get_param_need_content_analysis(parameters: Optional[dict]) -> bool:
     return str(parameters.get("need_content_analysis", "false")).lower() == "true"
 
 
+def get_param_return_attachments_refs(parameters: Optional[dict]) -> bool:
+    if parameters is None:
+        return False
+    return str(parameters.get("return_attachments_refs", "false")).lower() == "true"
+
+
 def get_param_need_header_footers_analysis(parameters: Optional[dict]) -> bool:
     if parameters is None:
         return False
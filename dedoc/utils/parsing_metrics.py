@@ -0,0 +1,95 @@
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+
+class ParsingMetrics:
+    """
+    Measurements of the document parsing: durations of the pipeline stages (in seconds), the number of pages and the size of the result.
+    The durations of the attachments parsing are added to the stages of the same name.
+    The status ("done", "failed" or "cancelled") is set by the code, which runs the parsing.
+    The metrics may be filled by several threads (e.g. attachments are parsed in parallel).
+    """
+    def __init__(self) -> None:
+        self.stage_durations: Dict[str, float] = defaultdict(float)
+        self.pages = 0
+        self.output_bytes = 0
+        self.status = "done"
+        self.__lock = threading.Lock()
+
+    def add(self, stage: Optional[str] = None, duration: float = 0.0, pages: int = 0, output_bytes: int = 0) -> None:
+        """
+        Add the measurements to the metrics.
+
+        :param stage: name of the stage, whose duration (seconds) is added
+        :param duration: duration of the stage
+        :param pages: number of the parsed pages
+        :param output_bytes: size of the result
+        """
+        with self.__lock:
+            if stage is not None:
+                self.stage_durations[stage] += duration
+            self.pages += pages
+            self.output_bytes += output_bytes
+
+    def to_dict(self) -> dict:
+        with self.__lock:
+            return dict(stage_durations=dict(self.stage_durations), pages=self.pages, output_bytes=self.output_bytes, status=self.status)
+
+
+# metrics of the current context, which are filled during parsing.
+# The threads parsing attachments run in the copy of the context, so the metrics of attachments are added to the metrics of the document
+_parsing_metrics: ContextVar[Optional[ParsingMetrics]] = ContextVar("parsing_metrics", default=None)
+
+
+@contextmanager
+def collect_parsing_metrics() -> Iterator[ParsingMetrics]:
+    """
+    Collect the metrics of the parsing in the current context (thread), e.g.:
+
+    .. code-block:: python
+
+        with collect_parsing_metrics() as metrics:
+            manager.parse(file_path)
+        print(metrics.stage_durations["reader"])
+
+    The stages are measured only inside this context, so parsing without it has no overhead.
+    """
+    metrics = ParsingMetrics()
+    token = _parsing_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _parsing_metrics.reset(token)
+
+
+@contextmanager
+def measure_stage(stage: str) -> Iterator[None]:
+    """
+    Add the duration of the code block to the duration of the stage (e.g. "reader" or "structure").
+    """
+    metrics = _parsing_metrics.get()
+    if metrics is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.add(stage=stage, duration=time.perf_counter() - start)
+
+
+def add_pages(pages: int) -> None:
+    metrics = _parsing_metrics.get()
+    if metrics is not None:
+        metrics.add(pages=pages)
+
+
+def add_output_bytes(size: int) -> None:
+    metrics = _parsing_metrics.get()
+    if metrics is not None:
+        metrics.add(output_bytes=size)
@@ -1,15 +1,181 @@
-from typing import Optional
+import os
+import threading
+from contextlib import contextmanager
+from types import TracebackType
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from PIL.Image import Image
+from pypdf import PdfReader
+from pypdf.generic import DictionaryObject
 
 
-def get_pdf_page_count(path: str) -> Optional[int]:
-    from pypdf import PdfReader
+class PdfContext:
+    """
+    Pdf file, which is parsed (with pypdf) once for all readers and extractors handling it:
+    the hash of the file, the page count, the document information, the embedded files and the annotations of the pages.
+    The file is parsed lazily at the first access, the objects of the document are read from the opened file when they are needed,
+    so the whole file isn't loaded into memory.
+    Use :func:`get_pdf_context` to get the context of the file, it should be used as a context manager in order to close the file after use:
+
+    .. code-block:: python
+
+        with get_pdf_context(path) as pdf_context:
+            page_count = pdf_context.page_count
+
+    The parsing errors (e.g. `pypdf.errors.PdfReadError` for broken files) are raised by every access to the parsed structure.
+    """
+
+    def __init__(self, path: str, shared: bool = False) -> None:
+        """
+        :param path: path to the pdf file
+        :param shared: if True, the context isn't closed at the exit from the `with` block, it is closed by :func:`share_pdf_contexts`
+        """
+        self.path = path
+        self.shared = shared
+        self.__lock = threading.RLock()
+        self.__file = None
+        self.__file_hash = None
+        self.__page_count = None
+        self.__reader = None
+        self.__reader_error = None
+
+    def __enter__(self) -> "PdfContext":
+        return self
+
+    def __exit__(self, exc_type: Optional[type], exc_val: Optional[BaseException], exc_tb: Optional[TracebackType]) -> None:
+        if not self.shared:
+            self.close()
+
+    def close(self) -> None:
+        with self.__lock:
+            if self.__file is not None:
+                self.__file.close()
+            self.__file, self.__reader, self.__reader_error = None, None, None
+
+    @property
+    def file_hash(self) -> str:
+        """
+        md5 hash of the file, the same as :func:`~dedoc.utils.utils.calculate_file_hash` returns.
+        """
+        from dedoc.utils.utils import calculate_file_hash
+
+        with self.__lock:
+            if self.__file_hash is None:
+                self.__file_hash = calculate_file_hash(self.path)
+            return self.__file_hash
+
+    @property
+    def reader(self) -> PdfReader:
+        with self.__lock:
+            if self.__reader is None and self.__reader_error is None:
+                try:
+                    self.__file = open(self.path, "rb")
+                    self.__reader = PdfReader(self.__file)
+                except Exception as e:
+                    self.__reader_error = e
+            if self.__reader_error is not None:
+                raise self.__reader_error
+            return self.__reader
+
+    @property
+    def page_count(self) -> Optional[int]:
+        """
+        Number of pages of the document, None if the file can't be parsed.
+        """
+        with self.__lock:
+            if self.__page_count is None:
+                try:
+                    self.__page_count = len(self.reader.pages)
+                except Exception:
+                    return None
+            return self.__page_count
+
+    @property
+    def document_info(self) -> dict:
+        with self.__lock:
+            document_info = self.reader.metadata
+            return {} if document_info is None else dict(document_info)
+
+    def get_embedded_files(self) -> List[Tuple[Optional[str], bytes]]:
+        """
+        Get the files embedded into the document catalog: pairs (name, data), the name is None if the file hasn't the "/UF" entry.
+        """
+        with self.__lock:
+            catalog = self.reader.trailer["/Root"]
+            if "/Names" not in catalog or "/EmbeddedFiles" not in catalog["/Names"] or "/Names" not in catalog["/Names"]["/EmbeddedFiles"]:
+                return []
+
+            embedded_files = []
+            file_names = catalog["/Names"]["/EmbeddedFiles"]["/Names"]
+            for i, file_name in enumerate(file_names):
+                if not isinstance(file_name, str):
+                    continue
+                dict_object = file_names[i + 1].get_object()
+                if "/EF" in dict_object and "/F" in dict_object["/EF"]:
+                    embedded_files.append((dict_object.get("/UF"), dict_object["/EF"]["/F"].get_data()))
+            return embedded_files
+
+    def get_annotations(self) -> List[DictionaryObject]:
+        """
+        Get the annotations of all pages of the document in the order of pages.
+        The objects are read from the file lazily, so they should be used inside the `with` block of the context.
+        """
+        with self.__lock:
+            return [annotation.get_object() for page in self.reader.pages for annotation in page.get("/Annots", [])]
+
+
+# contexts of the pdf files from the shared directories: directory -> {(path, size, modification time) -> context}
+_shared_pdf_contexts: Dict[str, Dict[Tuple[str, int, int], PdfContext]] = {}
+_shared_pdf_contexts_lock = threading.Lock()
+
+
+@contextmanager
+def share_pdf_contexts(directory: str) -> Iterator[None]:
+    """
+    Share the contexts of the pdf files from the directory between all readers and extractors inside the block, e.g.:
+
+    .. code-block:: python
+
+        with tempfile.TemporaryDirectory() as tmp_dir, share_pdf_contexts(tmp_dir):
+            ...  # copy the file to tmp_dir and parse it, the file is parsed with pypdf once
+
+    The contexts are closed at the exit from the block. The files outside the shared directories are parsed again by every consumer.
+    Several blocks with different directories can be active at the same time (e.g. for the attachments parsed in different threads).
+    """
+    directory = os.path.abspath(directory)
+    with _shared_pdf_contexts_lock:
+        _shared_pdf_contexts[directory] = {}
     try:
-        reader = PdfReader(path)
-        return len(reader.pages)
-    except Exception:
-        return None
+        yield
+    finally:
+        with _shared_pdf_contexts_lock:
+            contexts = _shared_pdf_contexts.pop(directory, {})
+        for context in contexts.values():
+            context.close()
+
+
+def get_pdf_context(path: str) -> PdfContext:
+    """
+    Get the context of the pdf file, it is shared if the file is located in the directory from :func:`share_pdf_contexts`.
+    The shared context is created again if the file was changed.
+    """
+    path = os.path.abspath(path)
+    with _shared_pdf_contexts_lock:
+        contexts = _shared_pdf_contexts.get(os.path.dirname(path))
+    if contexts is None or not os.path.isfile(path):
+        return PdfContext(path)
+
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    with _shared_pdf_contexts_lock:
+        if key not in contexts:
+            contexts[key] = PdfContext(path, shared=True)
+        return contexts[key]
+
+
+def get_pdf_page_count(path: str) -> Optional[int]:
+    with get_pdf_context(path) as pdf_context:
+        return pdf_context.page_count
 
 
 def get_page_image(path: str, page_id: int) -> Optional[Image]:
@@ -5,7 +5,7 @@ import os
 import re
 import shutil
 import time
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, TypeVar
 
 from fastapi import UploadFile
 
@@ -132,6 +132,21 @@ def save_data_to_unique_file(directory: str, filename: str, binary_data: bytes)
     return unique_filename
 
 
+def open_unique_file(directory: str, filename: str) -> Tuple[BinaryIO, str]:
+    """
+    Create a new file with a unique name by the filename and open it for binary writing
+    :param directory: directory of file (without filename)
+    :param filename: name of file (base)
+    :return: opened file and filename of the created file
+    """
+    while True:
+        unique_filename = get_unique_name(filename)
+        try:
+            return open(os.path.join(directory, unique_filename), "xb"), unique_filename
+        except FileExistsError:
+            continue
+
+
 def get_file_mime_type(path: str) -> str:
     return mimetypes.guess_type(path)[0] or "application/octet-stream"
 
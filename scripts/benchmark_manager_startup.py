@@ -0,0 +1,42 @@
+import argparse
+import os
+import time
+
+from dedoc.config import get_config
+from dedoc.dedoc_manager import DedocManager
+from dedoc.manager_config import _get_manager_config
+from dedoc.utils.lazy_component import LazyComponent
+
+"""
+Measure the cold start of DedocManager: creation of the manager config and parsing of the first document.
+The components of the manager config are constructed lazily, use --warm_up to construct the components for the given extensions at the start.
+"""
+
+
+def count_initialized(manager: DedocManager) -> str:
+    components = manager.converter.converters + manager.reader.readers + manager.document_metadata_extractor.extractors
+    components += list(manager.structure_extractor.extractors.values())
+    lazy_components = [component for component in components if isinstance(component, LazyComponent)]
+    return f"{sum(component.is_initialized for component in lazy_components)} of {len(lazy_components)}"
+
+
+if __name__ == "__main__":
+    default_file = os.path.join(os.path.dirname(__file__), "..", "tests", "data", "docx", "example.docx")
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--file", type=str, default=default_file, help="document to parse after the start")
+    parser.add_argument("--warm_up", type=str, nargs="*", default=None, help="extensions for the warm-up, e.g. .docx .pdf (all components if empty)")
+    parser.add_argument("--document_types", type=str, nargs="*", default=["other"], help="document types for the warm-up (all types if empty)")
+    args = parser.parse_args()
+
+    config = get_config()
+    start = time.time()
+    manager = DedocManager(config=config, manager_config=_get_manager_config(config))
+    if args.warm_up is not None:
+        manager.warm_up(extensions=args.warm_up if len(args.warm_up) > 0 else None,
+                        document_types=args.document_types if len(args.document_types) > 0 else None)
+    startup_time = time.time() - start
+    print(f"Startup: {startup_time:.2f} s, initialized components: {count_initialized(manager)}")
+
+    start = time.time()
+    manager.parse(args.file)
+    print(f"First parsing: {time.time() - start:.2f} s, initialized components: {count_initialized(manager)}")
@@ -0,0 +1,46 @@
+import argparse
+import gzip
+import os
+import time
+from typing import Callable, List
+
+import pandas as pd
+
+from dedoc.readers.pdf_reader.pdf_auto_reader.txtlayer_feature_extractor import TxtlayerFeatureExtractor
+from tests.txtlayer_features_reference import reference_transform
+
+"""
+Compare the speed of the vectorized TxtlayerFeatureExtractor with the character-by-character implementation of the same features
+on the pages of different sizes (the features are checked to be equal).
+"""
+
+
+def measure(transform: Callable[[List[str]], pd.DataFrame], texts: List[str], repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        transform(texts)
+    return (time.perf_counter() - start) / repeats
+
+
+if __name__ == "__main__":
+    default_file = os.path.join(os.path.dirname(__file__), "..", "tests", "data", "txt", "large_text.txt.gz")
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--file", type=str, default=default_file, help="text file (may be gzipped) to cut the pages from")
+    parser.add_argument("--page_sizes", type=int, nargs="+", default=[150, 3000, 10000, 50000], help="sizes of the pages in characters")
+    parser.add_argument("--pages", type=int, default=8, help="number of the pages classified in one batch")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    with (gzip.open(args.file, "rt") if args.file.endswith(".gz") else open(args.file)) as f:
+        text = f.read()
+
+    extractor = TxtlayerFeatureExtractor()
+    for page_size in args.page_sizes:
+        # the text is repeated if it is too short for the pages
+        pages_text = text * (page_size * args.pages // len(text) + 1)
+        texts = [pages_text[i * page_size:(i + 1) * page_size] for i in range(args.pages)]
+        pd.testing.assert_frame_equal(reference_transform(texts), extractor.transform(texts), check_exact=True)
+        reference_time = measure(reference_transform, texts, args.repeats)
+        vectorized_time = measure(extractor.transform, texts, args.repeats)
+        print(f"Page size {page_size}: reference {reference_time * 1000:.1f} ms, vectorized {vectorized_time * 1000:.1f} ms, "
+              f"speedup {reference_time / vectorized_time:.1f}x")
@@ -66,6 +66,25 @@ class TestApiPdfAutoTextLayer(AbstractTestApiDocReader):
             self.assertEqual("5) заканчиваем список\n", list_items[4]["text"])
             self.assertEqual("6) последний элемент списка.\n", list_items[5]["text"])
 
+    def test_auto_document_with_scanned_page_inside(self) -> None:
+        file_name = "mixed_pdf_scan_inside.pdf"  # the second page is scanned, the first and the third pages have a textual layer
+        for pdf_with_text_layer in "auto", "auto_tabby":
+            result = self._send_request(file_name, dict(pdf_with_text_layer=pdf_with_text_layer))
+            self.assertIn("Assume document has a correct textual layer", result["warnings"])
+            self.assertIn("Assume page 2 hasn't a textual layer", result["warnings"])
+            structure = result["content"]["structure"]
+            self._check_tree_sanity(structure)
+
+            nodes, texts = [structure], []
+            while nodes:
+                node = nodes.pop(0)
+                texts.append(node["text"])
+                nodes = node["subparagraphs"] + nodes
+            text = "".join(texts)
+            # the recognized page is placed between the pages with a textual layer
+            self.assertEqual(2, text.count("3) продолжаем список"))
+            self.assertIn("THE GREAT ENGLISH DOCUMENT", text.split("3) продолжаем список")[1])
+
     def test_auto_partially_read(self) -> None:
         file_name = "mixed_pdf.pdf"
         data = {"pdf_with_text_layer": "auto", "pages": "2:"}
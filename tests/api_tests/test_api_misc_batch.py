@@ -0,0 +1,42 @@
+import io
+import os
+import zipfile
+
+import requests
+
+from tests.api_tests.abstract_api_test import AbstractTestApiDocReader
+
+
+class TestApiBatch(AbstractTestApiDocReader):
+
+    def __send_batch(self, files: list, data: dict = None, expected_code: int = 200) -> list:
+        r = requests.post(f"http://{self._get_host()}:{self._get_port()}/upload_batch", files=files, data=data or {})
+        self.assertEqual(expected_code, r.status_code)
+        return r.json()
+
+    def test_files(self) -> None:
+        with open(self._get_abs_path(os.path.join("txt", "example.txt")), "rb") as txt_file, \
+                open(self._get_abs_path(os.path.join("docx", "example.docx")), "rb") as docx_file:
+            files = [("files", ("example.txt", txt_file)), ("files", ("example.docx", docx_file)), ("files", ("file.bin", b"\x00\x01"))]
+            results = self.__send_batch(files, data={"structure_type": "linear"})
+
+        self.assertListEqual(["example.txt", "example.docx", "file.bin"], [result["file_name"] for result in results])
+        self.assertListEqual([200, 200, 415], [result["status_code"] for result in results])
+        self.assertEqual("example.txt", results[0]["result"]["metadata"]["file_name"])
+        self.assertGreater(len(results[1]["result"]["content"]["structure"]["subparagraphs"]), 0)
+        self.assertIn("error", results[2])
+
+    def test_archive(self) -> None:
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as archive_file:
+            for i in range(10):
+                archive_file.writestr(f"dir/file_{i}.txt", f"Document number {i}")
+
+        results = self.__send_batch([("archive", ("documents.zip", archive.getvalue()))])
+        self.assertListEqual([f"file_{i}.txt" for i in range(10)], [result["file_name"] for result in results])
+        for i, result in enumerate(results):
+            self.assertEqual(200, result["status_code"])
+            self.assertEqual(f"Document number {i}", result["result"]["content"]["structure"]["subparagraphs"][0]["text"].strip())
+
+    def test_without_files(self) -> None:
+        self.__send_batch([], expected_code=400)
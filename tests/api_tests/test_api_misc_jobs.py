@@ -0,0 +1,56 @@
+import os
+import time
+
+import requests
+
+from tests.api_tests.abstract_api_test import AbstractTestApiDocReader
+
+
+class TestApiJobs(AbstractTestApiDocReader):
+
+    def __get_url(self, path: str) -> str:
+        return f"http://{self._get_host()}:{self._get_port()}{path}"
+
+    def __submit(self, file_name: str, data: dict = None) -> str:
+        with open(self._get_abs_path(file_name), "rb") as file:
+            r = requests.post(self.__get_url("/jobs"), files={"file": (os.path.basename(file_name), file)}, data=data or {})
+        self.assertEqual(202, r.status_code)
+        self.assertIn(r.json()["status"], ("queued", "running"))
+        return r.json()["job_id"]
+
+    def __wait(self, job_id: str, timeout: float = 60) -> dict:
+        start = time.time()
+        while time.time() - start < timeout:
+            r = requests.get(self.__get_url(f"/jobs/{job_id}"))
+            self.assertEqual(200, r.status_code)
+            if r.json()["status"] in ("done", "failed"):
+                return r.json()
+            time.sleep(0.5)
+        self.fail(f"Job {job_id} isn't finished in {timeout} seconds")
+
+    def test_job(self) -> None:
+        job_id = self.__submit(os.path.join("txt", "example.txt"))
+        status = self.__wait(job_id)
+        self.assertEqual("done", status["status"])
+        self.assertIsNotNone(status["started_time"])
+        self.assertIsNotNone(status["finished_time"])
+
+        r = requests.get(self.__get_url(f"/jobs/{job_id}/result"))
+        self.assertEqual(200, r.status_code)
+        self.assertEqual("example.txt", r.json()["metadata"]["file_name"])
+
+        self.assertEqual(200, requests.delete(self.__get_url(f"/jobs/{job_id}")).status_code)
+        self.assertEqual(404, requests.get(self.__get_url(f"/jobs/{job_id}")).status_code)
+
+    def test_failed_job(self) -> None:
+        job_id = self.__submit("file.bin")
+        status = self.__wait(job_id)
+        self.assertEqual("failed", status["status"])
+        self.assertIsNotNone(status["error"])
+        self.assertEqual(415, requests.get(self.__get_url(f"/jobs/{job_id}/result")).status_code)
+        requests.delete(self.__get_url(f"/jobs/{job_id}"))
+
+    def test_unknown_job(self) -> None:
+        self.assertEqual(404, requests.get(self.__get_url("/jobs/unknown")).status_code)
+        self.assertEqual(404, requests.get(self.__get_url("/jobs/unknown/result")).status_code)
+        self.assertEqual(404, requests.delete(self.__get_url("/jobs/unknown")).status_code)
@@ -4,6 +4,8 @@ import os
 from tempfile import TemporaryDirectory
 from typing import List
 
+import requests
+
 from tests.api_tests.abstract_api_test import AbstractTestApiDocReader
 
 
@@ -152,6 +154,24 @@ class TestApiAttachmentsReader(AbstractTestApiDocReader):
             result_english = self._send_request(file_name=path, data={})
             self._check_english_doc(result_english)
 
+    def test_attachments_refs(self) -> None:
+        file_name = "with_attachments/docx_with_images.docx"
+        result = self._send_request(file_name, dict(with_attachments=True, return_attachments_refs=True))
+        attachments = result["attachments"]
+        self.assertGreater(len(attachments), 0)
+
+        url = f"http://{self._get_host()}:{self._get_port()}/attachments"
+        for attachment in attachments:
+            self.assertNotIn("base64_encode", attachment["metadata"])
+            r = requests.get(f"{url}/{attachment['metadata']['attachment_id']}")
+            self.assertEqual(200, r.status_code)
+            self.assertEqual(attachment["metadata"]["size"], len(r.content))
+
+        html = self._send_request(file_name, dict(with_attachments=True, return_attachments_refs=True, return_format="html"))
+        self.assertNotIn(";base64,", html)
+        self.assertIn(f"/attachments/{attachments[0]['metadata']['attachment_id']}", html)
+        self.assertEqual(404, requests.get(f"{url}/unknown").status_code)
+
     def test_docx_images_no_base64(self) -> None:
         metadata = self.__check_base64(False)
         self.assertNotIn("base64_encode", metadata)
@@ -0,0 +1,98 @@
+import os
+import shutil
+import tarfile
+import unittest
+import zipfile
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from dedoc.common.exceptions.archive_limit_error import ArchiveLimitError
+from dedoc.dedoc_manager import DedocManager
+from dedoc.manager_config import get_manager_config
+from dedoc.readers.archive_reader.archive_reader import ArchiveReader
+from dedoc.readers.reader_composition import ReaderComposition
+from tests.test_utils import get_test_config
+
+
+class TestArchiveReader(unittest.TestCase):
+    archives_dir = os.path.join(os.path.dirname(__file__), "..", "data", "archives")
+    parameters = {"with_attachments": "true"}
+
+    def test_chunked_extraction(self) -> None:
+        reader = ArchiveReader(config={"archive_chunk_size": 7})
+        with TemporaryDirectory() as tmpdir:
+            archive_path = os.path.join(tmpdir, "archive.zip")
+            with zipfile.ZipFile(archive_path, "w") as archive:
+                archive.writestr("dir/first.txt", "first file content")
+                archive.writestr("second.txt", "second file content, it is longer than one chunk")
+
+            attachments = reader.read(archive_path, parameters={**self.parameters, "attachments_dir": tmpdir}).attachments
+            self.assertListEqual(["first.txt", "second.txt"], [attachment.original_name for attachment in attachments])
+            with open(attachments[1].tmp_file_path) as f:
+                self.assertEqual("second file content, it is longer than one chunk", f.read())
+
+    def test_formats(self) -> None:
+        reader = ArchiveReader(config={"archive_chunk_size": 1024})
+        for file_name in ("zipka.zip", "zipka.tar", "zipka.rar", "zipka.7z"):
+            with self.subTest(file_name=file_name), TemporaryDirectory() as tmpdir:
+                # rarfile needs an external tool for extraction, bsdtar doesn't support all rar archives
+                if file_name.endswith(".rar") and shutil.which("unrar") is None:
+                    self.skipTest("unrar isn't installed")
+                attachments = reader.read(os.path.join(self.archives_dir, file_name), parameters={**self.parameters, "attachments_dir": tmpdir}).attachments
+                self.assertGreater(len(attachments), 0, file_name)
+                for attachment in attachments:
+                    self.assertTrue(os.path.isfile(attachment.tmp_file_path))
+
+    def __create_tar(self, tmpdir: str, files_number: int) -> str:
+        archive_path = os.path.join(tmpdir, "archive.tar")
+        with tarfile.open(archive_path, "w") as archive:
+            for i in range(files_number):
+                file_path = os.path.join(tmpdir, f"file_{i}.txt")
+                with open(file_path, "w") as f:
+                    f.write("content")
+                archive.add(file_path, arcname=f"file_{i}.txt")
+        return archive_path
+
+    def test_max_members(self) -> None:
+        reader = ArchiveReader(config={"archive_max_members": 2})
+        with TemporaryDirectory() as tmpdir:
+            archive_path = self.__create_tar(tmpdir, files_number=3)
+            attachments_dir = os.path.join(tmpdir, "attachments")
+            os.makedirs(attachments_dir)
+            with self.assertRaises(ArchiveLimitError):
+                reader.read(archive_path, parameters={**self.parameters, "attachments_dir": attachments_dir})
+            # the members extracted before the error are removed
+            self.assertListEqual([], os.listdir(attachments_dir))
+
+    def test_limit_error_in_manager(self) -> None:
+        config = get_test_config()
+        # the manager config is created once in the process, so the archive reader with the limit is set explicitly
+        manager_config = {**get_manager_config(config), "reader": ReaderComposition(readers=[ArchiveReader(config={**config, "archive_max_members": 2})])}
+        manager = DedocManager(config=config, manager_config=manager_config)
+        save_archive_file = ArchiveReader._ArchiveReader__save_archive_file
+        with TemporaryDirectory() as tmpdir:
+            archive_path = self.__create_tar(tmpdir, files_number=3)
+            attachments_dir = os.path.join(tmpdir, "attachments")
+            os.makedirs(attachments_dir)
+            with patch.object(ArchiveReader, "_ArchiveReader__save_archive_file", autospec=True, side_effect=save_archive_file) as save_mock:
+                with self.assertRaises(ArchiveLimitError):
+                    manager.parse(archive_path, parameters={**self.parameters, "attachments_dir": attachments_dir})
+
+            # the archive isn't read again by the other readers, so every member is extracted once
+            self.assertListEqual(["file_0.txt", "file_1.txt", "file_2.txt"], [call.kwargs["file_name"] for call in save_mock.call_args_list])
+            self.assertListEqual([], os.listdir(attachments_dir))
+
+    def test_max_total_size(self) -> None:
+        reader = ArchiveReader(config={"archive_max_total_size": 1000, "archive_chunk_size": 100})
+        with TemporaryDirectory() as tmpdir:
+            archive_path = os.path.join(tmpdir, "archive.zip")
+            with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr("small.txt", "a" * 500)
+                archive.writestr("big.txt", "b" * 10000)
+
+            attachments_dir = os.path.join(tmpdir, "attachments")
+            os.makedirs(attachments_dir)
+            with self.assertRaises(ArchiveLimitError):
+                reader.read(archive_path, parameters={**self.parameters, "attachments_dir": attachments_dir})
+            # the partially written file and the members extracted before it are removed
+            self.assertListEqual([], os.listdir(attachments_dir))
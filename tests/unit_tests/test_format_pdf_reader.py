@@ -19,6 +19,7 @@ class TestPDFReader(unittest.TestCase):
     checkpoint_path = os.path.join(get_test_config()["resources_path"], "scan_orientation_efficient_net_b0.pth")
     config = get_test_config()
     orientation_classifier = ColumnsOrientationClassifier(on_gpu=False, checkpoint_path=checkpoint_path, config=config)
+    orientation_imgs_path = [os.path.join(os.path.dirname(__file__), f"../data/scanned/orient_{i}.png") for i in range(1, 9)]
 
     def _split_lines_on_pages(self, lines: List[LineWithMeta]) -> List[List[str]]:
         pages = set(map(lambda x: x.metadata.page_id, lines))
@@ -42,17 +43,23 @@ class TestPDFReader(unittest.TestCase):
 
     def test_scan_orientation(self) -> None:
         skew_corrector = SkewCorrector()
-        imgs_path = [f"../data/scanned/orient_{i}.png"for i in range(1, 9)]
         angles = [90.0, 90.0, 270.0, 270.0, 180.0, 270.0, 180.0, 270.0]
         max_delta = 10.0
-        for i in range(len(imgs_path)):
-            path = os.path.join(os.path.dirname(__file__), imgs_path[i])
+        for i, path in enumerate(self.orientation_imgs_path):
             image = cv2.imread(path)
             _, angle_predict = self.orientation_classifier.predict(image)
             rotated, angle = skew_corrector.preprocess(image, {"orientation_angle": angle_predict})
             angle = angle["rotated_angle"]
             self.assertTrue(abs(angle - angles[i]) < max_delta)
 
+    def test_scan_orientation_batch(self) -> None:
+        images = [cv2.imread(path) for path in self.orientation_imgs_path]
+
+        predictions = self.orientation_classifier.predict_batch(images, batch_size=3)
+        self.assertEqual(len(images), len(predictions))
+        for image, prediction in zip(images, predictions):
+            self.assertEqual(self.orientation_classifier.predict(image), prediction)
+
     def test_header_footer_search(self) -> None:
         config = get_test_config()
         any_doc_reader = PdfTxtlayerReader(config=config)
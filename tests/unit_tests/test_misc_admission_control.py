@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+
+from dedoc.api.admission_control import AdmissionController, AdmissionMiddleware
+from dedoc.common.exceptions.service_busy_error import ServiceBusyError
+
+
+class TestAdmissionControl(unittest.TestCase):
+
+    def test_requests_limit(self) -> None:
+        controller = AdmissionController(max_requests=2)
+        tickets = [controller.admit(client="first", size=10), controller.admit(client="second", size=10)]
+        with self.assertRaises(ServiceBusyError):
+            controller.admit(client="third", size=10)
+        self.assertEqual(1, controller.get_info()["rejected"]["requests"])
+
+        tickets[0].release()
+        tickets[0].release()  # the ticket is released only once
+        self.assertEqual(1, controller.requests)
+        controller.admit(client="third", size=10)
+
+    def test_bytes_limit(self) -> None:
+        controller = AdmissionController(max_bytes=100)
+        ticket = controller.admit(client="first", size=60)
+        with self.assertRaises(ServiceBusyError):
+            controller.admit(client="second", size=60)
+        ticket.release()
+
+        # a request bigger than the limit is admitted if there are no other requests
+        big_ticket = controller.admit(client="second", size=1000)
+        self.assertEqual(1000, controller.bytes)
+        big_ticket.release()
+        self.assertEqual(0, controller.bytes)
+        self.assertEqual(1, controller.get_info()["rejected"]["bytes"])
+
+    def test_client_limit(self) -> None:
+        controller = AdmissionController(max_client_requests=1)
+        ticket = controller.admit(client="first", size=0)
+        with self.assertRaises(ServiceBusyError):
+            controller.admit(client="first", size=0)
+        controller.admit(client="second", size=0)
+        ticket.release()
+        controller.admit(client="first", size=0)
+        self.assertEqual(dict(requests=2, bytes=0, clients=2, rejected=dict(requests=0, bytes=0, client_requests=1)), controller.get_info())
+
+    def test_middleware(self) -> None:
+        controller = AdmissionController(max_requests=1)
+        tickets_in_app = []
+
+        async def app(scope: dict, receive: object, send: object) -> None:
+            tickets_in_app.append(scope.get("state", {}).get("admission_ticket"))
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        async def call(middleware: AdmissionMiddleware, path: str) -> list:
+            messages = []
+
+            async def send(message: dict) -> None:
+                messages.append(message)
+
+            scope = {"type": "http", "method": "POST", "path": path, "headers": [(b"content-length", b"42")], "client": ("127.0.0.1", 1)}
+            await middleware(scope, None, send)
+            return messages
+
+        middleware = AdmissionMiddleware(app, controller=controller, paths=["/upload"], retry_after=5)
+        messages = asyncio.run(call(middleware, "/upload"))
+        self.assertEqual(200, messages[0]["status"])
+        self.assertEqual(42, tickets_in_app[0].size)
+        self.assertEqual(0, controller.requests)
+
+        controller.admit(client="other", size=0)
+        messages = asyncio.run(call(middleware, "/upload"))
+        self.assertEqual(503, messages[0]["status"])
+        self.assertIn((b"retry-after", b"5"), messages[0]["headers"])
+        self.assertEqual(1, len(tickets_in_app))
+
+        # other paths aren't limited
+        messages = asyncio.run(call(middleware, "/version"))
+        self.assertEqual(200, messages[0]["status"])
+        self.assertIsNone(tickets_in_app[1])
@@ -0,0 +1,56 @@
+import os
+import time
+import unittest
+from tempfile import TemporaryDirectory
+
+from dedoc.api.attachment_store import AttachmentStore
+from dedoc.common.exceptions.attachment_not_found_error import AttachmentNotFoundError
+
+
+class TestAttachmentStore(unittest.TestCase):
+
+    def __write_file(self, directory: str, file_name: str, content: bytes) -> str:
+        path = os.path.join(directory, file_name)
+        with open(path, "wb") as file:
+            file.write(content)
+        return path
+
+    def test_content_addressing(self) -> None:
+        with TemporaryDirectory() as files_dir, TemporaryDirectory() as store_dir:
+            store = AttachmentStore(path=store_dir, ttl=60)
+            first_id = store.put(self.__write_file(files_dir, "first.PNG", b"image"))
+            second_id = store.put(self.__write_file(files_dir, "second.png", b"image"))
+            other_id = store.put(self.__write_file(files_dir, "other.png", b"other image"))
+
+            self.assertTrue(first_id.endswith(".png"))
+            self.assertEqual(first_id, second_id)
+            self.assertNotEqual(first_id, other_id)
+            with open(store.get_path(first_id), "rb") as file:
+                self.assertEqual(b"image", file.read())
+
+            long_extension_id = store.put(self.__write_file(files_dir, "file.very_long_extension_of_file", b"data"))
+            self.assertEqual(64, len(long_extension_id))
+
+    def test_expiration(self) -> None:
+        with TemporaryDirectory() as files_dir, TemporaryDirectory() as store_dir:
+            store = AttachmentStore(path=store_dir, ttl=60)
+            attachment_id = store.put(self.__write_file(files_dir, "file.txt", b"text"))
+            attachment_path = store.get_path(attachment_id)
+
+            # the saving of the same file prolongs the storage time
+            os.utime(attachment_path, (time.time() - 100, time.time() - 100))
+            self.assertEqual(attachment_id, store.put(os.path.join(files_dir, "file.txt")))
+            self.assertEqual(attachment_path, store.get_path(attachment_id))
+
+            os.utime(attachment_path, (time.time() - 100, time.time() - 100))
+            with self.assertRaises(AttachmentNotFoundError):
+                store.get_path(attachment_id)
+            store.remove_expired()
+            self.assertFalse(os.path.exists(attachment_path))
+
+    def test_wrong_id(self) -> None:
+        with TemporaryDirectory() as store_dir:
+            store = AttachmentStore(path=store_dir, ttl=60)
+            for attachment_id in ("unknown", "../../etc/passwd", "a" * 64, "a" * 64 + "/../x"):
+                with self.assertRaises(AttachmentNotFoundError):
+                    store.get_path(attachment_id)
@@ -0,0 +1,110 @@
+import os
+import threading
+import time
+import unittest
+from tempfile import TemporaryDirectory
+from typing import Optional
+
+from dedoc.attachments_handler.attachments_handler import AttachmentsHandler
+from dedoc.common.exceptions.bad_file_error import BadFileFormatError
+from dedoc.data_structures.attached_file import AttachedFile
+from dedoc.data_structures.document_metadata import DocumentMetadata
+from dedoc.data_structures.parsed_document import ParsedDocument
+from dedoc.data_structures.unstructured_document import UnstructuredDocument
+from dedoc.metadata_extractors.concrete_metadata_extractors.base_metadata_extractor import BaseMetadataExtractor
+from dedoc.metadata_extractors.metadata_extractor_composition import MetadataExtractorComposition
+from dedoc.utils.parsing_metrics import add_pages, collect_parsing_metrics, measure_stage
+from dedoc.utils.utils import get_empty_content
+
+
+class _SlowParser:
+    """
+    Document parser with the interface of DedocManager, the parsing of "slow" files takes time and "broken" files raise an error
+    """
+
+    def __init__(self) -> None:
+        self.document_metadata_extractor = MetadataExtractorComposition(extractors=[BaseMetadataExtractor()])
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def parse(self, file_path: str, parameters: Optional[dict] = None) -> ParsedDocument:
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            if "broken" in file_path:
+                raise BadFileFormatError("broken attachment")
+            with measure_stage("reader"):
+                time.sleep(0.2)
+            add_pages(1)
+            metadata = DocumentMetadata(**self.document_metadata_extractor.extract(file_path=file_path, parameters=parameters))
+            return ParsedDocument(content=get_empty_content(), metadata=metadata)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class TestAttachmentsHandler(unittest.TestCase):
+
+    def __get_document(self, tmpdir: str, names: list) -> UnstructuredDocument:
+        attachments = []
+        for name in names:
+            path = os.path.join(tmpdir, name)
+            with open(path, "w") as f:
+                f.write(name)
+            attachments.append(AttachedFile(original_name=name, tmp_file_path=path, need_content_analysis=True, uid=f"uid_{name}"))
+        return UnstructuredDocument(tables=[], lines=[], attachments=attachments)
+
+    def test_parallel_attachments_order(self) -> None:
+        handler = AttachmentsHandler(config={"attachments_workers": 4})
+        parser = _SlowParser()
+        names = [f"slow_{i}.txt" for i in range(3)] + ["broken.txt"] + [f"slow_{i}.txt" for i in range(3, 8)]
+
+        with TemporaryDirectory() as tmpdir:
+            document = self.__get_document(tmpdir, names)
+            start = time.time()
+            attachments = handler.handle_attachments(document_parser=parser, document=document, parameters={"with_attachments": "true"})
+            duration = time.time() - start
+
+        self.assertListEqual(names, [attachment.metadata.file_name for attachment in attachments])
+        self.assertListEqual([f"uid_{name}" for name in names], [attachment.metadata.uid for attachment in attachments])
+        self.assertGreater(parser.max_active, 1)
+        self.assertLessEqual(parser.max_active, 4)
+        self.assertLess(duration, 0.2 * 8)
+
+    def test_sequential_attachments(self) -> None:
+        handler = AttachmentsHandler(config={})
+        parser = _SlowParser()
+        names = ["slow_1.txt", "broken.txt", "slow_2.txt"]
+
+        with TemporaryDirectory() as tmpdir:
+            document = self.__get_document(tmpdir, names)
+            attachments = handler.handle_attachments(document_parser=parser, document=document, parameters={"with_attachments": "true"})
+
+        self.assertListEqual(names, [attachment.metadata.file_name for attachment in attachments])
+        self.assertEqual(1, parser.max_active)
+
+    def test_parallel_attachments_metrics(self) -> None:
+        handler = AttachmentsHandler(config={"attachments_workers": 2})
+        parser = _SlowParser()
+
+        def parse_other_document() -> None:
+            # the metrics collected in the other thread at the same time aren't mixed with the metrics of the document
+            with collect_parsing_metrics() as other_metrics:
+                with measure_stage("structure"):
+                    time.sleep(0.2)
+            self.assertSetEqual({"structure"}, set(other_metrics.stage_durations))
+
+        with TemporaryDirectory() as tmpdir:
+            document = self.__get_document(tmpdir, ["slow_1.txt", "slow_2.txt"])
+            other_thread = threading.Thread(target=parse_other_document)
+            with collect_parsing_metrics() as metrics:
+                other_thread.start()
+                handler.handle_attachments(document_parser=parser, document=document, parameters={"with_attachments": "true"})
+            other_thread.join()
+
+        self.assertEqual(2, parser.max_active)
+        self.assertEqual(2, metrics.pages)
+        self.assertSetEqual({"reader"}, set(metrics.stage_durations))
+        self.assertGreaterEqual(metrics.stage_durations["reader"], 0.4)
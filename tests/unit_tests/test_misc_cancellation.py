@@ -0,0 +1,70 @@
+import os
+import threading
+import unittest
+import zipfile
+from tempfile import TemporaryDirectory
+
+from dedoc.common.exceptions.parsing_cancelled_error import ParsingCancelledError
+from dedoc.dedoc_manager import DedocManager
+from dedoc.readers.pdf_reader.pdf_txtlayer_reader.pdf_txtlayer_reader import PdfTxtlayerReader
+from dedoc.utils.cancellation import cancellable, set_cancellation_event
+from tests.test_utils import get_test_config
+
+
+class TestCancellation(unittest.TestCase):
+    config = get_test_config()
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
+
+    def setUp(self) -> None:
+        self.event = threading.Event()
+        set_cancellation_event(self.event)
+
+    def tearDown(self) -> None:
+        set_cancellation_event(None)
+
+    def test_cancellable(self) -> None:
+        items = []
+        with self.assertRaises(ParsingCancelledError):
+            for item in cancellable(range(10)):
+                items.append(item)
+                if item == 2:
+                    self.event.set()
+        self.assertListEqual([0, 1, 2], items)
+
+    def test_manager(self) -> None:
+        manager = DedocManager(config=self.config)
+        file_path = os.path.join(self.data_dir, "txt", "example.txt")
+        self.event.set()
+        with self.assertRaises(ParsingCancelledError):
+            manager.parse(file_path)
+
+        # the same manager parses the next document after the cancellation
+        self.event.clear()
+        self.assertGreater(len(manager.parse(file_path).content.structure.subparagraphs), 0)
+
+    def test_pdf_pages(self) -> None:
+        reader = PdfTxtlayerReader(config=self.config)
+        file_path = os.path.join(self.data_dir, "pdf_with_text_layer", "english_doc.pdf")
+        self.event.set()
+        with self.assertRaises(ParsingCancelledError):
+            reader.read(file_path, parameters={"pdf_with_text_layer": "true"})
+
+    def test_attachments(self) -> None:
+        manager = DedocManager(config=self.config)
+        with TemporaryDirectory() as tmpdir:
+            archive_path = os.path.join(tmpdir, "archive.zip")
+            with zipfile.ZipFile(archive_path, "w") as archive:
+                archive.writestr("first.txt", "first file")
+                archive.writestr("second.txt", "second file")
+
+            # cancellation during the attachments parsing isn't converted to the empty attachment
+            original_parse = manager.parse
+
+            def parse_and_cancel(file_path: str, parameters: dict = None) -> object:
+                if file_path != archive_path:
+                    self.event.set()
+                return original_parse(file_path, parameters)
+
+            manager.parse = parse_and_cancel
+            with self.assertRaises(ParsingCancelledError):
+                manager.parse(archive_path, parameters={"with_attachments": "true", "need_content_analysis": "true"})
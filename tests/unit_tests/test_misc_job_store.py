@@ -0,0 +1,37 @@
+import io
+import os
+import time
+import unittest
+from tempfile import TemporaryDirectory
+
+from fastapi import UploadFile
+
+from dedoc.api.job_store import JobStatus, JobStore
+from dedoc.common.exceptions.job_not_found_error import JobNotFoundError
+
+
+class TestJobStore(unittest.TestCase):
+
+    def __create(self, store: JobStore) -> str:
+        return store.create(UploadFile(file=io.BytesIO(b"text"), filename="file.txt"), parameters={})["job_id"]
+
+    def test_expiration(self) -> None:
+        with TemporaryDirectory() as store_dir:
+            store = JobStore(path=store_dir, ttl=60)
+            self.assertEqual(6, store.cleanup_interval)
+            finished_id = self.__create(store)
+            store.save_result(finished_id, result=b"result", status=JobStatus.done)
+            store.update_info(finished_id, finished_time=time.time() - 61)
+            queued_id = self.__create(store)
+
+            # the expired jobs are removed only by the periodic cleanup, not during the creation of jobs
+            new_id = self.__create(store)
+            self.assertEqual(b"result", store.load_result(finished_id))
+
+            store.remove_expired()
+            with self.assertRaises(JobNotFoundError):
+                store.get_info(finished_id)
+            self.assertListEqual([queued_id, new_id], [job["job_id"] for job in store.get_unfinished()])
+            with open(store.get_file_path(queued_id), "rb") as file:
+                self.assertEqual(b"text", file.read())
+            self.assertTrue(os.path.isdir(store.get_files_dir(new_id)))
@@ -0,0 +1,73 @@
+import os
+import pickle
+import unittest
+
+from dedoc.dedoc_manager import DedocManager
+from dedoc.extensions import recognized_extensions, recognized_mimes
+from dedoc.manager_config import _get_manager_config
+from dedoc.readers.pdf_reader.pdf_image_reader.pdf_image_reader import PdfImageReader
+from dedoc.readers.txt_reader.raw_text_reader import RawTextReader
+from dedoc.utils.lazy_component import LazyComponent
+from tests.test_utils import get_test_config
+
+
+class TestLazyComponents(unittest.TestCase):
+    config = get_test_config()
+
+    def __get_initialized(self, manager: DedocManager) -> set:
+        components = manager.converter.converters + manager.reader.readers + manager.document_metadata_extractor.extractors
+        components += list(manager.structure_extractor.extractors.values())
+        return {component.component_class.__name__ for component in components if component.is_initialized}
+
+    def test_lazy_component(self) -> None:
+        component = LazyComponent(RawTextReader, config=self.config)
+        self.assertFalse(component.is_initialized)
+        self.assertTrue(component.can_read(extension=".txt", mime="text/plain"))
+        self.assertTrue(component.is_initialized)
+        self.assertIsInstance(component.get(), RawTextReader)
+
+        component = pickle.loads(pickle.dumps(component))
+        self.assertTrue(component.can_read(extension=".txt", mime="text/plain"))
+
+    def test_can_read_without_construction(self) -> None:
+        component = LazyComponent(PdfImageReader, config=self.config)
+        self.assertFalse(component.can_read(file_path="file.docx"))
+        self.assertFalse(component.is_initialized)
+        self.assertTrue(component.can_read(file_path="file.png"))
+        self.assertTrue(component.is_initialized)
+
+    def test_can_read_format_of_readers(self) -> None:
+        # the check by the class of the reader doesn't reject the files, which the reader can read
+        formats = [(extension, None) for extensions in recognized_extensions for extension in extensions]
+        formats += [(None, mime) for mimes in recognized_mimes for mime in mimes]
+        readers = _get_manager_config(self.config)["reader"].readers
+        for reader in readers:
+            for extension, mime in formats:
+                for parameters in ({}, {"pdf_with_text_layer": "true"}, {"pdf_with_text_layer": "auto"}, {"pdf_with_text_layer": "tabby"}):
+                    if not reader.component_class.can_read_format(mime=mime, extension=extension):
+                        self.assertFalse(reader.get().can_read(mime=mime, extension=extension, parameters=parameters), (reader, extension, mime))
+
+    def test_parse_constructs_used_components(self) -> None:
+        manager = DedocManager(config=self.config, manager_config=_get_manager_config(self.config))
+        self.assertSetEqual(set(), self.__get_initialized(manager))
+
+        manager.parse(os.path.join(os.path.dirname(__file__), "..", "data", "docx", "example.docx"))
+        initialized = self.__get_initialized(manager)
+        self.assertIn("DocxReader", initialized)
+        self.assertNotIn("ArticleReader", initialized)
+        self.assertIn("DefaultStructureExtractor", initialized)
+        self.assertNotIn("PdfAutoReader", initialized)
+        self.assertNotIn("PdfImageReader", initialized)
+        self.assertNotIn("DiplomaStructureExtractor", initialized)
+
+    def test_warm_up(self) -> None:
+        manager = DedocManager(config=self.config, manager_config=_get_manager_config(self.config))
+        manager.warm_up(extensions=[".txt"], document_types=["other"])
+        initialized = self.__get_initialized(manager)
+        self.assertIn("RawTextReader", initialized)
+        self.assertIn("TxtConverter", initialized)
+        self.assertIn("DefaultStructureExtractor", initialized)
+        self.assertNotIn("PdfAutoReader", initialized)
+
+        manager.parse(os.path.join(os.path.dirname(__file__), "..", "data", "txt", "example.txt"))
+        self.assertSetEqual(initialized, self.__get_initialized(manager))
@@ -0,0 +1,70 @@
+import json
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import numpy as np
+
+from dedoc.api.ndjson_utils import iter_ndjson_records, read_ndjson_chunks, write_ndjson
+from dedoc.dedoc_manager import DedocManager
+from tests.test_utils import get_test_config
+
+
+class TestNdjson(unittest.TestCase):
+    manager = DedocManager(config=get_test_config())
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
+
+    def __get_nodes(self, node: dict) -> list:
+        nodes = [{key: value for key, value in node.items() if key != "subparagraphs"}]
+        for subparagraph in node["subparagraphs"]:
+            nodes.extend(self.__get_nodes(subparagraph))
+        return nodes
+
+    def test_records(self) -> None:
+        document = self.manager.parse(os.path.join(self.data_dir, "docx", "example.docx"))
+        api_document = document.to_api_schema().model_dump()
+        records = list(iter_ndjson_records(document))
+
+        self.assertEqual("document", records[0]["type"])
+        self.assertIsNone(records[0]["parent"])
+        self.assertEqual(api_document["metadata"], records[0]["data"]["metadata"])
+        self.assertEqual(api_document["version"], records[0]["data"]["version"])
+
+        node_records = [record["data"] for record in records if record["type"] == "node"]
+        self.assertListEqual(self.__get_nodes(api_document["content"]["structure"]), node_records)
+        table_records = [record["data"] for record in records if record["type"] == "table"]
+        self.assertListEqual(api_document["content"]["tables"], table_records)
+        self.assertListEqual(["document", "node", "table"], list(dict.fromkeys(record["type"] for record in records)))
+
+    def test_attachments(self) -> None:
+        with TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(self.data_dir, "with_attachments", "docx_with_images.docx")
+            document = self.manager.parse(file_path, parameters={"with_attachments": "true", "attachments_dir": tmpdir})
+        self.assertGreater(len(document.attachments), 0)
+        records = list(iter_ndjson_records(document))
+
+        document_records = [record for record in records if record["type"] == "document"]
+        self.assertEqual(len(document.attachments) + 1, len(document_records))
+        for attachment, record in zip(document.attachments, document_records[1:]):
+            self.assertEqual(attachment.metadata.uid, record["document"])
+            self.assertEqual(document.metadata.uid, record["parent"])
+
+    def test_write_and_read(self) -> None:
+        document = self.manager.parse(os.path.join(self.data_dir, "txt", "example.txt"))
+        with TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "result.ndjson")
+            write_ndjson(document, path)
+            content = b"".join(read_ndjson_chunks(path, chunk_size=100)).decode("utf-8")
+
+        lines = content.splitlines()
+        self.assertTrue(content.endswith("\n"))
+        self.assertListEqual(list(iter_ndjson_records(document)), [json.loads(line) for line in lines])
+
+    def test_numpy_values(self) -> None:
+        records = [dict(type="node", document="uid", data=dict(confidence=np.float32(0.5), page=np.int64(2), bbox=np.array([1, 2])))]
+        with TemporaryDirectory() as tmpdir, patch("dedoc.api.ndjson_utils.iter_ndjson_records", return_value=iter(records)):
+            path = os.path.join(tmpdir, "result.ndjson")
+            write_ndjson(document=None, path=path)
+            with open(path) as file:
+                self.assertListEqual([dict(type="node", document="uid", data=dict(confidence=0.5, page=2, bbox=[1, 2]))], [json.loads(line) for line in file])
@@ -0,0 +1,76 @@
+import os
+import time
+import unittest
+from typing import Iterator, Tuple
+
+from dedoc.readers.pdf_reader.pdf_base_reader import PdfBaseReader
+from dedoc.readers.pdf_reader.utils.page_pipeline import run_page_pipeline
+from tests.test_utils import get_test_config
+
+
+def square(page_number: int) -> int:
+    return page_number * page_number
+
+
+class PickleCountingReader(PdfBaseReader):
+    pickles_number = 0
+
+    def __getstate__(self) -> dict:
+        PickleCountingReader.pickles_number += 1
+        return self.__dict__
+
+    def _process_one_page(self, page_number: int) -> Tuple[int, int]:
+        return page_number * page_number, os.getpid()
+
+
+class TestPagePipeline(unittest.TestCase):
+
+    def test_results_order(self) -> None:
+        tasks = [(i, ) for i in range(20)]
+        self.assertListEqual([i * i for i in range(20)], run_page_pipeline(square, tasks, n_jobs=1, max_pages_in_flight=3))
+        self.assertListEqual([i * i for i in range(20)], run_page_pipeline(square, tasks, n_jobs=2, max_pages_in_flight=3))
+        self.assertListEqual([], run_page_pipeline(square, [], n_jobs=1, max_pages_in_flight=3))
+
+    def test_pages_in_flight(self) -> None:
+        taken, processed, max_in_flight = [0], [0], [0]
+
+        def get_tasks() -> Iterator[Tuple[int]]:
+            for i in range(10):
+                time.sleep(0.05)  # rasterization
+                taken[0] += 1
+                max_in_flight[0] = max(max_in_flight[0], taken[0] - processed[0])
+                yield (i, )
+
+        def process(page_number: int) -> int:
+            time.sleep(0.1)
+            processed[0] += 1
+            return page_number
+
+        start = time.time()
+        self.assertListEqual(list(range(10)), run_page_pipeline(process, get_tasks(), n_jobs=1, max_pages_in_flight=3))
+        # rasterization of the next pages and processing of the current page are overlapped (1.5 seconds without overlapping)
+        self.assertLess(time.time() - start, 1.3)
+        self.assertEqual(3, max_in_flight[0])
+
+    def test_exceptions(self) -> None:
+        def get_tasks() -> Iterator[Tuple[int]]:
+            yield (1, )
+            raise ValueError("bad page")
+
+        with self.assertRaises(ValueError):
+            run_page_pipeline(square, get_tasks(), n_jobs=1, max_pages_in_flight=2)
+
+        def process(page_number: int) -> int:
+            raise KeyError(page_number)
+
+        with self.assertRaises(KeyError):
+            run_page_pipeline(process, ((i, ) for i in range(100)), n_jobs=1, max_pages_in_flight=2)
+
+    def test_reader_in_workers(self) -> None:
+        reader = PickleCountingReader(config={**get_test_config(), "n_jobs": 2})
+        results = reader._run_page_pipeline("_process_one_page", ((i, ) for i in range(20)))
+
+        self.assertListEqual([i * i for i in range(20)], [result for result, _ in results])
+        self.assertNotIn(os.getpid(), [pid for _, pid in results])
+        # the workers create their own readers, the reader isn't sent with every page
+        self.assertEqual(0, PickleCountingReader.pickles_number)
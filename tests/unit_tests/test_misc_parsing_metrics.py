@@ -0,0 +1,64 @@
+import os
+import unittest
+
+from dedoc.api.metrics import ApiMetrics, Histogram
+from dedoc.dedoc_manager import DedocManager
+from dedoc.utils.parsing_metrics import collect_parsing_metrics, measure_stage
+from tests.test_utils import get_test_config
+
+
+class TestParsingMetrics(unittest.TestCase):
+    manager = DedocManager(config=get_test_config())
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
+
+    def test_stages(self) -> None:
+        with collect_parsing_metrics() as metrics:
+            self.manager.parse(os.path.join(self.data_dir, "docx", "example.docx"))
+
+        self.assertSetEqual({"converter", "reader", "metadata", "structure", "constructor"}, set(metrics.stage_durations))
+        self.assertTrue(all(duration >= 0 for duration in metrics.stage_durations.values()))
+        self.assertGreater(metrics.pages, 0)
+        self.assertEqual("done", metrics.status)
+
+    def test_no_collection(self) -> None:
+        with measure_stage("reader"):
+            pass
+
+        with collect_parsing_metrics() as metrics:
+            with collect_parsing_metrics() as inner_metrics:
+                with measure_stage("reader"):
+                    pass
+            with measure_stage("structure"):
+                pass
+        self.assertListEqual(["reader"], list(inner_metrics.stage_durations))
+        self.assertListEqual(["structure"], list(metrics.stage_durations))
+
+    def test_histogram(self) -> None:
+        histogram = Histogram("test_duration_seconds", "Test durations", label_names=["stage"], buckets=[0.1, 1])
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value, stage="reader")
+
+        self.assertListEqual([
+            "# HELP test_duration_seconds Test durations",
+            "# TYPE test_duration_seconds histogram",
+            'test_duration_seconds_bucket{stage="reader",le="0.1"} 2',
+            'test_duration_seconds_bucket{stage="reader",le="1.0"} 3',
+            'test_duration_seconds_bucket{stage="reader",le="+Inf"} 4',
+            'test_duration_seconds_sum{stage="reader"} 3.65',
+            'test_duration_seconds_count{stage="reader"} 4'
+        ], histogram.render())
+
+    def test_api_metrics(self) -> None:
+        metrics = ApiMetrics()
+        parsing_metrics = dict(stage_durations={"reader": 0.5}, pages=3, output_bytes=100, status="done")
+        metrics.observe_parsing(lane="fast", parsing_duration=0.7, input_bytes=10, parsing_metrics=parsing_metrics)
+        metrics.observe_parsing(lane="slow", parsing_duration=0.1, input_bytes=20, parsing_metrics={})
+        lines = metrics.render().splitlines()
+
+        self.assertIn('dedoc_documents_total{lane="fast",status="done"} 1', lines)
+        self.assertIn('dedoc_documents_total{lane="slow",status="failed"} 1', lines)
+        self.assertIn('dedoc_stage_duration_seconds_count{stage="reader"} 1', lines)
+        self.assertIn("dedoc_pages_total 3", lines)
+        self.assertIn("dedoc_input_bytes_total 30", lines)
+        self.assertIn("dedoc_output_bytes_total 100", lines)
+        self.assertIn('dedoc_worker_busy_seconds_total{lane="fast"} 0.7', lines)
@@ -0,0 +1,37 @@
+from typing import List
+from unittest import TestCase
+
+from dedoc.data_structures.line_metadata import LineMetadata
+from dedoc.data_structures.line_with_meta import LineWithMeta
+from dedoc.data_structures.unstructured_document import UnstructuredDocument
+from dedoc.readers.pdf_reader.pdf_auto_reader.pdf_auto_reader import PdfAutoReader
+from tests.test_utils import get_test_config
+
+
+class TestPdfAutoReader(TestCase):
+    reader = PdfAutoReader(config=get_test_config())
+
+    def __get_document(self, page_ids: List[int], warnings: List[str]) -> UnstructuredDocument:
+        lines = [LineWithMeta(line=f"page {page_id}", metadata=LineMetadata(page_id=page_id, line_id=None)) for page_id in page_ids]
+        return UnstructuredDocument(lines=lines, tables=[], attachments=[], warnings=warnings)
+
+    def test_merge_scanned_pages(self) -> None:
+        document = self.__get_document(page_ids=[0, 1, 2, 3], warnings=["Assume document has a correct textual layer"])
+        recognized_pages = [
+            self.__get_document(page_ids=[1], warnings=["Can't detect the orientation of the page"]),
+            self.__get_document(page_ids=[3], warnings=["Can't detect the orientation of the page", "Low quality of the page"])
+        ]
+        result = self.reader._PdfAutoReader__merge_documents(document, recognized_pages, {1, 3})
+
+        self.assertListEqual(["page 0", "page 1", "page 2", "page 3"], [line.line for line in result.lines])
+        self.assertListEqual([0, 1, 2, 3], [line.metadata.line_id for line in result.lines])
+        # the warnings of the recognized pages are kept
+        self.assertListEqual(
+            ["Assume document has a correct textual layer", "Can't detect the orientation of the page", "Low quality of the page"], result.warnings
+        )
+
+    def test_scanned_pages_warnings(self) -> None:
+        get_warnings = self.reader._PdfAutoReader__get_scanned_pages_warnings
+        self.assertListEqual(["Assume the first page hasn't a textual layer"], get_warnings([0]))
+        self.assertListEqual(["Assume the first page hasn't a textual layer", "Assume page 3 hasn't a textual layer"], get_warnings([0, 2]))
+        self.assertListEqual(["Assume pages 2, 5 haven't a textual layer"], get_warnings([1, 4]))
@@ -0,0 +1,74 @@
+import io
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from pypdf import PdfReader
+
+from dedoc.attachments_extractors.concrete_attachments_extractors.pdf_attachments_extractor import PDFAttachmentsExtractor
+from dedoc.config import get_config
+from dedoc.metadata_extractors.concrete_metadata_extractors.pdf_metadata_extractor import PdfMetadataExtractor
+from dedoc.utils.pdf_utils import get_pdf_context, get_pdf_page_count, share_pdf_contexts
+from dedoc.utils.utils import calculate_file_hash
+
+
+class TestPdfContext(TestCase):
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "with_attachments", "example_with_attachments_depth_1.pdf"))
+
+    def test_shared_context(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "file.pdf")
+            shutil.copy(self.path, file_path)
+
+            with share_pdf_contexts(tmp_dir):
+                context = get_pdf_context(file_path)
+                self.assertIs(context, get_pdf_context(file_path))
+                self.assertIsNot(get_pdf_context(self.path), get_pdf_context(self.path))
+
+                # the shared context isn't closed by its consumers, the file is read lazily, it isn't loaded into memory
+                with context:
+                    reader = context.reader
+                self.assertIs(reader, context.reader)
+                self.assertIsInstance(reader.stream, io.BufferedReader)
+                self.assertFalse(reader.stream.closed)
+
+                # the context is created again for the changed file
+                with open(file_path, "ab") as file:
+                    file.write(b"\n")
+                self.assertIsNot(context, get_pdf_context(file_path))
+
+            self.assertIsNot(get_pdf_context(file_path), get_pdf_context(file_path))
+            self.assertTrue(reader.stream.closed)
+
+    def test_single_parsing(self) -> None:
+        config = get_config()
+        with tempfile.TemporaryDirectory() as tmp_dir, share_pdf_contexts(tmp_dir):
+            file_path = os.path.join(tmp_dir, "file.pdf")
+            shutil.copy(self.path, file_path)
+
+            with patch("dedoc.utils.pdf_utils.PdfReader", wraps=PdfReader) as reader_mock:
+                self.assertEqual(1, get_pdf_page_count(file_path))
+                self.assertEqual(calculate_file_hash(file_path), get_pdf_context(file_path).file_hash)
+                attachments = PDFAttachmentsExtractor(config=config).extract(file_path, parameters={"attachments_dir": tmp_dir})
+                metadata = PdfMetadataExtractor(config=config).extract(file_path)
+
+            self.assertEqual(1, reader_mock.call_count)
+            self.assertListEqual(["header_test.pdf", "example_with_table4.jpg"], [attachment.original_name for attachment in attachments[:2]])
+            self.assertEqual("LibreOffice 6.0", metadata["producer"])
+
+    def test_broken_file(self) -> None:
+        with tempfile.NamedTemporaryFile(suffix=".pdf") as file:
+            file.write(b"not a pdf")
+            file.flush()
+            self.assertIsNone(get_pdf_page_count(file.name))
+            self.assertListEqual([], PDFAttachmentsExtractor(config=get_config()).extract(file.name))
+            self.assertTrue(PdfMetadataExtractor(config=get_config()).extract(file.name)["broken_pdf"])
+
+    def test_not_strict_parsing(self) -> None:
+        # the file has an incorrect cross-reference table, pypdf parses it in the non-strict mode, so the file isn't reported as broken
+        path = os.path.join(os.path.dirname(__file__), "..", "data", "pdf_auto", "e09d__cs-pspc-xg-15p-portable-radio-quick-guide.pdf")
+        metadata = PdfMetadataExtractor(config=get_config()).extract(path)
+        self.assertNotIn("broken_pdf", metadata)
+        self.assertEqual("Quick Guide", metadata["subject"])
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import os
+import pickle
+import queue
+import unittest
+from typing import Tuple
+from unittest.mock import patch
+
+from dedoc.api.process_handler import ProcessHandler
+
+
+class FakeWorker:
+    """
+    Parsing worker without child process: the result of the task is available immediately after put_task (or after cancel for the blocking tasks)
+    """
+    def __init__(self, worker_id: int, logger: logging.Logger, max_documents: int = 0, max_memory: int = 0) -> None:
+        self.worker_id = worker_id
+        self.memory = 0
+        self.recycles_count = 0
+        self.results = queue.Queue()
+        self.restarts_count = 0
+        self.checked_memory = []
+        self.stop_on_cancel = True
+
+    def put_task(self, parameters: dict, file_path: str, tmpdir: str) -> None:
+        if not parameters.get("block", False):
+            self.results.put((pickle.dumps(parameters["result"]), dict(memory=1)))
+
+    def get_result(self) -> Tuple[bytes, dict]:
+        results = self.results
+        return results.get()
+
+    def cancel(self) -> None:
+        if self.stop_on_cancel:
+            self.results.put((pickle.dumps({"msg": "cancelled", "code": 499}), dict(memory=1)))
+
+    def restart(self) -> None:
+        # the thread waiting for the result of the previous child process is released
+        self.restarts_count += 1
+        previous_results, self.results = self.results, queue.Queue()
+        previous_results.put((pickle.dumps({"msg": "restarted", "code": 500}), {}))
+
+    def is_alive(self) -> bool:
+        return True
+
+    def check_recycling(self, memory: int) -> None:
+        self.checked_memory.append(memory)
+
+
+class TestProcessHandler(unittest.TestCase):
+    file_path = os.path.join(os.path.dirname(__file__), "..", "data", "txt", "example.txt")
+
+    def setUp(self) -> None:
+        super().setUp()
+        with patch("dedoc.api.process_handler.ParsingWorker", FakeWorker):
+            self.handler = ProcessHandler(logger=logging.getLogger(), n_workers=1, n_fast_workers=0)
+        self.handler.cancel_timeout = 0.1
+        self.worker = self.handler.workers[0]
+        self.lane = self.handler.lanes["slow"]
+
+    def tearDown(self) -> None:
+        self.handler.executor.shutdown(wait=True)
+        super().tearDown()
+
+    async def __parse(self, result: object, **kwargs: object) -> object:
+        parameters = dict(result=result, block=kwargs.pop("block", False))
+        return pickle.loads(await self.handler.get_result(parameters=parameters, file_path=self.file_path, tmpdir="", **kwargs))
+
+    def test_acquire_release(self) -> None:
+        async def run() -> None:
+            self.assertEqual("first", await self.__parse("first"))
+            self.assertEqual("second", await self.__parse("second"))
+
+            # the second request waits until the worker is released by the first one
+            tasks = [asyncio.create_task(self.__parse(name)) for name in ("third", "fourth")]
+            self.assertListEqual(["third", "fourth"], await asyncio.gather(*tasks))
+            self.assertEqual(1, self.lane.free_workers.qsize())
+
+        asyncio.run(run())
+        self.assertEqual(0, self.worker.restarts_count)
+        self.assertListEqual([1, 1, 1, 1], self.worker.checked_memory)
+        self.assertEqual(0, self.handler.metrics.busy_workers.values[("slow", )])
+
+    def test_restart_if_result_isnt_consumed(self) -> None:
+        def on_start() -> None:
+            raise RuntimeError("on_start failed")
+
+        async def run() -> None:
+            with self.assertRaises(RuntimeError):
+                await self.__parse("stale", on_start=on_start)
+            self.assertEqual(1, self.worker.restarts_count)
+            # the result of the failed request isn't returned to the next one
+            self.assertEqual("next", await self.__parse("next"))
+
+        asyncio.run(run())
+        self.assertEqual(1, self.worker.restarts_count)
+        self.assertEqual(1, self.lane.free_workers.qsize())
+
+    def test_cancel(self) -> None:
+        async def cancel_parsing() -> None:
+            task = asyncio.create_task(self.__parse("cancelled", block=True))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        async def run() -> None:
+            # the worker stops the cancelled task, so it isn't restarted
+            await cancel_parsing()
+            self.assertEqual(0, self.worker.restarts_count)
+            self.assertEqual("next", await self.__parse("next"))
+
+            # the worker doesn't stop the cancelled task in time, so it's restarted
+            self.worker.stop_on_cancel = False
+            await cancel_parsing()
+            self.assertEqual(1, self.worker.restarts_count)
+            self.assertEqual("next", await self.__parse("next"))
+
+        asyncio.run(run())
+        self.assertEqual(1, self.lane.free_workers.qsize())
@@ -0,0 +1,82 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from dedoc.config import get_config
+from dedoc.dedoc_manager import DedocManager
+from dedoc.manager_config import get_manager_config
+from dedoc.results_cache.disk_results_cache import DiskResultsCache
+from dedoc.results_cache.memory_results_cache import MemoryResultsCache
+
+
+class TestResultsCache(TestCase):
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "csvs"))
+    config = get_config()
+
+    def test_memory_cache_eviction(self) -> None:
+        cache = MemoryResultsCache(max_size=10, config=self.config)
+        cache._put("a", b"12345")
+        cache._put("b", b"12345")
+        self.assertEqual(b"12345", cache._get("a"))  # "a" becomes the most recently used
+        cache._put("c", b"123")
+        self.assertIsNone(cache._get("b"))
+        self.assertEqual(b"12345", cache._get("a"))
+        self.assertEqual(b"123", cache._get("c"))
+
+    def test_disk_cache_eviction(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = DiskResultsCache(path=tmpdir, max_size=10, config=self.config)
+            cache._put("a", b"12345")
+            os.utime(os.path.join(tmpdir, "a.pickle"), (1, 1))
+            cache._put("b", b"12345")
+            cache._put("c", b"123")
+            self.assertIsNone(cache._get("a"))
+            self.assertEqual(b"12345", cache._get("b"))
+            self.assertEqual(b"123", cache._get("c"))
+            cache.clear()
+            self.assertIsNone(cache._get("b"))
+
+    def test_key(self) -> None:
+        cache = MemoryResultsCache(max_size=10, config=self.config)
+        file_path = os.path.join(self.path, "csv_tab.tsv")
+        key = cache.get_key(file_path, {"document_type": "", "attachments_dir": "/tmp/1"})
+        self.assertEqual(key, cache.get_key(file_path, {"document_type": "", "attachments_dir": "/tmp/2"}))
+        self.assertNotEqual(key, cache.get_key(file_path, {"document_type": "law", "attachments_dir": "/tmp/1"}))
+        self.assertNotEqual(key, cache.get_key(os.path.join(self.path, "csv_coma.csv"), {"document_type": "", "attachments_dir": "/tmp/1"}))
+
+    def test_parse_with_cache(self) -> None:
+        cache = MemoryResultsCache(max_size=10 * 1024 * 1024, config=self.config)
+        manager = DedocManager(config=self.config, manager_config={**get_manager_config(self.config), "results_cache": cache})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "copy.tsv")
+            shutil.copy(os.path.join(self.path, "csv_tab.tsv"), file_path)
+            result = manager.parse(os.path.join(self.path, "csv_tab.tsv"))
+            cached_result = manager.parse(file_path)
+
+        self.assertEqual("copy.tsv", cached_result.metadata.file_name)
+        self.assertEqual(result.metadata.uid, cached_result.metadata.uid)
+        cells = [[cell.get_text() for cell in row] for row in result.content.tables[0].cells]
+        self.assertListEqual(cells, [[cell.get_text() for cell in row] for row in cached_result.content.tables[0].cells])
+
+    def test_same_content_with_other_extension(self) -> None:
+        cache = MemoryResultsCache(max_size=10 * 1024 * 1024, config=self.config)
+        manager = DedocManager(config=self.config, manager_config={**get_manager_config(self.config), "results_cache": cache})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path, txt_path = os.path.join(tmpdir, "file.csv"), os.path.join(tmpdir, "file.txt")
+            shutil.copy(os.path.join(self.path, "csv_coma.csv"), csv_path)
+            shutil.copy(csv_path, txt_path)
+            csv_result = manager.parse(csv_path)
+            txt_result = manager.parse(txt_path)
+            cached_result = manager.parse(csv_path)
+
+        self.assertGreater(len(csv_result.content.tables), 0)
+        self.assertEqual(0, len(txt_result.content.tables))
+        self.assertEqual("text/plain", txt_result.metadata.file_type)
+        self.assertTrue(txt_result.metadata.temporary_file_name.endswith(".txt"))
+
+        self.assertEqual(len(csv_result.content.tables), len(cached_result.content.tables))
+        self.assertEqual(csv_result.metadata.file_type, cached_result.metadata.file_type)
+        self.assertTrue(cached_result.metadata.temporary_file_name.endswith(".csv"))
@@ -0,0 +1,50 @@
+import os
+from typing import List, Tuple
+from unittest import TestCase
+
+from dedoc.config import get_config
+from dedoc.readers.pdf_reader.pdf_auto_reader.pdf_auto_reader import PdfAutoReader
+from dedoc.readers.pdf_reader.pdf_txtlayer_reader.pdf_tabby_reader import PdfTabbyReader
+
+
+class TestTabbyExtractedPages(TestCase):
+    path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "pdf_with_text_layer", "multipage.pdf"))  # 9 pages
+
+    def test_read_extracted_pages(self) -> None:
+        reader = PdfTabbyReader(config=get_config())
+        expected = reader.read(self.path)
+
+        processed_pages = self.__spy_java_calls(reader)
+        extracted_pages = reader.extract_pages(self.path, parameters={"pages": "1:3"})
+        try:
+            self.assertEqual([(1, 3)], processed_pages)
+            result = reader.read(self.path, extracted_pages=extracted_pages)
+        finally:
+            extracted_pages.close()
+
+        # java is run only for the pages, which weren't extracted before
+        self.assertEqual([(1, 3), (4, 9)], processed_pages)
+        self.assertListEqual([(line.line, line.metadata.page_id) for line in expected.lines], [(line.line, line.metadata.page_id) for line in result.lines])
+        self.assertEqual(len(expected.tables), len(result.tables))
+        self.assertFalse(os.path.exists(extracted_pages.tmp_dir.name))
+
+    def test_auto_tabby_reads_pages_once(self) -> None:
+        reader = PdfAutoReader(config=get_config())
+        processed_pages = self.__spy_java_calls(reader.pdf_tabby_reader)
+        result = reader.read(self.path, parameters={"pdf_with_text_layer": "auto_tabby"})
+
+        self.assertIn("Assume document has a correct textual layer", result.warnings)
+        # the first 8 pages are extracted by java for textual layer detection and reused by the final reading
+        self.assertEqual([(1, 8), (9, 9)], processed_pages)
+        self.assertSetEqual(set(range(9)), {line.metadata.page_id for line in result.lines})
+
+    def __spy_java_calls(self, reader: PdfTabbyReader) -> List[Tuple[int, int]]:
+        processed_pages = []
+        process_pdf = reader._PdfTabbyReader__process_pdf
+
+        def spy(**kwargs: dict) -> dict:
+            processed_pages.append((kwargs["start_page"], kwargs["end_page"]))
+            return process_pdf(**kwargs)
+
+        reader._PdfTabbyReader__process_pdf = spy
+        return processed_pages
@@ -0,0 +1,36 @@
+import os
+import random
+import unittest
+
+import pandas as pd
+
+from dedoc.readers.pdf_reader.pdf_auto_reader.txtlayer_feature_extractor import TxtlayerFeatureExtractor
+from dedoc.structure_extractors.feature_extractors.char_features import symbols
+from tests.txtlayer_features_reference import reference_transform
+
+
+class TestTxtlayerFeatureExtractor(unittest.TestCase):
+    extractor = TxtlayerFeatureExtractor()
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
+
+    def test_same_features(self) -> None:
+        with open(os.path.join(self.data_dir, "txt", "example.txt")) as f:
+            document_text = f.read()
+        alphabet = symbols + "ёЁ\n\t ́Ѐђ—«»€😀\ud800ĀŹ"
+        random_generator = random.Random(0)
+        texts = [
+            document_text,
+            "\n".join(document_text.split("\n")[:3]),
+            "aB",
+            "Ёж",
+            "!!!",
+            "1",
+            "(Ab) [cD] {Ef} <Gh>",
+            "Текст на русском языке, English text 123.",
+            "ÄÖÜ ßàè ąęł ́̀",
+            "😀 a 😀 B",
+            "\ud800 lone surrogate",
+        ]
+        texts += ["".join(random_generator.choices(alphabet, k=random_generator.randint(1, 3000))) for _ in range(30)]
+
+        pd.testing.assert_frame_equal(reference_transform(texts), self.extractor.transform(texts), check_exact=True)
@@ -0,0 +1,43 @@
+import asyncio
+import os
+import unittest
+
+from dedoc.api.worker_lane import WorkerLane, get_lane_name
+from dedoc.common.exceptions.service_busy_error import ServiceBusyError
+
+
+class TestWorkerLanes(unittest.TestCase):
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
+    max_size = 10 * 1024 * 1024
+
+    def __get_lane(self, file_name: str, parameters: dict = None, max_size: int = max_size) -> str:
+        return get_lane_name(file_path=os.path.join(self.data_dir, file_name), parameters=parameters or {}, fast_max_file_size=max_size)
+
+    def test_fast_documents(self) -> None:
+        for file_name in ("txt/example.txt", "docx/example.docx", "htmls/example.html", "eml/message.eml", "json/0001-p1.json"):
+            self.assertEqual("fast", self.__get_lane(file_name), file_name)
+        self.assertEqual("fast", self.__get_lane("pdf_with_text_layer/english_doc.pdf", {"pdf_with_text_layer": "true"}))
+        self.assertEqual("fast", self.__get_lane("archives/zipka.zip", {"with_attachments": "true"}))
+
+    def test_slow_documents(self) -> None:
+        for file_name in ("scanned/orient_1.png", "file.bin", "pdf_with_text_layer/english_doc.pdf", "docx/english_doc.doc", "xlsx/example.ods"):
+            self.assertEqual("slow", self.__get_lane(file_name), file_name)
+        self.assertEqual("slow", self.__get_lane("pdf_with_text_layer/english_doc.pdf", {"pdf_with_text_layer": "auto_tabby"}))
+        self.assertEqual("slow", self.__get_lane("archives/zipka.zip", {"with_attachments": "true", "need_content_analysis": "true"}))
+        self.assertEqual("slow", self.__get_lane("txt/example.txt", max_size=10))
+
+    def test_queue_size(self) -> None:
+        async def run() -> None:
+            lane = WorkerLane(name="test", workers=["worker"], max_queue_size=1)
+            worker = await lane.acquire()
+            waiting = asyncio.create_task(lane.acquire())
+            await asyncio.sleep(0)
+            self.assertEqual(1, lane.queue_size)
+            with self.assertRaises(ServiceBusyError):
+                await lane.acquire()
+
+            lane.release(worker)
+            self.assertEqual("worker", await waiting)
+            self.assertEqual(0, lane.queue_size)
+
+        asyncio.run(run())
@@ -0,0 +1,71 @@
+import json
+import logging
+import os
+import pickle
+import time
+import unittest
+from tempfile import TemporaryDirectory
+
+from dedoc.api.parsing_worker import ParsingWorker
+
+
+class TestWorkerRecycling(unittest.TestCase):
+    data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
+    logger = logging.getLogger()
+
+    def __parse(self, worker: ParsingWorker) -> dict:
+        file_path = os.path.join(self.data_dir, "txt", "example.txt")
+        with TemporaryDirectory() as tmpdir:
+            worker.put_task(parameters={}, file_path=file_path, tmpdir=tmpdir)
+            result, parsing_metrics = worker.get_result()
+            with open(pickle.loads(result)) as result_file:
+                self.assertEqual("example.txt", json.load(result_file)["metadata"]["file_name"])
+        worker.check_recycling(memory=parsing_metrics["memory"])
+        return parsing_metrics
+
+    def __wait_replacement(self, worker: ParsingWorker, timeout: float = 60) -> None:
+        start = time.time()
+        while not worker.replacement.ready_event.is_set():
+            self.assertLess(time.time() - start, timeout)
+            time.sleep(0.1)
+
+    def test_max_documents(self) -> None:
+        worker = ParsingWorker(worker_id=0, logger=self.logger, max_documents=2)
+        try:
+            first_process = worker.process
+            self.__parse(worker)
+            self.assertIsNone(worker.replacement)
+            self.__parse(worker)
+            self.assertIsNotNone(worker.replacement)
+
+            # the old process parses documents until the replacement is ready
+            self.__parse(worker)
+            self.assertIs(first_process, worker.process)
+
+            self.__wait_replacement(worker)
+            self.__parse(worker)
+            self.assertIsNot(first_process, worker.process)
+            self.assertIsNone(worker.replacement)
+            self.assertEqual(1, worker.documents_count)
+            self.assertEqual(1, worker.recycles_count)
+
+            first_process.join(timeout=ParsingWorker.stop_timeout)
+            self.assertEqual(0, first_process.exitcode)
+        finally:
+            worker.terminate()
+
+    def test_max_memory(self) -> None:
+        worker = ParsingWorker(worker_id=0, logger=self.logger, max_memory=1)
+        try:
+            parsing_metrics = self.__parse(worker)
+            self.assertGreater(parsing_metrics["memory"], 1024 * 1024)
+            self.assertIsNotNone(worker.replacement)
+
+            # the replacement is used immediately if the worker is restarted
+            replacement_process = worker.replacement.process
+            worker.restart()
+            self.assertIs(replacement_process, worker.process)
+            self.assertIsNone(worker.replacement)
+            self.__parse(worker)
+        finally:
+            worker.terminate()
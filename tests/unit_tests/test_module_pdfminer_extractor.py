@@ -0,0 +1,69 @@
+import os
+import tempfile
+from typing import List, Tuple
+from unittest import TestCase
+
+import numpy as np
+
+from dedoc.readers.pdf_reader.pdf_base_reader import ParametersForParseDoc
+from dedoc.readers.pdf_reader.pdf_txtlayer_reader.pdfminer_reader import pdfminer_extractor
+from dedoc.readers.pdf_reader.pdf_txtlayer_reader.pdfminer_reader.pdfminer_extractor import PdfminerExtractor
+from dedoc.readers.pdf_reader.utils.page_pipeline import run_page_pipeline
+from tests.test_utils import get_test_config
+
+
+def handle_page_range(path: str, parameters: ParametersForParseDoc, first_page: int, last_page: int) -> List[Tuple[List[str], int]]:
+    extractor = PdfminerExtractor(config=get_test_config())
+    results = []
+    for page_layout in extractor.get_page_layouts(path=path, first_page=first_page, last_page=last_page):
+        # white page image, so the page isn't rasterized with poppler
+        page_image = np.full((int(page_layout.mediabox[3]), int(page_layout.mediabox[2]), 3), 255, dtype=np.uint8)
+        page = extractor.extract_text_layer(path=path, page_number=page_layout.page_number, parameters=parameters, page_layout=page_layout,
+                                            page_image=page_image)
+        results.append(([bbox.text for bbox in page.bboxes], len(page.attachments)))
+    return results
+
+
+class TestPdfminerExtractor(TestCase):
+    data_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "pdf_with_text_layer"))
+    extractor = PdfminerExtractor(config=get_test_config())
+
+    def tearDown(self) -> None:
+        self.extractor.close_document()
+        super().tearDown()
+
+    def test_page_ranges_in_page_workers(self) -> None:
+        # the documents with images, the ranges of their pages are analyzed in the page workers
+        for file_name in ("Document635.pdf", "prospectus.pdf"):
+            path = os.path.join(self.data_dir, file_name)
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                parameters = ParametersForParseDoc(
+                    is_one_column_document="auto", document_orientation="auto", language="rus+eng", need_header_footers_analysis=False,
+                    need_pdf_table_analysis=False, first_page=0, last_page=2, need_binarization=False, table_type="", with_attachments=True,
+                    attachments_dir=tmp_dir, need_content_analysis=False, need_gost_frame_analysis=False, pdf_with_txt_layer="true"
+                )
+                results = {}
+                for n_jobs in (1, 2):
+                    tasks = ((path, parameters, first_page, first_page + 1) for first_page in (0, 1))
+                    results[n_jobs] = run_page_pipeline(handle_page_range, tasks, n_jobs=n_jobs, max_pages_in_flight=2)
+
+            self.assertEqual(results[1], results[2])
+            self.assertListEqual([1, 1], [len(range_results) for range_results in results[2]])
+            self.assertGreater(sum(attachments_number for range_results in results[2] for _, attachments_number in range_results), 0)
+
+    def test_document_is_opened_once(self) -> None:
+        path = os.path.join(self.data_dir, "prospectus.pdf")
+        self.assertListEqual([0, 1], [page_layout.page_number for page_layout in self.extractor.get_page_layouts(path=path, first_page=0, last_page=2)])
+        document = pdfminer_extractor._opened_documents.document
+
+        # the next range continues the enumeration of pages of the opened document
+        self.assertListEqual([3], [page_layout.page_number for page_layout in self.extractor.get_page_layouts(path=path, first_page=3, last_page=4)])
+        self.assertIs(document, pdfminer_extractor._opened_documents.document)
+
+        # the previous pages are analyzed in the reopened document
+        self.assertListEqual([1], [page_layout.page_number for page_layout in self.extractor.get_page_layouts(path=path, first_page=1, last_page=2)])
+        self.assertIsNot(document, pdfminer_extractor._opened_documents.document)
+        self.assertTrue(document.file.closed)
+
+        self.extractor.close_document(path)
+        self.assertIsNone(pdfminer_extractor._opened_documents.document)
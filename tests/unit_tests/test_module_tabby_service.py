@@ -0,0 +1,135 @@
+import logging
+import os
+import shutil
+import stat
+import sys
+import tempfile
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+from dedoc.common.exceptions.tabby_pdf_error import TabbyPdfError
+from dedoc.readers.pdf_reader.pdf_txtlayer_reader.pdf_tabby_reader import PdfTabbyReader
+from dedoc.readers.pdf_reader.pdf_txtlayer_reader.tabbypdf.tabby_service import TabbyService
+from tests.test_utils import get_test_config
+
+# fake java, it implements the protocol of java/TabbyService.java: "-i ok.pdf" is handled, "-i error.pdf" isn't handled,
+# "-i fatal.pdf" breaks the JVM, "-i crash.pdf" stops the JVM without response, every handled request is written to the log file
+FAKE_JAVA = """#!{python}
+import json
+import os
+import sys
+
+log_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "requests.log")
+if sys.argv[1:] == ["--list-modules"]:
+    print("java.base@17\\njdk.compiler@17" if os.environ.get("FAKE_JAVA_COMPILER", "true") == "true" else "java.base@17")
+    sys.exit(0)
+if os.environ.get("FAKE_JAVA_BROKEN", "false") == "true":
+    sys.exit(1)
+
+print("READY", flush=True)
+for request in sys.stdin:
+    args = json.loads(request)
+    with open(log_path, "a") as log_file:
+        log_file.write(args[1] + "\\n")
+    if args[1] == "crash.pdf":
+        sys.exit(1)
+    if args[1] == "ok.pdf":
+        print("warning from the extractor", file=sys.stderr, flush=True)
+        print("OK", flush=True)
+    elif args[1] == "fatal.pdf":
+        print("FATAL java.lang.OutOfMemoryError", flush=True)
+    else:
+        print("ERROR java.io.IOException: broken file", flush=True)
+"""
+
+
+class TestTabbyService(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tmp_dir = tempfile.mkdtemp()
+        java_path = os.path.join(self.tmp_dir, "java")
+        with open(java_path, "w") as file:
+            file.write(FAKE_JAVA.format(python=sys.executable))
+        os.chmod(java_path, os.stat(java_path).st_mode | stat.S_IEXEC)
+
+        self.env_patch = patch.dict(os.environ, {"PATH": f"{self.tmp_dir}{os.pathsep}{os.environ.get('PATH', '')}"})
+        self.env_patch.start()
+        self.logger = logging.getLogger("test_tabby_service")
+
+    def tearDown(self) -> None:
+        self.env_patch.stop()
+        shutil.rmtree(self.tmp_dir)
+        super().tearDown()
+
+    def test_protocol(self) -> None:
+        service = TabbyService(jar_path="ispras_tbl_extr.jar", logger=self.logger)
+        try:
+            with self.assertLogs(self.logger, level="WARNING") as logs:
+                self.assertTrue(service.run(["-i", "ok.pdf"]))
+                service.stop()  # stderr is read in a separate thread, it's logged until the JVM is stopped
+            self.assertIn("Tabby service stderr: warning from the extractor", "\n".join(logs.output))
+
+            # documents failed inside the service are reported as errors, the JVM is restarted if it's broken
+            for file_name in ("error.pdf", "fatal.pdf", "crash.pdf"):
+                with self.assertRaises(TabbyPdfError):
+                    service.run(["-i", file_name])
+                self.assertTrue(service.is_enabled)
+            self.assertTrue(service.run(["-i", "ok.pdf"]))
+        finally:
+            service.stop()
+
+        self.assertListEqual(["ok.pdf", "error.pdf", "fatal.pdf", "crash.pdf", "ok.pdf"], self.__get_requests())
+
+    def test_no_fallback_for_failed_document(self) -> None:
+        reader = PdfTabbyReader(config={**get_test_config(), "tabby_service": False})
+        reader.tabby_service = TabbyService(jar_path="ispras_tbl_extr.jar", logger=self.logger)
+        try:
+            with self.assertRaises(TabbyPdfError):
+                reader._PdfTabbyReader__run(path="error.pdf", tmp_dir=self.tmp_dir)
+        finally:
+            reader.tabby_service.stop()
+        self.assertListEqual(["error.pdf"], self.__get_requests())
+
+    def test_without_jdk(self) -> None:
+        service = TabbyService(jar_path="ispras_tbl_extr.jar", logger=self.logger)
+        with patch.dict(os.environ, {"FAKE_JAVA_COMPILER": "false"}):
+            self.assertFalse(service.run(["-i", "ok.pdf"]))
+        self.assertFalse(service.is_enabled)
+        self.assertListEqual([], self.__get_requests())
+
+    def test_fallback_with_broken_jvm(self) -> None:
+        service = TabbyService(jar_path="/nonexistent/ispras_tbl_extr.jar", logger=self.logger, max_failures=2)
+        with patch.dict(os.environ, {"FAKE_JAVA_BROKEN": "true"}):
+            self.assertTrue(service.is_enabled)
+            self.assertFalse(service.run(["-i", "ok.pdf"]))
+            self.assertTrue(service.is_enabled)
+            self.assertFalse(service.run(["-i", "ok.pdf"]))
+            self.assertFalse(service.is_enabled)
+            self.assertFalse(service.run(["-i", "ok.pdf"]))
+        self.assertListEqual([], self.__get_requests())
+
+    def __get_requests(self) -> list:
+        log_path = os.path.join(self.tmp_dir, "requests.log")
+        if not os.path.isfile(log_path):
+            return []
+        with open(log_path) as file:
+            return file.read().split()
+
+
+class TestTabbyServiceJvm(TestCase):
+
+    @unittest.skipIf(shutil.which("java") is None, "java isn't installed")
+    def test_real_jvm(self) -> None:
+        jar_path = os.environ.get("TABBY_JAR", PdfTabbyReader().default_config["JAR_PATH"])
+        path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "data", "pdf_with_text_layer", "example.pdf"))
+
+        service = TabbyService(jar_path=jar_path, logger=logging.getLogger("test_tabby_service"))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            try:
+                if not service.run(["-i", path, "-tmp", f"{tmp_dir}/"]):
+                    self.skipTest("java can't launch source programs")
+                self.assertTrue(os.path.isfile(os.path.join(tmp_dir, "data.json")))
+            finally:
+                service.stop()
@@ -0,0 +1,54 @@
+import os
+import unittest
+from importlib.util import find_spec
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+import pytesseract
+
+from dedoc.readers.pdf_reader.pdf_image_reader.ocr.ocr_line_extractor import OCRLineExtractor
+from dedoc.readers.pdf_reader.pdf_image_reader.ocr.ocr_page.ocr_page import OcrPage
+from dedoc.readers.pdf_reader.pdf_image_reader.ocr.tesseract_pool import TesseractPool
+from tests.test_utils import get_test_config
+
+
+class TestTesseractPool(unittest.TestCase):
+    image_path = os.path.join(os.path.dirname(__file__), "..", "data", "scanned", "example.png")
+    tsv = "1\t1\t0\t0\t0\t0\t0\t0\t200\t100\t-1\t\n" \
+          "2\t1\t1\t0\t0\t0\t10\t10\t100\t20\t-1\t\n" \
+          "3\t1\t1\t1\t0\t0\t10\t10\t100\t20\t-1\t\n" \
+          "4\t1\t1\t1\t1\t0\t10\t10\t100\t20\t-1\t\n" \
+          "5\t1\t1\t1\t1\t1\t10\t10\t45\t20\t96.5\tHello\n" \
+          "5\t1\t1\t1\t1\t2\t60\t10\t50\t20\t91.2\tworld"
+
+    def test_tsv_to_dict(self) -> None:
+        ocr_dict = TesseractPool.tsv_to_dict(self.tsv)
+        self.assertListEqual([1, 2, 3, 4, 5, 5], ocr_dict["level"])
+        self.assertListEqual(["", "", "", "", "Hello", "world"], ocr_dict["text"])
+        self.assertEqual(96, ocr_dict["conf"][4])
+        page = OcrPage.from_dict(ocr_dict, ocr_conf_thr=-1)
+        self.assertListEqual(["Hello world\n"], [line.text for line in page.lines])
+
+    @unittest.skipIf(find_spec("tesserocr") is None, "tesserocr isn't installed")
+    def test_same_result_as_tesseract_process(self) -> None:
+        image = cv2.imread(self.image_path)
+        pool = TesseractPool(max_workers=1)
+
+        for psm in (3, 4, 6):
+            expected = pytesseract.image_to_data(image, lang="rus+eng", output_type=pytesseract.Output.DICT, config=f"--psm {psm}")
+            for _ in range(2):  # the second call reuses the worker
+                result = pool.image_to_data(image, language="rus+eng", psm=psm)
+                self.assertListEqual(expected["text"], result["text"])
+                self.assertListEqual(expected["left"], result["left"])
+                self.assertListEqual(expected["top"], result["top"])
+
+    def test_pool_from_reader_config(self) -> None:
+        pool = MagicMock(image_to_data=MagicMock(return_value=TesseractPool.tsv_to_dict(self.tsv)))
+        config = {**get_test_config(), "tesseract_pool_size": 3}
+
+        with patch("dedoc.readers.pdf_reader.pdf_image_reader.ocr.ocr_utils.get_tesseract_pool", return_value=pool) as get_pool_mock:
+            page = OCRLineExtractor(config=config).split_image2lines(np.full((100, 200, 3), 255, dtype=np.uint8), page_num=0)
+
+        self.assertEqual(3, get_pool_mock.call_args[0][0]["tesseract_pool_size"])
+        self.assertListEqual(["Hello world"], [bbox.text.strip() for bbox in page.bboxes])